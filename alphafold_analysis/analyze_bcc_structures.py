@@ -4,10 +4,11 @@ Extracts mechanical properties, geometry, and information metrics
 """
 
 import argparse
+import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from Bio.PDB import PDBParser, PPBuilder
+from typing import Dict, Iterator, List, NamedTuple, Tuple, Optional
 from Bio.SeqUtils import ProtParam
 import matplotlib.pyplot as plt
 import json
@@ -37,81 +38,134 @@ def calculate_sequence_entropy(sequence: str) -> float:
     
     return entropy
 
-def calculate_backbone_curvature(
+def _segment_bounds(lengths: List[int]) -> np.ndarray:
+    return np.concatenate([[0], np.cumsum(lengths)]).astype(int)
+
+def _window_curvatures(
     coords: np.ndarray,
+    window: int,
+    valid: np.ndarray,
+) -> np.ndarray:
+    """1 / (mean distance to the window centroid) for every window start with valid[i]."""
+    width = 2 * window + 1
+    # (n_windows, width, 3) view; reducing over axis 1 adds residues in the same
+    # order as the per-window loop, so results are bitwise identical.
+    windows = np.lib.stride_tricks.sliding_window_view(coords, width, axis=0)
+    windows = windows.transpose(0, 2, 1)[valid]
+    centroids = np.mean(windows, axis=1)
+    distances = np.linalg.norm(windows - centroids[:, np.newaxis, :], axis=2)
+    mean_dist = np.mean(distances, axis=1)
+    safe = np.where(mean_dist > 1e-6, mean_dist, 1.0)
+    return np.where(mean_dist > 1e-6, 1.0 / safe, 0.0)
+
+def calculate_backbone_curvature_batch(
+    coords_list: List[np.ndarray],
     window: int = 7,
-    mask: Optional[np.ndarray] = None,
-) -> Tuple[np.ndarray, float, float]:
+    masks: Optional[List[Optional[np.ndarray]]] = None,
+) -> List[Tuple[np.ndarray, float, float]]:
     """
-    Calculate local backbone curvature using sliding window
-    Returns: (curvatures array, mean curvature, std curvature)
+    calculate_backbone_curvature for many proteins in one vectorized pass.
+
+    All CA traces are concatenated; windows that straddle two proteins or contain a
+    masked residue are dropped using prefix sums, so the cost is a single
+    sliding-window pass over all residues.
     """
-    if len(coords) < 2 * window + 1:
-        return np.array([]), 0.0, 0.0
-    
-    if mask is None:
-        mask = np.ones(len(coords), dtype=bool)
-    else:
+    width = 2 * window + 1
+    coords_list = [np.asarray(c, dtype=float).reshape(-1, 3) for c in coords_list]
+    if masks is None:
+        masks = [None] * len(coords_list)
+    if len(masks) != len(coords_list):
+        raise ValueError("Need one mask per protein")
+    mask_arrays = []
+    for coords, mask in zip(coords_list, masks):
+        if mask is None:
+            mask_arrays.append(np.ones(len(coords), dtype=bool))
+            continue
         mask = np.asarray(mask, dtype=bool)
         if len(mask) != len(coords):
             raise ValueError("Mask length must match coordinates length")
+        mask_arrays.append(mask)
+
+    bounds = _segment_bounds([len(c) for c in coords_list])
+    if bounds[-1] < width:
+        return [(np.array([]), 0.0, 0.0) for _ in coords_list]
+
+    all_coords = np.concatenate(coords_list)
+    segment = np.repeat(np.arange(len(coords_list)), np.diff(bounds))
+    masked = np.concatenate([[0], np.cumsum(~np.concatenate(mask_arrays))])
+    n_windows = len(all_coords) - width + 1
+    valid = (segment[:n_windows] == segment[width - 1:]) & (
+        masked[width:] - masked[:n_windows] == 0
+    )
+    curvatures = _window_curvatures(all_coords, window, valid)
 
-    curvatures = []
-    
-    for i in range(window, len(coords) - window):
-        if not mask[i - window:i + window + 1].all():
+    # Windows of protein k start in [bounds[k], bounds[k+1] - width]
+    starts = np.flatnonzero(valid)
+    splits = np.searchsorted(starts, bounds)
+    results = []
+    for k, coords in enumerate(coords_list):
+        if len(coords) < width:
+            results.append((np.array([]), 0.0, 0.0))
             continue
-        # Get window of coordinates
-        window_coords = coords[i-window:i+window+1]
-        
-        # Calculate curvature as inverse of radius of fitted circle
-        # Simplified: use variance of distances from centroid
-        centroid = np.mean(window_coords, axis=0)
-        distances = np.linalg.norm(window_coords - centroid, axis=1)
-        mean_dist = np.mean(distances)
-        
-        if mean_dist > 1e-6:
-            curvature = 1.0 / mean_dist
+        curv = curvatures[splits[k]:splits[k + 1]]
+        if len(curv) == 0:
+            results.append((curv, 0.0, 0.0))
         else:
-            curvature = 0.0
-        
-        curvatures.append(curvature)
-    
-    curvatures = np.array(curvatures)
-    if len(curvatures) == 0:
-        return curvatures, 0.0, 0.0
-    return curvatures, np.mean(curvatures), np.std(curvatures)
+            results.append((curv, np.mean(curv), np.std(curv)))
+    return results
 
-def calculate_flexibility(coords: np.ndarray) -> Dict[str, float]:
+def calculate_backbone_curvature(
+    coords: np.ndarray,
+    window: int = 7,
+    mask: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, float, float]:
     """
-    Calculate protein flexibility metrics
-    Returns: dict with flexibility measures
+    Calculate local backbone curvature using sliding window
+    Returns: (curvatures array, mean curvature, std curvature)
     """
-    if len(coords) < 3:
-        return {"mean_bend": 0.0, "max_bend": 0.0, "flexibility_index": 0.0}
-    
-    # Calculate angles between consecutive segments
-    vectors = np.diff(coords, axis=0)
-    norms = np.linalg.norm(vectors, axis=1)
-    norms[norms == 0] = 1e-6  # Avoid division by zero
-    
-    normalized_vectors = vectors / norms[:, np.newaxis]
-    
-    # Calculate bend angles
-    bend_angles = []
-    for i in range(len(normalized_vectors) - 1):
-        dot_product = np.clip(np.dot(normalized_vectors[i], normalized_vectors[i+1]), -1, 1)
-        angle = np.arccos(dot_product)
-        bend_angles.append(angle)
-    
-    bend_angles = np.array(bend_angles)
-    
+    return calculate_backbone_curvature_batch([coords], window, [mask])[0]
+
+def _flexibility_from_angles(bend_angles: np.ndarray) -> Dict[str, float]:
     return {
         "mean_bend": np.mean(bend_angles),
         "max_bend": np.max(bend_angles) if len(bend_angles) > 0 else 0.0,
         "flexibility_index": np.std(bend_angles) / (np.mean(bend_angles) + 1e-6),
     }
 
+def calculate_flexibility_batch(coords_list: List[np.ndarray]) -> List[Dict[str, float]]:
+    """calculate_flexibility for many proteins; bend angles of all of them in one pass."""
+    coords_list = [np.asarray(c, dtype=float).reshape(-1, 3) for c in coords_list]
+    empty = {"mean_bend": 0.0, "max_bend": 0.0, "flexibility_index": 0.0}
+    bounds = _segment_bounds([len(c) for c in coords_list])
+    if bounds[-1] < 3:
+        return [dict(empty) for _ in coords_list]
+
+    # Angles between consecutive segments; pairs spanning two proteins are dropped below
+    all_coords = np.concatenate(coords_list)
+    vectors = np.diff(all_coords, axis=0)
+    norms = np.linalg.norm(vectors, axis=1)
+    norms[norms == 0] = 1e-6  # Avoid division by zero
+    normalized_vectors = vectors / norms[:, np.newaxis]
+    # Stacked matmul takes the same dot-product path as np.dot on each pair
+    dots = (normalized_vectors[:-1, np.newaxis, :] @ normalized_vectors[1:, :, np.newaxis])[:, 0, 0]
+    bend_angles = np.arccos(np.clip(dots, -1, 1))
+
+    results = []
+    for k, coords in enumerate(coords_list):
+        if len(coords) < 3:
+            results.append(dict(empty))
+            continue
+        # Angle j uses residues j..j+2
+        results.append(_flexibility_from_angles(bend_angles[bounds[k]:bounds[k + 1] - 2]))
+    return results
+
+def calculate_flexibility(coords: np.ndarray) -> Dict[str, float]:
+    """
+    Calculate protein flexibility metrics
+    Returns: dict with flexibility measures
+    """
+    return calculate_flexibility_batch([coords])[0]
+
 def calculate_compactness(coords: np.ndarray) -> Dict[str, float]:
     """
     Calculate protein compactness metrics
@@ -219,18 +273,61 @@ def partial_corr(x: np.ndarray, y: np.ndarray, covariates: np.ndarray) -> Tuple[
     y_res = residualize(y, covariates)
     return safe_pearsonr(x_res, y_res)
 
-def extract_ca_coords_and_plddt(structure) -> Tuple[np.ndarray, np.ndarray]:
-    """Extract CA coordinates and pLDDT values (from B-factor)."""
-    ca_coords = []
-    plddt_values = []
-    for model in structure:
-        for chain in model:
-            for residue in chain:
-                if 'CA' in residue:
-                    atom = residue['CA']
-                    ca_coords.append(atom.get_coord())
-                    plddt_values.append(atom.get_bfactor())
-    return np.array(ca_coords), np.array(plddt_values)
+THREE_TO_ONE = {
+    "ALA": "A", "ARG": "R", "ASN": "N", "ASP": "D", "CYS": "C",
+    "GLN": "Q", "GLU": "E", "GLY": "G", "HIS": "H", "ILE": "I",
+    "LEU": "L", "LYS": "K", "MET": "M", "PHE": "F", "PRO": "P",
+    "SER": "S", "THR": "T", "TRP": "W", "TYR": "Y", "VAL": "V",
+}
+
+class CATrace(NamedTuple):
+    """CA-only view of a structure: what the analysis actually uses."""
+    sequence: str
+    ca_coords: np.ndarray  # (n_residues, 3)
+    plddt: np.ndarray      # (n_residues,), AlphaFold stores pLDDT in the B-factor column
+
+def read_ca_trace(pdb_file: Path) -> Tuple[Optional[CATrace], Optional[str]]:
+    """
+    Read CA coordinates, pLDDT and sequence from fixed PDB columns in one pass.
+
+    Only the first model is read, and the first CA of each residue is kept (alternate
+    locations are dropped). The sequence covers residues with a standard amino-acid CA,
+    like Biopython's PPBuilder on AlphaFold models. Returns (trace, None), or
+    (None, reason) if the file is an error page or has no atom records.
+    """
+    with open(pdb_file, 'rb') as f:
+        data = f.read()
+    if data.startswith(b'<?xml') or data.startswith(b'<Error'):
+        return None, "is an error response, not a valid PDB"
+    if len(data) < 100:  # Very small files are likely errors
+        return None, "is too small, likely invalid"
+
+    ca_lines = []
+    seen = set()
+    has_atom = False
+    for line in data.decode('ascii', errors='replace').splitlines():
+        record = line[:6]
+        if record == 'ATOM  ' or record == 'HETATM':
+            has_atom = True
+            if line[12:16] != ' CA ':
+                continue
+            residue_id = line[21:27]  # chain, resSeq, iCode
+            if residue_id in seen:
+                continue
+            seen.add(residue_id)
+            ca_lines.append(line)
+        elif record == 'ENDMDL':
+            break
+    if not has_atom:
+        return None, "missing ATOM/HETATM records, likely invalid"
+
+    values = np.array(
+        [(l[30:38], l[38:46], l[46:54], l[60:66].strip() or 0.0) for l in ca_lines], dtype=float
+    ).reshape(-1, 4)
+    sequence = "".join(
+        THREE_TO_ONE.get(l[17:20], "") for l in ca_lines if l[:6] == 'ATOM  '
+    )
+    return CATrace(sequence, values[:, :3], values[:, 3]), None
 
 def make_json_safe(value):
     """Recursively convert numpy types to built-in Python types for JSON."""
@@ -244,49 +341,24 @@ def make_json_safe(value):
         return [make_json_safe(v) for v in value]
     return value
 
-def analyze_structure(pdb_file: Path, plddt_threshold: float = 70.0) -> Optional[Dict]:
+def analyze_structure(
+    pdb_file: Path,
+    plddt_threshold: float = 70.0,
+    include_coords: bool = False,
+) -> Optional[Dict]:
     """Comprehensive analysis of a single protein structure"""
     try:
-        # Check if file is valid PDB (not an error response)
-        with open(pdb_file, 'r') as f:
-            first_line = f.readline()
-            if first_line.startswith('<?xml') or first_line.startswith('<Error'):
-                print(f"   ⚠️  {pdb_file.name} is an error response, not a valid PDB")
-                return None
-            # Check file size (too small likely invalid)
-            f.seek(0)
-            content = f.read(1000)
-            if len(content) < 100:  # Very small files are likely errors
-                print(f"   ⚠️  {pdb_file.name} is too small, likely invalid")
-                return None
-            # Scan for ATOM/HETATM records to validate PDB content
-            f.seek(0)
-            has_atom = False
-            while True:
-                chunk = f.read(65536)
-                if not chunk:
-                    break
-                if "ATOM" in chunk or "HETATM" in chunk:
-                    has_atom = True
-                    break
-            if not has_atom:
-                print(f"   ⚠️  {pdb_file.name} missing ATOM/HETATM records, likely invalid")
-                return None
-        
-        parser = PDBParser(QUIET=True)
-        structure = parser.get_structure('protein', pdb_file)
-        
-        # Extract sequence
-        ppb = PPBuilder()
-        sequence = ""
-        for pp in ppb.build_peptides(structure):
-            sequence += str(pp.get_sequence())
-        
+        trace, problem = read_ca_trace(pdb_file)
+        if trace is None:
+            print(f"   ⚠️  {pdb_file.name} {problem}")
+            return None
+
+        sequence = trace.sequence
         if len(sequence) == 0:
             return None
-        
-        # Extract CA coordinates (backbone) and pLDDT values
-        ca_coords, plddt_values = extract_ca_coords_and_plddt(structure)
+
+        # CA coordinates (backbone) and pLDDT values
+        ca_coords, plddt_values = trace.ca_coords, trace.plddt
 
         if len(ca_coords) < 10:
             return None
@@ -305,7 +377,7 @@ def analyze_structure(pdb_file: Path, plddt_threshold: float = 70.0) -> Optional
         compactness = calculate_compactness(ca_coords)
         mechanical = calculate_mechanical_properties(sequence, ca_coords)
         
-        return {
+        result = {
             "name": pdb_file.stem,
             "sequence": sequence,
             "length": len(sequence),
@@ -322,12 +394,65 @@ def analyze_structure(pdb_file: Path, plddt_threshold: float = 70.0) -> Optional
             **flexibility,
             **compactness,
             **mechanical,
-            "ca_coords": ca_coords.tolist(),  # For visualization
         }
+        if include_coords:
+            result["ca_coords"] = ca_coords.tolist()  # For visualization
+        return result
     except Exception as e:
         print(f"   ⚠️  Error analyzing {pdb_file.name}: {e}")
         return None
 
+def _analyze_chunk(
+    pdb_files: List[Path],
+    plddt_threshold: float,
+    include_coords: bool,
+) -> List[Tuple[Path, Optional[Dict]]]:
+    return [(p, analyze_structure(p, plddt_threshold, include_coords)) for p in pdb_files]
+
+def analyze_structures(
+    pdb_files: List[Path],
+    plddt_threshold: float = 70.0,
+    include_coords: bool = False,
+    n_workers: Optional[int] = 1,
+    chunk_size: int = 16,
+) -> Iterator[Tuple[Path, Optional[Dict]]]:
+    """
+    Analyze structures over a process pool, yielding (pdb_file, result) as chunks finish.
+
+    Files are sent to workers in chunks of chunk_size to amortize task overhead;
+    n_workers=1 runs in-process and None uses all cores. Completion order is not
+    input order.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    chunks = [pdb_files[i:i + chunk_size] for i in range(0, len(pdb_files), chunk_size)]
+    if n_workers == 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk, plddt_threshold, include_coords)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [
+            pool.submit(_analyze_chunk, chunk, plddt_threshold, include_coords)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+
+def load_jsonl_results(path: Path) -> Dict[str, Dict]:
+    """Results already streamed to a JSONL file, keyed by name (a truncated last line is ignored)."""
+    done = {}
+    if not path.exists():
+        return done
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(row, dict) and "name" in row:
+                done[row["name"]] = row
+    return done
+
 def generate_comprehensive_report(
     results: List[Dict],
     output_file: Path,
@@ -561,18 +686,46 @@ def main():
         default="alphafold_analysis/bcc_analysis_data.json",
         help="Output JSON data file"
     )
+    parser.add_argument(
+        "--jsonl-output",
+        default="alphafold_analysis/bcc_analysis_data.jsonl",
+        help="Streaming JSON-lines file, one structure per line as it finishes"
+    )
     parser.add_argument(
         "--plddt-threshold",
         type=float,
         default=70.0,
         help="Minimum pLDDT threshold for filtered curvature metrics"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (0 = all cores)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=16,
+        help="Structures per worker task"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip structures already in the JSONL output"
+    )
+    parser.add_argument(
+        "--include-coords",
+        action="store_true",
+        help="Keep full CA coordinates in the outputs (large for proteome-scale runs)"
+    )
     
     args = parser.parse_args()
     
     pdb_dir = Path(args.pdb_dir)
     output_file = Path(args.output)
     json_output = Path(args.json_output)
+    jsonl_output = Path(args.jsonl_output)
     
     print("🔬 Comprehensive AlphaFold Structure Analysis for BCC Research")
     print("=" * 70)
@@ -582,22 +735,45 @@ def main():
         print(f"💡 Run: python alphafold_analysis/fetch_bcc_structures.py")
         return
     
-    pdb_files = list(pdb_dir.glob("*.pdb"))
+    pdb_files = sorted(pdb_dir.glob("*.pdb"))
     if not pdb_files:
         print(f"❌ No PDB files found in {pdb_dir}")
         return
     
     print(f"📊 Found {len(pdb_files)} PDB files\n")
-    
-    results = []
-    for pdb_file in pdb_files:
-        print(f"Analyzing {pdb_file.name}...", end=" ")
-        result = analyze_structure(pdb_file, plddt_threshold=args.plddt_threshold)
-        if result:
-            results.append(result)
-            print(f"✅ (L={result['length']}, H={result['seq_entropy']:.2f}, κ={result['mean_curvature']:.4f})")
-        else:
-            print("❌")
+
+    done = load_jsonl_results(jsonl_output) if args.resume else {}
+    todo = [p for p in pdb_files if p.stem not in done]
+    if done:
+        print(f"   Resuming: {len(pdb_files) - len(todo)}/{len(pdb_files)} structures already done\n")
+
+    jsonl_output.parent.mkdir(parents=True, exist_ok=True)
+    # Terminate a partially written last line so new rows start on a fresh one.
+    if args.resume and jsonl_output.exists() and jsonl_output.stat().st_size > 0:
+        with open(jsonl_output, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b"\n"
+    else:
+        needs_newline = False
+    with open(jsonl_output, 'a' if args.resume else 'w') as stream:
+        if needs_newline:
+            stream.write("\n")
+        for pdb_file, result in analyze_structures(
+            todo,
+            plddt_threshold=args.plddt_threshold,
+            include_coords=args.include_coords,
+            n_workers=args.workers or None,
+            chunk_size=args.chunk_size,
+        ):
+            if result:
+                stream.write(json.dumps(make_json_safe(result)) + "\n")
+                stream.flush()
+                done[result["name"]] = result
+                print(f"{pdb_file.name}: ✅ (L={result['length']}, H={result['seq_entropy']:.2f}, κ={result['mean_curvature']:.4f})")
+            else:
+                print(f"{pdb_file.name}: ❌")
+
+    results = [done[p.stem] for p in pdb_files if p.stem in done]
     
     if results:
         print(f"\n📝 Generating report...")
@@ -613,7 +789,7 @@ def main():
         json_output.parent.mkdir(parents=True, exist_ok=True)
         with open(json_output, 'w') as f:
             json.dump(make_json_safe(results), f, indent=2)
-        print(f"✅ Data saved: {json_output}")
+        print(f"✅ Data saved: {json_output} (streamed to {jsonl_output})")
         
         print(f"\n📊 Generating plots...")
         plot_correlations(results, pdb_dir.parent / 'figures', plddt_threshold=args.plddt_threshold)
@@ -1,14 +1,32 @@
 """
 Fetch AlphaFold Structures for BCC Research
 Downloads protein structures from AlphaFold Database API
+
+Requests run on a small thread pool sharing keep-alive connections and a global rate
+limit, with retries and exponential backoff. PDBs are downloaded to a .part file that
+is resumed with an HTTP Range request after an interruption; the SHA-256 of every
+finished file is stored in its metadata and checked before a cached file is reused.
+
+With --mirror-dir, structures are taken from a local AlphaFold release instead
+(a directory or tarball of AF-<UniProt>-F1-model_v<N>.pdb[.gz] files), so the
+fetcher also works on offline clusters.
 """
 
-import urllib.request
+import gzip
+import hashlib
+import http.client
 import json
 import os
+import random
+import re
 import sys
+import tarfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 import time
 
 # Import protein database
@@ -18,13 +36,268 @@ ALPHAFOLD_API_BASE = "https://alphafold.ebi.ac.uk/api/prediction"
 OUTPUT_DIR = Path("alphafold_analysis/predictions")
 METADATA_DIR = Path("alphafold_analysis/metadata")
 
-def fetch_alphafold_metadata(uniprot_id: str) -> Optional[Dict]:
+USER_AGENT = "bcc-alphafold-fetch/1.0"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 1 << 16
+
+class FetchError(Exception):
+    """Failed request; retryable errors are retried with backoff."""
+    def __init__(self, message: str, retryable: bool = False, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+class RateLimiter:
+    """Spaces request starts at least 1/rate seconds apart across all threads."""
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+class HTTPFetcher:
+    """
+    Keep-alive HTTP(S) client for worker threads.
+
+    Each thread holds one persistent connection per host, so consecutive API calls
+    and downloads reuse the TLS session instead of reconnecting per request.
+    """
+    def __init__(self, rate: float = 4.0, retries: int = 4, backoff: float = 1.0, timeout: float = 60.0):
+        self.limiter = RateLimiter(rate)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        key = (scheme, netloc)
+        if key not in conns:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conns[key] = cls(netloc, timeout=self.timeout)
+        return conns[key]
+
+    def _drop(self, url: str):
+        parts = urlsplit(url)
+        conn = getattr(self._local, "conns", {}).pop((parts.scheme, parts.netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def _request(self, url: str, headers: Optional[Dict[str, str]] = None) -> http.client.HTTPResponse:
+        """GET url, following up to MAX_REDIRECTS redirects (each host keeps its own connection)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path + (f"?{parts.query}" if parts.query else "")
+            self.limiter.wait()
+            # Remembered so a failure after a redirect also drops the target host's connection.
+            self._local.last_url = url
+            conn = self._connection(parts.scheme, parts.netloc)
+            conn.request("GET", path or "/", headers={"User-Agent": USER_AGENT, **(headers or {})})
+            response = conn.getresponse()
+            if response.status in REDIRECT_STATUSES:
+                location = response.getheader("Location")
+                response.read()
+                if not location:
+                    raise FetchError(f"HTTP {response.status} without a Location header")
+                url = urljoin(url, location)
+                continue
+            if response.status in RETRY_STATUSES:
+                response.read()
+                retry_after = response.getheader("Retry-After")
+                raise FetchError(
+                    f"HTTP {response.status}",
+                    retryable=True,
+                    retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+                )
+            return response
+        raise FetchError(f"more than {MAX_REDIRECTS} redirects")
+
+    def _retry(self, url: str, action: Callable[[], object]):
+        """Run action(), retrying connection errors and retryable statuses with backoff."""
+        for attempt in range(self.retries + 1):
+            try:
+                return action()
+            except (OSError, http.client.HTTPException, FetchError) as e:
+                # The connection state is unknown after a failure; reconnect next time.
+                self._drop(url)
+                last_url = getattr(self._local, "last_url", url)
+                if last_url != url:
+                    self._drop(last_url)
+                retryable = not isinstance(e, FetchError) or e.retryable
+                if not retryable or attempt == self.retries:
+                    raise
+                delay = self.backoff * 2**attempt * (1.0 + 0.25 * random.random())
+                if isinstance(e, FetchError) and e.retry_after is not None:
+                    delay = max(delay, e.retry_after)
+                time.sleep(delay)
+
+    def get_json(self, url: str) -> Optional[object]:
+        """Decoded JSON body, or None on 404."""
+        def action():
+            response = self._request(url)
+            body = response.read()
+            if response.status == 404:
+                return None
+            if response.status != 200:
+                raise FetchError(f"HTTP {response.status}")
+            return json.loads(body.decode())
+        return self._retry(url, action)
+
+    def download(self, url: str, output_path: Path) -> Tuple[str, int]:
+        """
+        Download url to output_path via a resumable .part file.
+
+        A partial file left by an interrupted attempt (or run) is continued with a Range
+        request; If-Range makes the server send the whole file again if it changed in
+        the meantime. Returns (sha256, size) of the finished file.
+        """
+        part = output_path.with_name(output_path.name + ".part")
+        state_path = output_path.with_name(output_path.name + ".part.json")
+
+        def action():
+            state = {}
+            if part.exists() and state_path.exists():
+                state = json.loads(state_path.read_text())
+            if state.get("url") != url:
+                part.unlink(missing_ok=True)
+                state = {"url": url}
+            offset = part.stat().st_size if part.exists() else 0
+
+            headers = {}
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                if state.get("validator"):
+                    headers["If-Range"] = state["validator"]
+            response = self._request(url, headers)
+
+            if response.status == 416:  # Nothing left to fetch (or a stale part file)
+                response.read()
+                total = _content_range_total(response.getheader("Content-Range"))
+                if total != offset:
+                    part.unlink(missing_ok=True)
+                    raise FetchError("stale partial download", retryable=True)
+            elif response.status in (200, 206):
+                if response.status == 206:
+                    mode, total = "ab", _content_range_total(response.getheader("Content-Range"))
+                else:
+                    length = response.getheader("Content-Length")
+                    mode, total = "wb", int(length) if length else None
+                validator = response.getheader("ETag") or response.getheader("Last-Modified")
+                state_path.write_text(json.dumps({"url": url, "validator": validator}))
+                with open(part, mode) as f:
+                    while True:
+                        chunk = response.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                if total is not None and part.stat().st_size != total:
+                    raise FetchError("truncated download", retryable=True)
+            else:
+                response.read()
+                raise FetchError(f"HTTP {response.status}")
+
+        self._retry(url, action)
+        if not looks_like_pdb(part):
+            part.unlink(missing_ok=True)
+            state_path.unlink(missing_ok=True)
+            raise FetchError("response is not a PDB file")
+        digest, size = file_sha256(part), part.stat().st_size
+        os.replace(part, output_path)
+        state_path.unlink(missing_ok=True)
+        return digest, size
+
+def _content_range_total(value: Optional[str]) -> Optional[int]:
+    # "bytes 100-199/2000" or "bytes */2000"
+    if value and "/" in value:
+        total = value.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    return None
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def looks_like_pdb(path: Path) -> bool:
+    """Reject error pages and truncated stubs (same checks as fix_invalid_pdbs)."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(65536)
+    except OSError:
+        return False
+    if len(head) < 100 or head.lstrip().startswith((b"<?xml", b"<Error", b"<html", b"<!DOCTYPE")):
+        return False
+    return b"ATOM" in head or b"HETATM" in head
+
+class AlphaFoldMirror:
+    """
+    Local AlphaFold release: a directory tree or tarball of model files.
+
+    Files are matched by the AlphaFold naming scheme AF-<UniProt>-F1-model_v<N>.pdb,
+    optionally gzipped (as in the proteome tarballs); the highest model version wins.
+    """
+    PATTERN = re.compile(r"AF-([A-Za-z0-9]+)-F1-model_v(\d+)\.pdb(\.gz)?$")
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._tar = None
+        if self.root.is_dir():
+            names = (str(p.relative_to(self.root)) for p in self.root.rglob("AF-*"))
+        elif tarfile.is_tarfile(self.root):
+            self._tar = tarfile.open(self.root, "r:*")
+            names = (m.name for m in self._tar.getmembers() if m.isfile())
+        else:
+            raise ValueError(f"Mirror must be a directory or tar archive: {self.root}")
+
+        self.index: Dict[str, Tuple[int, str]] = {}
+        for name in names:
+            match = self.PATTERN.search(name)
+            if match:
+                uniprot, version = match.group(1).upper(), int(match.group(2))
+                if version > self.index.get(uniprot, (-1, ""))[0]:
+                    self.index[uniprot] = (version, name)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def lookup(self, uniprot_id: str) -> Optional[Tuple[int, str]]:
+        return self.index.get(uniprot_id.upper())
+
+    def read(self, uniprot_id: str) -> Optional[bytes]:
+        entry = self.lookup(uniprot_id)
+        return None if entry is None else self.read_entry(entry[1])
+
+    def read_entry(self, name: str) -> bytes:
+        """Decompressed contents of an index entry (the name from lookup())."""
+        if self._tar is None:
+            data = (self.root / name).read_bytes()
+        else:
+            # TarFile is not thread-safe; members are small, so serialize extraction.
+            with self._lock:
+                data = self._tar.extractfile(name).read()
+        return gzip.decompress(data) if name.endswith(".gz") else data
+
+def fetch_alphafold_metadata(uniprot_id: str, fetcher: Optional[HTTPFetcher] = None) -> Optional[Dict]:
     """Fetch metadata for a protein from AlphaFold API"""
     api_url = f"{ALPHAFOLD_API_BASE}/{uniprot_id}"
     
     try:
-        with urllib.request.urlopen(api_url, timeout=30) as response:
-            data = json.loads(response.read().decode())
+        data = (fetcher or HTTPFetcher()).get_json(api_url)
             
         if not data or len(data) == 0:
             return None
@@ -42,22 +315,43 @@ def fetch_alphafold_metadata(uniprot_id: str) -> Optional[Dict]:
             "uniprot_id_api": entry.get("uniprotId"),
         }
     except Exception as e:
-        print(f"   ⚠️  API error: {e}")
+        print(f"   ⚠️  API error for {uniprot_id}: {e}")
         return None
 
-def download_pdb(pdb_url: str, output_path: Path) -> bool:
-    """Download PDB file from URL"""
+def download_pdb(pdb_url: str, output_path: Path, fetcher: Optional[HTTPFetcher] = None) -> Optional[Tuple[str, int]]:
+    """Download PDB file from URL; returns (sha256, size) or None on failure"""
     try:
-        with urllib.request.urlopen(pdb_url, timeout=60) as response, \
-             open(output_path, 'wb') as f:
-            f.write(response.read())
-        return True
+        return (fetcher or HTTPFetcher()).download(pdb_url, output_path)
     except Exception as e:
-        print(f"   ⚠️  Download error: {e}")
+        print(f"   ⚠️  Download error for {output_path.name}: {e}")
+        return None
+
+def _verified_cache(output_path: Path, metadata_path: Path) -> bool:
+    """True if output_path is a complete PDB matching the checksum in its metadata."""
+    if not output_path.exists() or not metadata_path.exists():
         return False
+    try:
+        metadata = json.loads(metadata_path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return False
+    expected = metadata.get("pdb_sha256")
+    if expected is None:
+        # Downloaded before checksums were recorded: accept a valid file and backfill.
+        if not looks_like_pdb(output_path):
+            return False
+        metadata["pdb_sha256"] = file_sha256(output_path)
+        metadata["pdb_size"] = output_path.stat().st_size
+        metadata_path.write_text(json.dumps(metadata, indent=2))
+        return True
+    return file_sha256(output_path) == expected
 
-def fetch_protein_structure(protein: Dict, force_refresh: bool = False) -> Dict:
-    """Fetch structure for a single protein"""
+def fetch_protein_structure(
+    protein: Dict,
+    force_refresh: bool = False,
+    fetcher: Optional[HTTPFetcher] = None,
+    mirror: Optional[AlphaFoldMirror] = None,
+) -> Dict:
+    """Fetch structure for a single protein (from the mirror if one is given)"""
     name = protein["name"]
     uniprot_id = protein["uniprot"]
     category = protein["category"]
@@ -76,43 +370,69 @@ def fetch_protein_structure(protein: Dict, force_refresh: bool = False) -> Dict:
         "metadata_path": str(metadata_path) if metadata_path.exists() else None,
     }
     
-    # Check if already downloaded
-    if output_path.exists() and not force_refresh:
-        print(f"   ✅ Already exists: {output_path.name}")
+    # Check if already downloaded (and intact)
+    if not force_refresh and _verified_cache(output_path, metadata_path):
         result["status"] = "cached"
         return result
     
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    if mirror is not None:
+        entry = mirror.lookup(uniprot_id)
+        if entry is None:
+            result["status"] = "not_found"
+            return result
+        try:
+            data = mirror.read_entry(entry[1])
+        except (OSError, EOFError, gzip.BadGzipFile, zlib.error, tarfile.TarError) as e:
+            print(f"   ⚠️  Mirror read failed for {uniprot_id}: {e}")
+            result["status"] = "download_failed"
+            return result
+        tmp = output_path.with_name(output_path.name + ".part")
+        tmp.write_bytes(data)
+        if not looks_like_pdb(tmp):
+            tmp.unlink()
+            result["status"] = "download_failed"
+            return result
+        os.replace(tmp, output_path)
+        metadata = {
+            "uniprot_id": uniprot_id,
+            "pdb_url": None,
+            "mirror_path": f"{mirror.root}::{entry[1]}",
+            "model_version": entry[0],
+            "pdb_sha256": hashlib.sha256(data).hexdigest(),
+            "pdb_size": len(data),
+        }
+        with open(metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        result.update(status="mirrored", pdb_path=str(output_path), metadata_path=str(metadata_path))
+        return result
+
     # Fetch metadata
-    print(f"   📡 Fetching metadata...", end=" ")
-    metadata = fetch_alphafold_metadata(uniprot_id)
+    metadata = fetch_alphafold_metadata(uniprot_id, fetcher)
     
     if not metadata:
-        print("❌ Not found in AlphaFold DB")
         result["status"] = "not_found"
         return result
     
     if not metadata.get("pdb_url"):
-        print("❌ No PDB URL")
         result["status"] = "no_pdb"
         return result
     
-    # Save metadata
-    METADATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(metadata_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
-    
-    # Download PDB
-    print(f"📥 Downloading PDB...", end=" ")
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
-    if download_pdb(metadata["pdb_url"], output_path):
-        print("✅")
+    # Download PDB (resumes a .part file left by an interrupted run)
+    downloaded = download_pdb(metadata["pdb_url"], output_path, fetcher)
+    if downloaded:
+        metadata["pdb_sha256"], metadata["pdb_size"] = downloaded
         result["status"] = "downloaded"
         result["pdb_path"] = str(output_path)
         result["metadata_path"] = str(metadata_path)
     else:
-        print("❌")
         result["status"] = "download_failed"
+
+    # Save metadata (with the checksum used to verify the cached file next time)
+    with open(metadata_path, 'w') as f:
+        json.dump(metadata, f, indent=2)
     
     return result
 
@@ -144,6 +464,30 @@ def main():
         nargs="+",
         help="Priority proteins to fetch first (by name)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent fetches"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=4.0,
+        help="Maximum requests per second across all workers (be nice to the API)"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=4,
+        help="Retries per request, with exponential backoff"
+    )
+    parser.add_argument(
+        "--mirror-dir",
+        type=Path,
+        default=None,
+        help="Local AlphaFold release (directory or tarball) to resolve UniProt IDs offline"
+    )
     
     args = parser.parse_args()
     
@@ -172,17 +516,26 @@ def main():
     print(f"📊 Category: {args.category}")
     print(f"📦 Proteins to fetch: {len(proteins)}")
     print(f"📁 Output directory: {OUTPUT_DIR}")
+
+    mirror = None
+    if args.mirror_dir is not None:
+        mirror = AlphaFoldMirror(args.mirror_dir)
+        print(f"💾 Mirror: {args.mirror_dir} ({len(mirror)} models)")
     print()
     
-    results = []
-    for i, protein in enumerate(proteins, 1):
-        print(f"[{i}/{len(proteins)}] {protein['name']} ({protein['gene']})")
-        result = fetch_protein_structure(protein, force_refresh=args.force)
-        results.append(result)
-        
-        # Rate limiting
-        if i < len(proteins):
-            time.sleep(0.5)  # Be nice to the API
+    fetcher = HTTPFetcher(rate=args.rate, retries=args.retries)
+    icons = {"downloaded": "✅", "mirrored": "✅", "cached": "✅"}
+    results = [None] * len(proteins)
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {
+            pool.submit(fetch_protein_structure, protein, args.force, fetcher, mirror): i
+            for i, protein in enumerate(proteins)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            result = results[i] = future.result()
+            icon = icons.get(result["status"], "❌")
+            print(f"[{done}/{len(proteins)}] {icon} {result['name']} ({result['gene']}): {result['status']}")
     
     # Summary
     print("\n" + "=" * 70)
@@ -197,7 +550,7 @@ def main():
     for status, count in sorted(status_counts.items()):
         print(f"   {status}: {count}")
     
-    successful = sum(1 for r in results if r["status"] == "downloaded" or r["status"] == "cached")
+    successful = sum(1 for r in results if r["status"] in ("downloaded", "mirrored", "cached"))
     print(f"\n✅ Successfully fetched/cached: {successful}/{len(proteins)}")
     
     # Save results summary
@@ -207,6 +560,7 @@ def main():
         json.dump({
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "category": args.category,
+            "source": str(args.mirror_dir) if mirror is not None else ALPHAFOLD_API_BASE,
             "total": len(proteins),
             "results": results
         }, f, indent=2)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zipfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from . import _iec_beam
+from ._config import BCCConfig
+
+# Bump when run_single changes its outputs without a source change in _iec_beam.py
+# (e.g. a new dependency version); the module source is part of the key as well.
+SOLVER_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 2**20
+# Eviction trims to this fraction of max_bytes, so the directory scan behind it
+# runs once per batch of writes rather than on every write at the cap.
+_LOW_WATER = 0.9
+_ROW_KEY = "__row__"
+
+
+def _solver_fingerprint() -> str:
+    source = Path(_iec_beam.__file__).read_bytes()
+    return f"{SOLVER_VERSION}:{hashlib.sha256(source).hexdigest()}"
+
+
+def config_key(cfg: BCCConfig, gravity: float | None = None, chi_kappa: float | None = None) -> str:
+    """
+    Content hash of everything run_single depends on.
+
+    Only the physics sections of the config enter the key (io, sweeps and figures do
+    not change a single run), and overrides are resolved against the config first, so
+    ``--gravity 1.0`` and the YAML default of 1.0 share one entry.
+    """
+    cfg_dict = asdict(cfg)
+    payload = {
+        "physics": {k: cfg_dict[k] for k in ("simulation", "material", "iec")},
+        "gravity": float(cfg.simulation.gravity if gravity is None else gravity),
+        "chi_kappa": float(cfg.iec.chi_kappa if chi_kappa is None else chi_kappa),
+        "solver": _solver_fingerprint(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of run_single results, one compressed .npz per key.
+
+    Fields are stored as arrays and the metrics row as JSON (floats round-trip
+    exactly). Hits refresh the file mtime; once the cache exceeds ``max_bytes`` the
+    least recently used entries are removed. Writes go through a temporary file and
+    an atomic rename, so concurrent sweep workers can share one directory.
+
+    The total size is scanned once and then tracked from this instance's own writes;
+    entries written by other processes are picked up at the next eviction scan.
+    """
+
+    def __init__(self, root: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self._size: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.npz"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            with np.load(path) as npz:
+                row = json.loads(str(npz[_ROW_KEY]))
+                fields = {k: npz[k] for k in npz.files if k != _ROW_KEY}
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return {"row": row, "fields": fields}
+
+    def put(self, key: str, result: dict[str, Any]) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez_compressed(tmp, **{_ROW_KEY: np.array(json.dumps(result["row"]))}, **result["fields"])
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp, path)
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += path.stat().st_size - replaced
+        if self._size > self.max_bytes:
+            self.evict(int(_LOW_WATER * self.max_bytes))
+        return path
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        out = []
+        for path in self.root.glob("*/*.npz"):
+            if path.name.endswith(".tmp.npz"):
+                continue
+            try:
+                out.append((path, path.stat()))
+            except OSError:
+                continue
+        return out
+
+    def size(self) -> int:
+        return sum(st.st_size for _, st in self.entries())
+
+    def evict(self, target: int | None = None) -> int:
+        """Drop least recently used entries until the cache fits in ``target`` (default max_bytes)."""
+        target = self.max_bytes if target is None else target
+        entries = sorted(self.entries(), key=lambda e: e[1].st_mtime)
+        total = sum(st.st_size for _, st in entries)
+        removed = 0
+        for path, st in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            removed += 1
+        self._size = total
+        return removed
+
+
+def default_cache(cfg: BCCConfig) -> ResultCache:
+    """Cache under results/.cache, keeping generated files inside results/."""
+    return ResultCache(cfg.io.results_dir / ".cache")
+
+
+def cached_run_single(
+    cfg: BCCConfig,
+    gravity: float | None = None,
+    chi_kappa: float | None = None,
+    *,
+    cache: ResultCache | None = None,
+) -> dict[str, Any]:
+    """run_single with a lookup in ``cache`` first; ``cache=None`` always recomputes."""
+    if cache is None:
+        return _iec_beam.run_single(cfg, gravity=gravity, chi_kappa=chi_kappa)
+
+    key = config_key(cfg, gravity=gravity, chi_kappa=chi_kappa)
+    hit = cache.get(key)
+    if hit is not None:
+        return {**hit, "config": asdict(cfg)}
+
+    res = _iec_beam.run_single(cfg, gravity=gravity, chi_kappa=chi_kappa)
+    cache.put(key, res)
+    return res
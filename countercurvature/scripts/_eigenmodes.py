@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigsh, splu
 
 
 def _d2(n: int, h: float) -> np.ndarray:
@@ -32,13 +35,75 @@ def beam_stiffness_matrix(B: np.ndarray, s: np.ndarray) -> np.ndarray:
     return Kc
 
 
-def eigenmodes(B: np.ndarray, s: np.ndarray, n_modes: int = 6) -> dict[str, np.ndarray]:
+def curvature_operator(n: int, h: float) -> sp.csc_matrix:
     """
-    Lowest eigenmodes of K y = lambda y (mass ~ I). omega = sqrt(lambda).
-    Uses dense eigensolve (fine for n~200).
+    Square sparse map from free deflections y_1..y_{n-1} to curvatures at nodes 0..n-2
+    for the clamped-free rod (ghost node y_{-1} = y_1 gives y'(0)=0; y''(L)=0 is natural).
+    K = G^T diag(w B) G is then the constrained stiffness without any locked DOFs.
     """
-    K = beam_stiffness_matrix(B=B, s=s)
-    w, V = np.linalg.eigh(K)
+    m = n - 1
+    G = sp.diags(
+        [np.ones(m - 1), np.full(m, -2.0), np.ones(m)],
+        [-2, -1, 0],
+        shape=(m, m),
+        format="lil",
+    )
+    G[0, 0] = 2.0
+    return G.tocsc() / (h * h)
+
+
+def _sparse_eigenmodes(
+    B: np.ndarray, s: np.ndarray, rhoA: np.ndarray, n_modes: int
+) -> tuple[np.ndarray, np.ndarray]:
+    n = len(s)
+    h = float(s[1] - s[0])
+    w = np.full(n, h)
+    w[[0, -1]] = 0.5 * h
+    G = curvature_operator(n, h)
+    wB = w[:-1] * B[:-1]
+    M = sp.diags(w[1:] * rhoA[1:]).tocsc()
+    K = (G.T @ sp.diags(wB) @ G).tocsc()
+
+    # Shift-invert at 0 through the factors: K^{-1} = G^{-1} diag(wB)^{-1} G^{-T}.
+    # G is lower-banded, so both solves are O(n) and only ~n^2-conditioned.
+    if n_modes >= n - 2:
+        # eigsh needs k < n - 1; tiny grids are cheaper dense anyway.
+        lam, V_free = scipy.linalg.eigh(K.toarray(), M.toarray())
+    else:
+        lu = splu(G, permc_spec="NATURAL")
+        OPinv = LinearOperator(K.shape, matvec=lambda x: lu.solve(lu.solve(np.ravel(x), trans="T") / wB))
+        lam, V_free = eigsh(K, k=n_modes, M=M, sigma=0.0, which="LM", OPinv=OPinv)
+    V = np.zeros((n, lam.size))
+    V[1:] = V_free
+    return lam, V
+
+
+def eigenmodes(
+    B: np.ndarray,
+    s: np.ndarray,
+    n_modes: int = 6,
+    rhoA: np.ndarray | None = None,
+    method: str = "sparse",
+) -> dict[str, np.ndarray]:
+    """
+    Lowest eigenmodes of K y = lambda M y. omega = sqrt(lambda).
+
+    method="sparse" (default) solves the generalized problem with heterogeneous B(s) and
+    rhoA(s) (lumped mass, default 1) by shift-invert Lanczos for only the lowest n_modes,
+    which scales to 10^4+ node rods and per-point chi_E sweeps. method="dense" is the
+    original full eigh of beam_stiffness_matrix with M ~ I (fine for n~200).
+    """
+    B = np.asarray(B, dtype=float)
+    s = np.asarray(s, dtype=float)
+    rhoA = np.ones_like(s) if rhoA is None else np.asarray(rhoA, dtype=float)
+
+    if method == "sparse":
+        w, V = _sparse_eigenmodes(B, s, rhoA, n_modes)
+    elif method == "dense":
+        K = beam_stiffness_matrix(B=B, s=s)
+        w, V = np.linalg.eigh(K)
+    else:
+        raise ValueError(f"Unknown method: {method!r} (expected 'sparse' or 'dense')")
     idx = np.argsort(w)
     w = w[idx]
     V = V[:, idx]
@@ -57,5 +122,3 @@ def eigenmodes(B: np.ndarray, s: np.ndarray, n_modes: int = 6) -> dict[str, np.n
 
     omega = np.sqrt(np.clip(w, 0.0, None))
     return {"lambda": w, "omega": omega, "modes": V}
-
-
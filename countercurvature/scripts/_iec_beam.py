@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import asdict
 from typing import Any
 
 import numpy as np
+from scipy.linalg import get_lapack_funcs
 
 from ._config import BCCConfig
 
@@ -41,12 +44,87 @@ def _d2_matrix(n: int, h: float) -> np.ndarray:
     return D2 / (h * h)
 
 
-def solve_equilibrium_beam(s: np.ndarray, q: np.ndarray, B: np.ndarray, kappa0: np.ndarray) -> dict[str, Any]:
-    """
-    Linear Euler–Bernoulli surrogate:
-      minimize  0.5 ∫ B (y''-kappa0)^2 ds + ∫ q y ds
-    with clamped-free BC.
-    """
+# Banded (mixed) form of the clamped-free system. The fourth-order operator
+# D2^T diag(B) D2 is split into two second-order stencils by introducing the bending
+# moment M_i = B_i ((D2 y)_i - kappa0_i) on interior nodes. Unknowns are interleaved as
+# [y_0, y_1, M_1, y_2, M_2, ..., y_{n-2}, M_{n-2}, y_{n-1}] so every equation fits in a
+# (2, 2) band. The boundary rows of the dense system translate into fixed values of
+# y_0, y'(0), M_{n-2} and M_{n-3}. This is algebraically the same discrete problem, but
+# with condition number ~n^2 rather than ~n^4.
+_BANDS = (2, 2)
+
+
+def _band_put(ab: np.ndarray, rows: np.ndarray, cols: np.ndarray, vals: Any) -> None:
+    """Write entries A[rows, cols] = vals into LAPACK banded storage ``ab``."""
+    ab[_BANDS[1] + rows - cols, cols] = vals
+
+
+def _banded_matrix(s: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """Assemble the mixed clamped-free operator in banded storage (depends on s, B only)."""
+    n = len(s)
+    if n < 4:
+        raise ValueError("At least 4 nodes are required for the clamped-free beam.")
+    h = float(s[1] - s[0])
+    B = np.asarray(B, dtype=float)
+
+    ab = np.zeros((sum(_BANDS) + 1, 2 * n - 2))
+    i = np.arange(1, n - 1)
+    y_col = 2 * i - 1  # column of y_i for i >= 1
+    m_col = 2 * i  # column of M_i
+
+    # y_{i-1} - 2 y_i + y_{i+1} - h^2 M_i / B_i = h^2 kappa0_i    (rows 2i-1)
+    _band_put(ab, y_col, np.where(i == 1, 0, y_col - 2), 1.0)
+    _band_put(ab, y_col, y_col, -2.0)
+    _band_put(ab, y_col, y_col + 2, 1.0)
+    _band_put(ab, y_col, m_col, -(h * h) / B[1:-1])
+
+    # M_{j-1} - 2 M_j + M_{j+1} = -h^2 q_j,  j = 2..n-3        (rows 2j)
+    j = np.arange(2, n - 2)
+    _band_put(ab, 2 * j, 2 * j - 2, 1.0)
+    _band_put(ab, 2 * j, 2 * j, -2.0)
+    _band_put(ab, 2 * j, 2 * j + 2, 1.0)
+
+    # y(0)=0 and y'(0)=0 (one-sided), in rows 0 and 2
+    _band_put(ab, np.array([0]), np.array([0]), 1.0)
+    _band_put(ab, np.array([2, 2, 2]), np.array([0, 1, 3]), [-3.0, 4.0, -1.0])
+
+    # Free end: M_{n-3} and M_{n-2} are fixed by the y''(L), y'''(L) rows
+    _band_put(ab, np.array([2 * n - 4, 2 * n - 3]), np.array([2 * n - 6, 2 * n - 4]), 1.0)
+    return ab
+
+
+def _banded_rhs(s: np.ndarray, q: np.ndarray, B: np.ndarray, kappa0: np.ndarray) -> np.ndarray:
+    """Right-hand side matching :func:`_banded_matrix` for loads ``q`` and rest curvature ``kappa0``."""
+    n = len(s)
+    h = float(s[1] - s[0])
+    B = np.asarray(B, dtype=float)
+    kappa0 = np.asarray(kappa0, dtype=float)
+    q = np.broadcast_to(np.asarray(q, dtype=float), (n,))
+
+    rhs = np.zeros(2 * n - 2)
+    rhs[1 : 2 * n - 4 : 2] = h * h * kappa0[1:-1]
+    rhs[4 : 2 * n - 5 : 2] = -h * h * q[2:-2]
+
+    # y''(L)=kappa0(L) and y'''(L)=kappa0'(L) proxy, expressed through M
+    dk0 = np.gradient(kappa0, s)
+    rhs[2 * n - 4] = B[n - 3] * (kappa0[-1] + h * float(dk0[-1]) - kappa0[n - 3])
+    rhs[2 * n - 3] = B[n - 2] * (kappa0[-1] - kappa0[n - 2])
+    return rhs
+
+
+def _deflection_from_mixed(z: np.ndarray) -> np.ndarray:
+    """Extract y from the interleaved mixed solution vector."""
+    return np.concatenate([z[:1], z[1::2]])
+
+
+def _second_difference(y: np.ndarray, h: float) -> np.ndarray:
+    """Apply D2 to ``y`` without forming it (zero rows at both ends, as in _d2_matrix)."""
+    out = np.zeros_like(y)
+    out[1:-1] = (y[:-2] - 2.0 * y[1:-1] + y[2:]) / (h * h)
+    return out
+
+
+def _solve_equilibrium_dense(s: np.ndarray, q: np.ndarray, B: np.ndarray, kappa0: np.ndarray) -> np.ndarray:
     n = len(s)
     h = float(s[1] - s[0])
 
@@ -86,13 +164,161 @@ def solve_equilibrium_beam(s: np.ndarray, q: np.ndarray, B: np.ndarray, kappa0:
     A[-1, -1] = -1.0 / (h**3)
     b[-1] = float(dk0[-1])
 
-    y = np.linalg.solve(A, b)
-    kappa = D2 @ y
+    return np.linalg.solve(A, b)
+
+
+class BeamFactorization:
+    """
+    Banded LU factors of the clamped-free operator for one (s, B) pair.
+
+    The operator depends only on the grid and stiffness; loads and rest curvature enter
+    through the right-hand side, so passive/info solves and whole chi_kappa or gravity
+    sweeps at fixed B can share one factorization.
+    """
+
+    def __init__(self, s: np.ndarray, B: np.ndarray) -> None:
+        # Private read-only copies: the factors stay valid if the caller mutates s or B.
+        self.s = np.array(s, dtype=float, copy=True)
+        self.B = np.array(B, dtype=float, copy=True)
+        self.s.flags.writeable = False
+        self.B.flags.writeable = False
+        self.h = float(self.s[1] - self.s[0])
+
+        kl, ku = _BANDS
+        ab = _banded_matrix(self.s, self.B)
+        # gbtrf needs kl extra rows on top for fill-in from row interchanges.
+        ab_lu = np.zeros((kl + ab.shape[0], ab.shape[1]))
+        ab_lu[kl:] = ab
+        gbtrf, self._gbtrs = get_lapack_funcs(("gbtrf", "gbtrs"), (ab_lu,))
+        self._lu, self._piv, info = gbtrf(ab_lu, kl, ku)
+        if info != 0:
+            raise np.linalg.LinAlgError(f"Banded LU factorization failed (info={info}).")
+
+    def _solve_mixed(self, rhs: np.ndarray) -> np.ndarray:
+        z, info = self._gbtrs(self._lu, _BANDS[0], _BANDS[1], rhs, self._piv)
+        if info != 0:
+            raise np.linalg.LinAlgError(f"Banded LU solve failed (info={info}).")
+        return z
+
+    def solve(self, q: np.ndarray, kappa0: np.ndarray) -> dict[str, Any]:
+        """Solve for one load/rest-curvature pair; same output as solve_equilibrium_beam."""
+        z = self._solve_mixed(_banded_rhs(self.s, q, self.B, kappa0))
+        return _beam_solution(_deflection_from_mixed(z), self.h, kappa0)
+
+    def solve_many(self, q: np.ndarray, kappa0: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Solve several right-hand sides in one back-substitution.
+
+        ``q`` and ``kappa0`` are (m, n) stacks (or (n,) arrays shared by every case);
+        returns stacked (m, n) ``y`` and ``kappa``.
+        """
+        n = len(self.s)
+        q = np.atleast_2d(q)
+        kappa0 = np.atleast_2d(kappa0)
+        m = np.broadcast_shapes(q.shape, kappa0.shape, (1, n))[0]
+        q = np.broadcast_to(q, (m, n))
+        kappa0 = np.broadcast_to(kappa0, (m, n))
+
+        rhs = np.stack([_banded_rhs(self.s, q[k], self.B, kappa0[k]) for k in range(m)], axis=1)
+        z = self._solve_mixed(rhs)
+        ys, kappas = [], []
+        for k in range(m):
+            sol = _beam_solution(_deflection_from_mixed(z[:, k]), self.h, kappa0[k])
+            ys.append(sol["y"])
+            kappas.append(sol["kappa"])
+        return {"y": np.stack(ys), "kappa": np.stack(kappas)}
+
+
+class BeamSolver:
+    """
+    LRU cache of clamped-free :class:`BeamFactorization` objects keyed by a hash of (s, B).
+
+    ``solve`` mirrors :func:`solve_equilibrium_beam`; repeated calls with the same grid
+    and stiffness reuse the cached factors and only pay for the back-substitution.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = int(maxsize)
+        self._cache: OrderedDict[str, BeamFactorization] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(s: np.ndarray, B: np.ndarray) -> str:
+        digest = hashlib.sha1()
+        for arr in (s, B):
+            arr = np.ascontiguousarray(arr, dtype=float)
+            digest.update(str(arr.shape).encode())
+            digest.update(arr.tobytes())
+        return digest.hexdigest()
+
+    def factor(self, s: np.ndarray, B: np.ndarray) -> BeamFactorization:
+        key = self.key(s, B)
+        fac = self._cache.get(key)
+        if fac is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return fac
+
+        self.misses += 1
+        fac = BeamFactorization(s, B)
+        self._cache[key] = fac
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return fac
+
+    def solve(self, s: np.ndarray, q: np.ndarray, B: np.ndarray, kappa0: np.ndarray) -> dict[str, Any]:
+        return self.factor(s, B).solve(q, kappa0)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+# Shared by solve_equilibrium_beam so run_single / sweeps hit the cache transparently.
+DEFAULT_BEAM_SOLVER = BeamSolver()
+
+
+def _beam_solution(y: np.ndarray, h: float, kappa0: np.ndarray) -> dict[str, Any]:
+    kappa = _second_difference(y, h)
     kappa[0] = kappa[1]
     kappa[-1] = float(kappa0[-1])
     return {"y": y, "kappa": kappa}
 
 
+def solve_equilibrium_beam(
+    s: np.ndarray,
+    q: np.ndarray,
+    B: np.ndarray,
+    kappa0: np.ndarray,
+    *,
+    method: str = "banded",
+    solver: BeamSolver | None = None,
+) -> dict[str, Any]:
+    """
+    Linear Euler–Bernoulli surrogate:
+      minimize  0.5 ∫ B (y''-kappa0)^2 ds + ∫ q y ds
+    with clamped-free BC.
+
+    method="banded" (default) solves the mixed (y, M) form in O(n) time and memory and
+    stays accurate on 10^4–10^5-node rods; method="dense" is the O(n^3) reference path.
+    The banded factorization is cached per (s, B) in ``solver`` (DEFAULT_BEAM_SOLVER if
+    omitted), so repeated solves with the same stiffness skip refactoring.
+    """
+    if method == "banded":
+        return (solver or DEFAULT_BEAM_SOLVER).solve(s, q, B, kappa0)
+    if method == "dense":
+        y = _solve_equilibrium_dense(s, q, B, kappa0)
+        return _beam_solution(y, float(s[1] - s[0]), kappa0)
+    raise ValueError(f"Unknown method: {method!r} (expected 'banded' or 'dense')")
+
+
 def compute_metrics(
     s: np.ndarray,
     y: np.ndarray,
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Same on-disk layout as spinalmodes.utils.results_store.GridResults (.npz):
+# coord__<axis> arrays, the ordered axis names and one structured array of metrics
+# with shape (len(axis_0), len(axis_1), ...).
+_AXES_KEY = "__axes__"
+_DATA_KEY = "__data__"
+_COORD_PREFIX = "coord__"
+
+
+def frame_to_grid(df: pd.DataFrame, axes: Mapping[str, Sequence[float]]) -> np.ndarray:
+    """Scatter a long table (one row per grid point) into a structured (n_axis0, n_axis1, ...) array."""
+    coords = {k: np.asarray(v) for k, v in axes.items()}
+    metrics = [c for c in df.columns if c not in coords]
+    dtype = np.dtype([(m, df[m].to_numpy().dtype) for m in metrics])
+    data = np.zeros(tuple(c.size for c in coords.values()), dtype=dtype)
+    for m in metrics:
+        if np.issubdtype(dtype[m], np.floating):
+            data[m] = np.nan
+
+    index = []
+    for name, c in coords.items():
+        values = df[name].to_numpy()
+        order = np.argsort(c, kind="stable")
+        pos = order[np.clip(np.searchsorted(c, values, sorter=order), 0, c.size - 1)]
+        if not np.array_equal(c[pos], values):
+            raise ValueError(f"Column {name!r} has values outside the axis coordinates.")
+        index.append(pos)
+    for m in metrics:
+        data[m][tuple(index)] = df[m].to_numpy()
+    return data
+
+
+def save_grid(path: Path, df: pd.DataFrame, axes: Mapping[str, Sequence[float]]) -> Path:
+    """Persist sweep rows losslessly as a columnar .npz with the parameter axes as coordinates."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    coords = {f"{_COORD_PREFIX}{k}": np.asarray(v) for k, v in axes.items()}
+    np.savez(path, **coords, **{_AXES_KEY: np.array(list(axes)), _DATA_KEY: frame_to_grid(df, axes)})
+    return path
+
+
+def load_grid(path: Path) -> tuple[dict[str, np.ndarray], np.ndarray]:
+    """Return ({axis: coords}, structured metric array) from a file written by save_grid."""
+    with np.load(path) as npz:
+        names = [str(n) for n in npz[_AXES_KEY]]
+        return {n: npz[f"{_COORD_PREFIX}{n}"] for n in names}, npz[_DATA_KEY]
+
+
+def grid_to_frame(coords: Mapping[str, np.ndarray], data: np.ndarray) -> pd.DataFrame:
+    grids = np.meshgrid(*coords.values(), indexing="ij")
+    cols = {k: g.ravel() for k, g in zip(coords, grids)}
+    cols.update({m: data[m].ravel() for m in data.dtype.names})
+    return pd.DataFrame(cols)
+
+
+def load_results(results_dir: Path, stem: str) -> pd.DataFrame:
+    """Load results/<stem>.npz if present, falling back to the CSV export."""
+    npz_path = Path(results_dir) / f"{stem}.npz"
+    if npz_path.exists():
+        return grid_to_frame(*load_grid(npz_path))
+    csv_path = Path(results_dir) / f"{stem}.csv"
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Missing {npz_path}. Run `make data` first.")
+    return pd.read_csv(csv_path)
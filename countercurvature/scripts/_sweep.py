@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Mapping, Sequence
+
+import pandas as pd
+
+KEY_FIELD = "_sweep_key"
+
+
+def _to_builtin(value: Any) -> Any:
+    # NumPy scalars -> Python (exact float round-trip); anything else (e.g. config
+    # dataclasses) by its repr, which is enough to fingerprint a sweep.
+    return value.item() if hasattr(value, "item") else repr(value)
+
+
+def point_key(point: Mapping[str, Any], fixed: Mapping[str, Any] | None = None) -> str:
+    return json.dumps({**(fixed or {}), **point}, sort_keys=True, default=_to_builtin)
+
+
+def load_completed(path: Path) -> dict[str, dict[str, Any]]:
+    """Rows already in the append-only results file (a truncated last line is ignored)."""
+    done: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return done
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(row, dict) and KEY_FIELD in row:
+            done[row[KEY_FIELD]] = row
+    return done
+
+
+def _evaluate_shard(
+    func: Callable[..., Mapping[str, Any]],
+    fixed: Mapping[str, Any],
+    shard: Sequence[tuple[str, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    return [{KEY_FIELD: key, **point, **func(**fixed, **point)} for key, point in shard]
+
+
+def run_sweep(
+    func: Callable[..., Mapping[str, Any]],
+    points: Sequence[Mapping[str, Any]],
+    results_path: Path,
+    *,
+    fixed: Mapping[str, Any] | None = None,
+    n_workers: int | None = 1,
+    resume: bool = True,
+) -> pd.DataFrame:
+    """
+    Evaluate func(**fixed, **point) for every point, sharded over a process pool.
+
+    Each finished row is appended to ``results_path`` (JSON lines) immediately, so a
+    killed sweep can be restarted with resume=True and only the missing points run.
+    Returns one row per point, in the order of ``points``.
+    """
+    fixed = dict(fixed or {})
+    results_path = Path(results_path)
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    if not resume and results_path.exists():
+        results_path.unlink()
+
+    keyed = [(point_key(p, fixed), dict(p)) for p in points]
+    done = load_completed(results_path) if resume else {}
+    todo = list({k: p for k, p in keyed if k not in done}.items())
+    if done:
+        print(f"Resuming: {len(keyed) - len(todo)}/{len(keyed)} points already done")
+
+    n_workers = n_workers or os.cpu_count() or 1
+    shard_size = min(64, max(1, math.ceil(len(todo) / (4 * n_workers))))
+    shards = [todo[i : i + shard_size] for i in range(0, len(todo), shard_size)]
+
+    # Terminate a partially written last line (only the final byte is read).
+    if results_path.exists() and results_path.stat().st_size > 0:
+        with results_path.open("rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            needs_newline = fh.read(1) != b"\n"
+    else:
+        needs_newline = False
+    with results_path.open("a", encoding="utf-8") as fh:
+        if needs_newline:
+            fh.write("\n")
+
+        def record(rows: list[dict[str, Any]]) -> None:
+            for row in rows:
+                fh.write(json.dumps(row, default=_to_builtin) + "\n")
+                done[row[KEY_FIELD]] = row
+            fh.flush()
+
+        if n_workers == 1 or len(shards) <= 1:
+            for shard in shards:
+                record(_evaluate_shard(func, fixed, shard))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = [pool.submit(_evaluate_shard, func, fixed, shard) for shard in shards]
+                for fut in as_completed(futures):
+                    record(fut.result())
+
+    return pd.DataFrame([done[k] for k, _ in keyed]).drop(columns=KEY_FIELD, errors="ignore")
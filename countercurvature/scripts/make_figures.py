@@ -8,6 +8,7 @@ import pandas as pd
 from scripts._config import load_bcc_config
 from scripts._eigenmodes import eigenmodes
 from scripts._iec_beam import info_field, gamma_field, geff_field, intrinsic_curvature, solve_equilibrium_beam
+from scripts._results import load_results
 
 
 def _require_matplotlib():
@@ -18,11 +19,8 @@ def _require_matplotlib():
         raise RuntimeError("matplotlib is required. Install dependencies via `make deps`.") from e
 
 
-def _load_csv(cfg, name: str) -> pd.DataFrame:
-    path = cfg.io.results_dir / name
-    if not path.exists():
-        raise FileNotFoundError(f"Missing {path}. Run `make data` first.")
-    return pd.read_csv(path)
+def _load_results(cfg, stem: str) -> pd.DataFrame:
+    return load_results(cfg.io.results_dir, stem)
 
 
 def fig1_gene_to_geometry(cfg) -> None:
@@ -117,7 +115,7 @@ def fig3_countercurvature(cfg) -> None:
 
 def fig4_phase_diagram(cfg) -> None:
     plt = _require_matplotlib()
-    df = _load_csv(cfg, "sweep_grid.csv")
+    df = _load_results(cfg, "sweep_grid")
     pivot = df.pivot(index="chi_kappa", columns="gravity", values="D_geo_hat")
     chi = pivot.index.to_numpy()
     g = pivot.columns.to_numpy()
@@ -145,7 +143,7 @@ def fig4_phase_diagram(cfg) -> None:
 
 def fig5_mode_transition(cfg) -> None:
     plt = _require_matplotlib()
-    df = _load_csv(cfg, "sweep_chi_kappa.csv").sort_values("chi_kappa")
+    df = _load_results(cfg, "sweep_chi_kappa").sort_values("chi_kappa")
     fig, ax = plt.subplots(1, 1, figsize=(7, 4))
     ax.plot(df["chi_kappa"], df["mode_score"], lw=2)
     ax.set_xlabel("chi_kappa")
@@ -1,7 +1,7 @@
 """Metrics computation for Biological Countercurvature simulations."""
 
 import numpy as np
-from typing import Tuple
+from typing import Optional, Tuple, Union
 from dataclasses import dataclass
 
 
@@ -34,32 +34,45 @@ class RodMetrics:
 
 
 def compute_curvature(centerline: np.ndarray, window: int = 3) -> Tuple[np.ndarray, np.ndarray]:
-    """Compute local curvature from centerline."""
-    diffs = np.diff(centerline, axis=0)
-    segment_lengths = np.linalg.norm(diffs, axis=1)
-    arc_length = np.concatenate([[0.0], np.cumsum(segment_lengths)])
-    tangent = diffs / (segment_lengths[:, np.newaxis] + 1e-12)
-    tangent = np.vstack([tangent[0:1], tangent, tangent[-1:]])
-    curvature = np.zeros(len(arc_length))
-    for i in range(1, len(arc_length) - 1):
-        dT = tangent[i+1] - tangent[i-1]
-        ds = arc_length[i+1] - arc_length[i-1]
-        curvature[i] = np.linalg.norm(dT) / (ds + 1e-12)
+    """Compute local curvature from centerline.
+
+    Accepts one ``(n_points, 3)`` centerline or a batch ``(n_cases, n_points, 3)``;
+    curvature and arc length have the centerline shape without the last axis.
+    """
+    centerline = np.asarray(centerline, dtype=float)
+    diffs = np.diff(centerline, axis=-2)
+    segment_lengths = np.linalg.norm(diffs, axis=-1)
+    arc_length = np.zeros(centerline.shape[:-1])
+    np.cumsum(segment_lengths, axis=-1, out=arc_length[..., 1:])
+    tangent = diffs / (segment_lengths[..., np.newaxis] + 1e-12)
+    tangent = np.concatenate([tangent[..., 0:1, :], tangent, tangent[..., -1:, :]], axis=-2)
+    curvature = np.zeros_like(arc_length)
+    # Central differences of the (end-padded) tangents at every interior node.
+    dT = tangent[..., 2:-1, :] - tangent[..., :-3, :]
+    ds = arc_length[..., 2:] - arc_length[..., :-2]
+    curvature[..., 1:-1] = np.linalg.norm(dT, axis=-1) / (ds + 1e-12)
     return curvature, arc_length
 
 
-def compute_mode_shape_discriminator(centerline: np.ndarray) -> Tuple[float, float]:
-    """Characterize rod shape as C-shaped or S-shaped."""
-    curvature, _ = compute_curvature(centerline)
+def compute_mode_shape_discriminator(
+    centerline: np.ndarray, curvature: Optional[np.ndarray] = None
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """Characterize rod shape as C-shaped or S-shaped.
+
+    Returns ``(c_score, s_score)``: floats for one centerline, ``(n_cases,)``
+    arrays for a batch.  A precomputed ``curvature`` profile skips recomputing
+    it from the centerline.
+    """
+    if curvature is None:
+        curvature, _ = compute_curvature(centerline)
     curvature_sign = np.sign(curvature)
-    sign_changes = np.sum(np.abs(np.diff(curvature_sign)) > 0)
-    
-    if sign_changes >= 2:
-        return 0.0, 1.0  # S-shaped
-    elif sign_changes == 1:
-        return 0.5, 0.5
-    else:
-        return 1.0, 0.0  # C-shaped
+    sign_changes = np.sum(np.abs(np.diff(curvature_sign, axis=-1)) > 0, axis=-1)
+
+    # S-shaped for two or more sign changes, C-shaped for none.
+    c_score = np.select([sign_changes >= 2, sign_changes == 1], [0.0, 0.5], 1.0)
+    if c_score.ndim == 0:
+        return float(c_score), float(1.0 - c_score)
+    return c_score, 1.0 - c_score
 
 
 def compute_metrics_from_simulation(centerline: np.ndarray, 
@@ -96,7 +109,7 @@ def compute_metrics_from_simulation(centerline: np.ndarray,
     }
     
     # Shape characterization
-    c_score, s_score = compute_mode_shape_discriminator(centerline)
+    c_score, s_score = compute_mode_shape_discriminator(centerline, curvature)
     
     # Geodesic deviation
     diff = centerline - centerline_passive
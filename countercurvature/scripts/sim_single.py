@@ -3,11 +3,17 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 
 from scripts._config import load_bcc_config
-from scripts._iec_beam import run_single
+from scripts._cache import cached_run_single, default_cache
+
+
+def _to_json(value: Any) -> Any:
+    # Field arrays -> lists, config paths -> strings.
+    return value.tolist() if hasattr(value, "tolist") else str(value)
 
 
 def main() -> None:
@@ -16,20 +22,22 @@ def main() -> None:
     ap.add_argument("--gravity", type=float, default=None, help="Override gravity")
     ap.add_argument("--chi-kappa", type=float, default=None, help="Override chi_kappa")
     ap.add_argument("--tag", type=str, default="single", help="Label for output filenames")
+    ap.add_argument("--no-cache", action="store_true", help="Recompute even if results/.cache has this run")
     args = ap.parse_args()
 
     cfg = load_bcc_config(args.config)
     out_dir = cfg.io.results_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    res = run_single(cfg, gravity=args.gravity, chi_kappa=args.chi_kappa)
+    cache = None if args.no_cache else default_cache(cfg)
+    res = cached_run_single(cfg, gravity=args.gravity, chi_kappa=args.chi_kappa, cache=cache)
     row = res["row"]
 
     csv_path = out_dir / f"sim_single_{args.tag}.csv"
     json_path = out_dir / f"sim_single_{args.tag}.json"
 
     pd.DataFrame([row]).to_csv(csv_path, index=False)
-    json_path.write_text(json.dumps(res, indent=2, default=float))
+    json_path.write_text(json.dumps(res, indent=2, default=_to_json))
 
     print(f"✅ Wrote: {csv_path}")
     print(f"✅ Wrote: {json_path}")
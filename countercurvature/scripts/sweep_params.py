@@ -1,44 +1,62 @@
 from __future__ import annotations
 
 import argparse
+from functools import partial
+from typing import Any
 
-import pandas as pd
+from scripts._cache import ResultCache, cached_run_single, default_cache
+from scripts._config import BCCConfig, load_bcc_config
+from scripts._results import save_grid
+from scripts._sweep import run_sweep
 
-from scripts._config import load_bcc_config
-from scripts._iec_beam import run_single
+
+def _sweep_row(cfg: BCCConfig, gravity: float, chi_kappa: float, cache: ResultCache | None = None) -> dict[str, Any]:
+    return cached_run_single(cfg, gravity=gravity, chi_kappa=chi_kappa, cache=cache)["row"]
 
 
 def main() -> None:
-    ap = argparse.ArgumentParser(description="Parameter sweeps for IEC beam surrogate. Writes results/*.csv only.")
+    ap = argparse.ArgumentParser(description="Parameter sweeps for IEC beam surrogate. Writes results/*.npz (and *.csv) only.")
     ap.add_argument("--config", default="config/default.yaml", help="Path to YAML config")
+    ap.add_argument("--workers", type=int, default=1, help="Worker processes (0 = all cores)")
+    ap.add_argument("--resume", action="store_true", help="Skip points already in results/sweep_rows.jsonl")
+    ap.add_argument("--no-csv", action="store_true", help="Only write the columnar .npz results")
+    ap.add_argument("--no-cache", action="store_true", help="Recompute every point instead of reusing results/.cache")
     args = ap.parse_args()
 
     cfg = load_bcc_config(args.config)
     results_dir = cfg.io.results_dir
     results_dir.mkdir(parents=True, exist_ok=True)
 
-    rows = []
-    for g in cfg.sweeps.gravity_values:
-        for chi_k in cfg.sweeps.chi_kappa_values:
-            rows.append(run_single(cfg, gravity=g, chi_kappa=chi_k)["row"])
-
-    df = pd.DataFrame(rows)
-    grid_path = results_dir / "sweep_grid.csv"
-    df.to_csv(grid_path, index=False)
-    print(f"✅ Wrote: {grid_path} ({len(df)} rows)")
-
-    micro = pd.DataFrame([run_single(cfg, gravity=g, chi_kappa=cfg.iec.chi_kappa)["row"] for g in cfg.sweeps.gravity_values])
-    micro_path = results_dir / "sweep_microgravity.csv"
-    micro.to_csv(micro_path, index=False)
-    print(f"✅ Wrote: {micro_path} ({len(micro)} rows)")
-
-    ksw = pd.DataFrame([run_single(cfg, gravity=cfg.simulation.gravity, chi_kappa=chi_k)["row"] for chi_k in cfg.sweeps.chi_kappa_values])
-    k_path = results_dir / "sweep_chi_kappa.csv"
-    ksw.to_csv(k_path, index=False)
-    print(f"✅ Wrote: {k_path} ({len(ksw)} rows)")
-
+    grid = [{"gravity": g, "chi_kappa": chi_k} for g in cfg.sweeps.gravity_values for chi_k in cfg.sweeps.chi_kappa_values]
+    micro = [{"gravity": g, "chi_kappa": cfg.iec.chi_kappa} for g in cfg.sweeps.gravity_values]
+    ksw = [{"gravity": cfg.simulation.gravity, "chi_kappa": chi_k} for chi_k in cfg.sweeps.chi_kappa_values]
+
+    # The cache is bound outside ``fixed`` so toggling it does not change the resume keys.
+    cache = None if args.no_cache else default_cache(cfg)
+
+    # One pass over the union of all three sweeps; shared points are solved once.
+    df = run_sweep(
+        partial(_sweep_row, cache=cache),
+        grid + micro + ksw,
+        results_dir / "sweep_rows.jsonl",
+        fixed={"cfg": cfg},
+        n_workers=args.workers or None,
+        resume=args.resume,
+    )
+    n_grid, n_micro = len(grid), len(micro)
+    outputs = [
+        ("sweep_grid", df.iloc[:n_grid], {"gravity": cfg.sweeps.gravity_values, "chi_kappa": cfg.sweeps.chi_kappa_values}),
+        ("sweep_microgravity", df.iloc[n_grid : n_grid + n_micro], {"gravity": cfg.sweeps.gravity_values}),
+        ("sweep_chi_kappa", df.iloc[n_grid + n_micro :], {"chi_kappa": cfg.sweeps.chi_kappa_values}),
+    ]
+    for stem, part, axes in outputs:
+        # Lossless columnar results (axes stored as coordinates); CSV kept as an optional export.
+        path = save_grid(results_dir / f"{stem}.npz", part, axes)
+        print(f"✅ Wrote: {path} ({len(part)} rows)")
+        if not args.no_csv:
+            csv_path = results_dir / f"{stem}.csv"
+            part.to_csv(csv_path, index=False)
+            print(f"✅ Wrote: {csv_path}")
 
 if __name__ == "__main__":
     main()
-
-
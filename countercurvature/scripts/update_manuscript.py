@@ -3,9 +3,8 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-import pandas as pd
-
 from scripts._config import load_bcc_config
+from scripts._results import load_results
 
 
 def _fmt(x: float, nd: int = 3) -> str:
@@ -20,9 +19,9 @@ def main() -> None:
     cfg = load_bcc_config(args.config)
     res_dir = cfg.io.results_dir
 
-    micro = pd.read_csv(res_dir / "sweep_microgravity.csv").sort_values("gravity")
-    grid = pd.read_csv(res_dir / "sweep_grid.csv")
-    ksw = pd.read_csv(res_dir / "sweep_chi_kappa.csv").sort_values("chi_kappa")
+    micro = load_results(res_dir, "sweep_microgravity").sort_values("gravity")
+    grid = load_results(res_dir, "sweep_grid")
+    ksw = load_results(res_dir, "sweep_chi_kappa").sort_values("chi_kappa")
 
     g_min = float(micro["gravity"].min())
     g_max = float(micro["gravity"].max())
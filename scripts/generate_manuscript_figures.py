@@ -190,10 +190,10 @@ def generate_phase_diagram_pdf(output_dir: str, manuscript_dir: str) -> None:
     print("\n📊 Generating phase diagram (this may take a few minutes)...")
     
     # Check if phase diagram data already exists
-    phase_csv = Path(output_dir) / "phase_diagram_data.csv"
+    phase_data = Path(output_dir) / "phase_diagram_data.npz"
     phase_png = Path(output_dir) / "phase_diagram.png"
     
-    if not phase_csv.exists() or not phase_png.exists():
+    if not phase_data.exists() or not phase_png.exists():
         # Run phase diagram experiment
         from spinalmodes.experiments.countercurvature.experiment_phase_diagram import (
             run_phase_diagram_experiment,
@@ -11,12 +11,16 @@ from spinalmodes.iec import (
     IECParameters,
     apply_iec_coupling,
     generate_coherence_field,
+    solve_beam_elastica,
     solve_beam_static,
+    solve_beam_static_batch,
 )
 
 __all__ = [
     "IECParameters",
     "apply_iec_coupling",
     "generate_coherence_field",
+    "solve_beam_elastica",
     "solve_beam_static",
+    "solve_beam_static_batch",
 ]
@@ -14,7 +14,7 @@ from .scoliosis_metrics import (
     apply_info_asymmetry,
     build_lateral_curvature_bump,
 )
-from .pyelastica_bridge import PYELASTICA_AVAILABLE, SimulationResult
+from .pyelastica_bridge import PYELASTICA_AVAILABLE, SimulationHistory, SimulationResult
 
 __all__ = [
     *api.__all__,  # type: ignore[name-defined]
@@ -27,5 +27,6 @@ __all__ = [
     "apply_info_asymmetry",
     "build_lateral_curvature_bump",
     "PYELASTICA_AVAILABLE",
+    "SimulationHistory",
     "SimulationResult",
 ]
@@ -4,7 +4,10 @@ Public API for the countercurvature framework.
 This module exposes a minimal, stable surface for users:
 - Info fields and IEC→geometry couplings
 - Countercurvature metric and geodesic deviation
-- PyElastica bridge for 3D rods
+- Quasi-static evolution under time-varying information fields
+- Pseudo-arclength continuation of equilibrium branches
+- Variance-based (Sobol) global sensitivity analysis
+- PyElastica bridge for 3D rods (and batched NumPy rod ensembles)
 - Scoliosis metrics and regime classification
 
 Usage
@@ -22,20 +25,36 @@ from .info_fields import (
 )
 from .coupling import (
     CounterCurvatureParams,
+    CouplingBasis,
     compute_rest_curvature,
     compute_effective_stiffness,
     compute_active_moments,
 )
 from .validation_and_metrics import (
+    GeodesicDeviation,
     compute_countercurvature_metric,
     geodesic_curvature_deviation,
 )
+from .evolution import QuasiStaticTrajectory, elastica_solver, evolve_quasi_static
+from .continuation import ContinuationBranch, ElasticaFamily, continue_equilibria
+from .sensitivity import (
+    SaltelliDesign,
+    SobolIndices,
+    evaluate_design,
+    saltelli_sample,
+    sobol_analysis,
+    sobol_indices,
+)
 from .pyelastica_bridge import CounterCurvatureRodSystem
+from .cosserat_numpy import CounterCurvatureRodEnsemble
 from .scoliosis_metrics import (
     ScoliosisMetrics,
+    ScoliosisMetricsBatch,
     RegimeThresholds,
     compute_scoliosis_metrics,
+    compute_scoliosis_metrics_batch,
     classify_scoliotic_regime,
+    classify_scoliotic_regime_batch,
 )
 
 __all__ = [
@@ -43,14 +62,32 @@ __all__ = [
     "InfoFieldTimeSeries",
     "make_uniform_grid",
     "CounterCurvatureParams",
+    "CouplingBasis",
     "compute_rest_curvature",
     "compute_effective_stiffness",
     "compute_active_moments",
     "compute_countercurvature_metric",
     "geodesic_curvature_deviation",
+    "GeodesicDeviation",
+    "QuasiStaticTrajectory",
+    "elastica_solver",
+    "evolve_quasi_static",
+    "ContinuationBranch",
+    "ElasticaFamily",
+    "continue_equilibria",
+    "SaltelliDesign",
+    "SobolIndices",
+    "evaluate_design",
+    "saltelli_sample",
+    "sobol_analysis",
+    "sobol_indices",
     "CounterCurvatureRodSystem",
+    "CounterCurvatureRodEnsemble",
     "ScoliosisMetrics",
+    "ScoliosisMetricsBatch",
     "RegimeThresholds",
     "compute_scoliosis_metrics",
+    "compute_scoliosis_metrics_batch",
     "classify_scoliotic_regime",
+    "classify_scoliotic_regime_batch",
 ]
@@ -0,0 +1,449 @@
+"""Pseudo-arclength continuation of rod equilibria.
+
+Instead of solving every point of a dense parameter grid from scratch, an equilibrium
+branch ``F(u, λ) = 0`` is traced in one sweep: each step predicts along the branch
+tangent, corrects with Newton's method on the system augmented by the arclength
+constraint, and adapts its length to the Newton effort.  Because the parameter is an
+unknown of the corrector, the branch can be followed around folds (where ``λ`` turns
+back) that break natural-parameter stepping.
+
+Events are detected between consecutive points:
+
+* **fold** — the parameter component of the tangent changes sign;
+* **branch point** — the determinant of the augmented Jacobian changes sign.
+
+The residual may return ``∂F/∂u`` as a dense matrix or as a factorized
+:class:`Jacobian` (e.g. :class:`spinalmodes.iec.ElasticaJacobian`, which solves in
+O(n)).  The arclength row is handled by bordering, so every Newton step and tangent
+costs two solves with ``∂F/∂u`` plus scalar updates, and the determinant sign comes
+from the LU pivots of ``∂F/∂u``.
+
+:class:`ElasticaFamily` provides the residual of the large-deflection cantilever of
+:func:`spinalmodes.iec.solve_beam_elastica` with rest curvature and loads affine in the
+continuation parameter (e.g. ``χ_κ`` or gravity).  The small-slope solver is linear in
+both, so its branches are straight lines and need no continuation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, NamedTuple, Optional, Protocol, Tuple, Union
+
+import numpy as np
+from numpy.typing import NDArray
+
+from spinalmodes.iec import (
+    ElasticaJacobian,
+    cumulative_trapezoid_from_base,
+    cumulative_trapezoid_to_tip,
+    solve_beam_elastica,
+)
+
+ArrayF64 = NDArray[np.float64]
+
+
+class Jacobian(Protocol):
+    """Factorized ``∂F/∂u``: linear solves and the sign of the determinant."""
+
+    def solve(self, rhs: ArrayF64) -> ArrayF64: ...
+
+    def det_sign(self) -> float: ...
+
+
+# residual(u, lam) -> (F, dF/du, dF/dlam) with shapes (n,), (n, n) or Jacobian, (n,)
+Residual = Callable[[ArrayF64, float], Tuple[ArrayF64, Union[ArrayF64, Jacobian], ArrayF64]]
+
+
+class _DenseJacobian:
+    """LU factorization of a dense ``∂F/∂u``."""
+
+    def __init__(self, matrix: ArrayF64) -> None:
+        from scipy.linalg import lu_factor
+
+        self._lu, self._piv = lu_factor(np.atleast_2d(matrix), check_finite=False)
+
+    def solve(self, rhs: ArrayF64) -> ArrayF64:
+        from scipy.linalg import lu_solve
+
+        return lu_solve((self._lu, self._piv), rhs, check_finite=False)
+
+    def det_sign(self) -> float:
+        swaps = np.count_nonzero(self._piv != np.arange(self._piv.size))
+        return float(np.prod(np.sign(np.diag(self._lu))) * (-1) ** swaps)
+
+
+def _factorized(F_u: Union[ArrayF64, Jacobian]) -> Jacobian:
+    return F_u if hasattr(F_u, "solve") else _DenseJacobian(F_u)
+
+
+class ContinuationEvent(NamedTuple):
+    """Fold or branch point located between branch points ``index`` and ``index + 1``."""
+
+    kind: str
+    index: int
+    parameter: float
+    state: ArrayF64
+
+
+@dataclass(frozen=True)
+class ContinuationBranch:
+    """Equilibrium branch traced by :func:`continue_equilibria`.
+
+    Attributes
+    ----------
+    parameter:
+        Parameter value of each branch point, shape ``(n_points,)``.
+    states:
+        Converged states, shape ``(n_points, n_unknowns)``.
+    arclength:
+        Cumulative pseudo-arclength of each point.
+    events:
+        Detected folds and branch points, in order along the branch.
+    completed:
+        Whether the branch reached ``stop`` (False if the step size collapsed or
+        ``max_steps`` was exhausted).
+    n_newton:
+        Total Newton iterations (linear solves) spent on the branch.
+    """
+
+    parameter: ArrayF64
+    states: ArrayF64
+    arclength: ArrayF64
+    events: Tuple[ContinuationEvent, ...]
+    completed: bool
+    n_newton: int
+
+    @property
+    def folds(self) -> ArrayF64:
+        """Parameter values of the detected folds."""
+
+        return np.array([e.parameter for e in self.events if e.kind == "fold"])
+
+    @property
+    def branch_points(self) -> ArrayF64:
+        """Parameter values of the detected branch points."""
+
+        return np.array([e.parameter for e in self.events if e.kind == "branch_point"])
+
+
+def _newton(
+    residual: Residual,
+    u: ArrayF64,
+    lam: float,
+    tol: float,
+    max_iter: int,
+    constraint: Optional[Tuple[ArrayF64, ArrayF64, float]] = None,
+) -> Tuple[Optional[ArrayF64], float, int]:
+    """Newton at fixed ``lam`` or, with ``constraint = (t, x_prev, ds)``, on the augmented system."""
+
+    n = u.size
+    x = np.append(u, lam)
+    for iteration in range(1, max_iter + 1):
+        F, F_u, F_lam = residual(x[:n], float(x[n]))
+        J = _factorized(F_u)
+        if constraint is None:
+            step = J.solve(F)
+            x[:n] -= step
+        else:
+            # Bordering: [F_u F_lam; t] (du, dlam) = (F, g) from two solves with F_u.
+            tangent, x_prev, ds = constraint
+            g = tangent @ (x - x_prev) - ds
+            a, b = J.solve(np.column_stack([F, F_lam])).T
+            d_lam = (g - tangent[:n] @ a) / (tangent[n] - tangent[:n] @ b)
+            step = np.append(a - d_lam * b, d_lam)
+            x -= step
+        if not np.all(np.isfinite(x)):
+            break
+        if np.max(np.abs(step)) < tol:
+            return x[:n], float(x[n]), iteration
+    return None, lam, max_iter
+
+
+def _tangent(
+    F_u: Union[ArrayF64, Jacobian], F_lam: ArrayF64, previous: ArrayF64
+) -> Tuple[ArrayF64, float]:
+    """Unit tangent oriented along ``previous`` and the sign of the augmented Jacobian."""
+
+    n = previous.size - 1
+    J = _factorized(F_u)
+    # [F_u F_lam; previous] t = e_n gives t_u = -t_lam F_u^{-1} F_lam.
+    b = J.solve(F_lam)
+    t_lam = 1.0 / (previous[n] - previous[:n] @ b)
+    tangent = np.append(-t_lam * b, t_lam)
+    tangent /= np.linalg.norm(tangent)
+    # det [F_u F_lam; t] = det(F_u) · t_lam (1 + |F_u^{-1} F_lam|²).
+    return tangent, J.det_sign() * float(np.sign(tangent[n]))
+
+
+def _locate(
+    residual: Residual,
+    x: ArrayF64,
+    tangent: ArrayF64,
+    step: float,
+    indicator: Callable[[ArrayF64, float], float],
+    bracket: Tuple[float, float],
+    tol: float,
+    max_newton: int,
+    max_iter: int = 40,
+) -> Tuple[ArrayF64, int]:
+    """Illinois regula falsi for the arclength fraction where ``indicator`` changes sign.
+
+    ``indicator(tangent, det_sign)`` takes the values ``bracket`` at ``x`` and at the
+    next branch point, ``step`` further along; intermediate points are corrected with
+    shorter arclength steps from ``x``.  Returns the located point and Newton iterations.
+    """
+
+    n = x.size - 1
+    lo, hi = 0.0, 1.0
+    f_lo, f_hi = bracket
+    point, n_newton, kept = x, 0, 0
+    for _ in range(max_iter):
+        w = lo + (hi - lo) * f_lo / (f_lo - f_hi)
+        ds = w * step
+        guess = x + ds * tangent
+        u, lam, iterations = _newton(
+            residual, guess[:n], float(guess[n]), tol, max_newton, constraint=(tangent, x, ds)
+        )
+        n_newton += iterations
+        if u is None:
+            break
+        point = np.append(u, lam)
+        F, F_u, F_lam = residual(u, lam)
+        f = indicator(*_tangent(F_u, F_lam, tangent))
+        if abs(f) < tol or (hi - lo) * abs(step) < tol:
+            break
+        # Halve the stale endpoint when the same side is kept twice in a row.
+        if np.sign(f) == np.sign(f_lo):
+            lo, f_lo = w, f
+            kept = kept + 1 if kept > 0 else 1
+            if kept > 1:
+                f_hi *= 0.5
+        else:
+            hi, f_hi = w, f
+            kept = kept - 1 if kept < 0 else -1
+            if kept < -1:
+                f_lo *= 0.5
+    return point, n_newton
+
+
+def continue_equilibria(
+    residual: Residual,
+    u0: ArrayF64,
+    start: float,
+    stop: float,
+    *,
+    step: Optional[float] = None,
+    min_step: Optional[float] = None,
+    max_step: Optional[float] = None,
+    max_steps: int = 500,
+    tol: float = 1e-10,
+    max_newton: int = 12,
+    target_newton: int = 4,
+) -> ContinuationBranch:
+    """Trace the branch of ``residual(u, λ) = 0`` from ``λ = start`` towards ``stop``.
+
+    Parameters
+    ----------
+    residual:
+        Returns ``(F, ∂F/∂u, ∂F/∂λ)`` at ``(u, λ)``.
+    u0:
+        Initial guess at ``start``; corrected by Newton before continuation begins.
+    start, stop:
+        Parameter range.  The first step heads towards ``stop``; the branch ends at the
+        first point past it, which is corrected back onto ``λ = stop``.
+    step, min_step, max_step:
+        Initial, minimum and maximum pseudo-arclength step.  Default to 1/20, 1/10⁴ and
+        1/4 of ``|stop - start|``.
+    max_steps:
+        Maximum number of accepted continuation steps.
+    tol:
+        Newton tolerance on the update.
+    max_newton:
+        Newton iterations before a step is rejected and halved.
+    target_newton:
+        Steps converging in fewer iterations grow by 1.5x, slower ones shrink.
+
+    Returns
+    -------
+    ContinuationBranch
+    """
+
+    span = abs(stop - start)
+    if span == 0.0:
+        raise ValueError("start and stop must differ.")
+    step = span / 20.0 if step is None else step
+    min_step = span * 1e-4 if min_step is None else min_step
+    max_step = span / 4.0 if max_step is None else max_step
+    direction = np.sign(stop - start)
+
+    u, _, n_newton = _newton(residual, np.asarray(u0, dtype=float).copy(), start, tol, max_newton)
+    if u is None:
+        raise RuntimeError(f"Newton failed to converge at the initial parameter {start:.6g}.")
+    n = u.size
+
+    F, F_u, F_lam = residual(u, start)
+    seed = np.zeros(n + 1)
+    seed[n] = direction
+    tangent, det_sign = _tangent(F_u, F_lam, seed)
+
+    parameter, states, arclength = [float(start)], [u], [0.0]
+    events: list[ContinuationEvent] = []
+    x = np.append(u, start)
+    completed = False
+
+    for _ in range(max_steps):
+        guess = x + step * tangent
+        u_new, lam_new, iterations = _newton(
+            residual, guess[:n], float(guess[n]), tol, max_newton, constraint=(tangent, x, step)
+        )
+        n_newton += iterations
+        if u_new is None:
+            step *= 0.5
+            if step < min_step:
+                break
+            continue
+
+        x_new = np.append(u_new, lam_new)
+        F, F_u, F_lam = residual(u_new, lam_new)
+        tangent_new, det_new = _tangent(F_u, F_lam, tangent)
+
+        index = len(parameter) - 1
+        if np.sign(tangent_new[n]) != np.sign(tangent[n]):
+            # Parameter component of the tangent vanishes at a fold.
+            x_fold, iterations_fold = _locate(
+                residual, x, tangent, step, lambda t, _: t[n], (tangent[n], tangent_new[n]), tol, max_newton
+            )
+            n_newton += iterations_fold
+            events.append(ContinuationEvent("fold", index, float(x_fold[n]), x_fold[:n]))
+        if det_new != det_sign:
+            x_branch, iterations_branch = _locate(
+                residual, x, tangent, step, lambda _, sign: det_sign * sign, (1.0, -1.0), tol, max_newton
+            )
+            n_newton += iterations_branch
+            events.append(ContinuationEvent("branch_point", index, float(x_branch[n]), x_branch[:n]))
+
+        overshoot = direction * (lam_new - stop) >= 0.0
+        if overshoot:
+            # Past the end of the range: land exactly on ``stop``.
+            w = (stop - x[n]) / (lam_new - x[n])
+            u_end, _, end_iterations = _newton(residual, (1.0 - w) * x[:n] + w * u_new, stop, tol, max_newton)
+            n_newton += end_iterations
+            if u_end is not None:
+                x_new = np.append(u_end, stop)
+                completed = True
+
+        arclength.append(arclength[-1] + float(np.linalg.norm(x_new - x)))
+        parameter.append(float(x_new[n]))
+        states.append(x_new[:n])
+        if overshoot:
+            break
+
+        x, tangent, det_sign = x_new, tangent_new, det_new
+        if iterations < target_newton:
+            step = min(1.5 * step, max_step)
+        elif iterations > target_newton:
+            step = max(0.5 * step, min_step)
+
+    return ContinuationBranch(
+        parameter=np.array(parameter),
+        states=np.array(states),
+        arclength=np.array(arclength),
+        events=tuple(events),
+        completed=completed,
+        n_newton=n_newton,
+    )
+
+
+@dataclass(frozen=True)
+class ElasticaFamily:
+    """Elastica cantilever whose rest curvature and loads are affine in a parameter ``λ``.
+
+    At parameter ``λ`` the problem is :func:`spinalmodes.iec.solve_beam_elastica` with
+    ``kappa_target + λ·d_kappa_target``, ``P_load + λ·d_P_load`` and
+    ``distributed_load + λ·d_distributed_load``.  The state is the angle profile ``θ(s)``.
+
+    Examples
+    --------
+    Continuation in ``χ_κ`` uses ``kappa_target = κ_gen`` and ``d_kappa_target`` equal
+    to the coupling gradient; continuation in gravity uses ``d_distributed_load = ρA``.
+    """
+
+    s: ArrayF64
+    E_field: ArrayF64
+    kappa_target: ArrayF64
+    M_active: ArrayF64
+    I_moment: float = 1e-8
+    P_load: float = 0.0
+    distributed_load: float = 0.0
+    d_kappa_target: ArrayF64 | float = 0.0
+    d_P_load: float = 0.0
+    d_distributed_load: float = 0.0
+    _compliance: ArrayF64 = field(init=False, repr=False, compare=False)
+    _span: ArrayF64 = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        s = np.asarray(self.s, dtype=float)
+        if s.ndim != 1 or s.size < 2 or np.any(np.diff(s) <= 0):
+            raise ValueError("Spatial coordinates must be one-dimensional and strictly increasing.")
+        object.__setattr__(self, "s", s)
+        object.__setattr__(
+            self, "_compliance", 1.0 / np.clip(np.broadcast_to(self.E_field, s.shape) * self.I_moment, 1e-9, None)
+        )
+        object.__setattr__(self, "_span", s[-1] - s)
+
+    def residual(self, theta: ArrayF64, lam: float) -> Tuple[ArrayF64, ElasticaJacobian, ArrayF64]:
+        """Discrete elastica residual ``θ - A[κ_target + (M_ext(θ) - M_active)/EI]`` and its derivatives.
+
+        ``∂F/∂θ`` is returned factorized as an :class:`~spinalmodes.iec.ElasticaJacobian`.
+        """
+
+        s, c = self.s, self._compliance
+        shear = self.P_load + lam * self.d_P_load + (self.distributed_load + lam * self.d_distributed_load) * self._span
+        d_shear = self.d_P_load + self.d_distributed_load * self._span
+        cos, sin = np.cos(theta), np.sin(theta)
+
+        F = theta - cumulative_trapezoid_from_base(self.curvature(theta, lam), s)
+        F_u = ElasticaJacobian(s, c, shear * sin)
+        F_lam = -cumulative_trapezoid_from_base(
+            np.asarray(self.d_kappa_target) + c * cumulative_trapezoid_to_tip(d_shear * cos, s), s
+        )
+        return F, F_u, np.broadcast_to(F_lam, theta.shape).astype(float)
+
+    def solve(self, lam: float, theta_init: Optional[ArrayF64] = None) -> Tuple[ArrayF64, ArrayF64]:
+        """Equilibrium ``(theta, kappa)`` at a single parameter value."""
+
+        return solve_beam_elastica(
+            self.s,
+            self.kappa_target + lam * np.broadcast_to(self.d_kappa_target, np.shape(self.s)),
+            np.broadcast_to(self.E_field, np.shape(self.s)),
+            self.M_active,
+            I_moment=self.I_moment,
+            P_load=self.P_load + lam * self.d_P_load,
+            distributed_load=self.distributed_load + lam * self.d_distributed_load,
+            theta_init=theta_init,
+        )
+
+    def curvature(self, theta: ArrayF64, lam: float) -> ArrayF64:
+        """Realised curvature of the equilibrium ``theta`` at parameter ``lam``."""
+
+        shear = self.P_load + lam * self.d_P_load + (self.distributed_load + lam * self.d_distributed_load) * self._span
+        return (
+            self.kappa_target
+            + lam * np.asarray(self.d_kappa_target)
+            + (cumulative_trapezoid_to_tip(shear * np.cos(theta), self.s) - self.M_active) * self._compliance
+        )
+
+    def continuation(self, start: float, stop: float, **kwargs) -> ContinuationBranch:
+        """Trace the branch from ``start`` to ``stop`` (see :func:`continue_equilibria`)."""
+
+        theta0, _ = self.solve(start)
+        return continue_equilibria(self.residual, theta0, start, stop, **kwargs)
+
+
+__all__ = [
+    "ContinuationBranch",
+    "ContinuationEvent",
+    "ElasticaFamily",
+    "Jacobian",
+    "continue_equilibria",
+]
@@ -0,0 +1,794 @@
+"""Pure-NumPy discrete Cosserat rod for countercurvature simulations.
+
+A compact re-implementation of the discretisation used by PyElastica (Gazzola et al.,
+R. Soc. open sci. 2018) for environments where PyElastica cannot be installed.  The
+rod has ``n`` elements between ``n + 1`` nodes; every element carries a material frame
+(directors stored as the rows of a ``3 × 3`` matrix ``Q``), and curvature lives on the
+``n - 1`` interior (Voronoi) nodes.
+
+* Stretch/shear:  ``σ = Q t / l0 - d3`` with couple-free internal force ``Qᵀ S (σ - σ0)``.
+* Bend/twist:     ``κ = -log(Q_{i+1} Q_iᵀ) / D0`` with internal couple ``B (κ - κ_rest)``.
+* Time stepping:  position Verlet (half drift, kick, half drift), with exponential
+  velocity damping, gravity and a clamped base.
+
+All element and node operations are vectorised over the last (element) axis, as in
+PyElastica, so arrays have shape ``(3, n)``, ``(3, 3, n)`` etc.  Every kernel also
+accepts leading batch axes: :meth:`DiscreteCosseratRod.stack` combines rods into one
+``(N, 3, n + 1)`` state that :class:`CounterCurvatureRodEnsemble` advances in a single
+time loop, amortising the per-step Python overhead over the whole ensemble.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Callable, Mapping, Optional, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .coupling import (
+    CounterCurvatureParams,
+    compute_effective_stiffness,
+    compute_rest_curvature,
+)
+from .info_fields import InfoField1D
+from .pyelastica_bridge import SimulationHistory, SimulationResult
+
+ArrayF64 = NDArray[np.float64]
+
+# Timoshenko shear correction factor for a solid circular cross-section (as in PyElastica).
+SHEAR_COEFFICIENT = 4.0 / 3.0
+
+
+def _component(a: ArrayF64, i: int, axis: int) -> ArrayF64:
+    return a[(Ellipsis, i) + (slice(None),) * (-axis - 1)]
+
+
+def _cross(a: ArrayF64, b: ArrayF64, axis: int = -2) -> ArrayF64:
+    """Cross product over a (negative) component axis; cheaper than ``np.cross`` for small n."""
+
+    a0, a1, a2 = (_component(a, i, axis) for i in range(3))
+    b0, b1, b2 = (_component(b, i, axis) for i in range(3))
+    return np.stack([a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0], axis=axis)
+
+
+def _rotate(Q: ArrayF64, rotation: ArrayF64) -> ArrayF64:
+    """Return ``exp(-[rotation]×) Q`` for body-frame rotation vectors (Rodrigues)."""
+
+    angle = np.sqrt(np.einsum("...in,...in->...n", rotation, rotation))
+    # Rotate the columns of every Q: v -> v - sin θ (k × v) + (1 - cos θ) k × (k × v)
+    k = (rotation / np.where(angle > 0.0, angle, 1.0)[..., None, :])[..., :, None, :]
+    k_cross_Q = _cross(k, Q, axis=-3)
+    sin_angle = np.sin(angle)[..., None, None, :]
+    one_minus_cos = (1.0 - np.cos(angle))[..., None, None, :]
+    return Q - sin_angle * k_cross_Q + one_minus_cos * _cross(k, k_cross_Q, axis=-3)
+
+
+def _inv_rotate(Q: ArrayF64) -> ArrayF64:
+    """Rotation vectors ``log(Q_{i+1} Q_iᵀ)`` between consecutive frames, shape ``(3, n - 1)``."""
+
+    R = np.einsum("...ijn,...kjn->...ikn", Q[..., 1:], Q[..., :-1])
+    cos_angle = np.clip(0.5 * (np.einsum("...iin->...n", R) - 1.0), -1.0, 1.0)
+    angle = np.arccos(cos_angle)
+    axis = np.stack(
+        [
+            R[..., 2, 1, :] - R[..., 1, 2, :],
+            R[..., 0, 2, :] - R[..., 2, 0, :],
+            R[..., 1, 0, :] - R[..., 0, 1, :],
+        ],
+        axis=-2,
+    )
+    sin_angle = np.sin(angle)
+    # θ / (2 sin θ) → 1/2 for small rotations
+    scale = np.where(sin_angle > 1e-12, angle / (2.0 * np.where(sin_angle > 1e-12, sin_angle, 1.0)), 0.5)
+    return scale[..., None, :] * axis
+
+
+def _difference(a: ArrayF64) -> ArrayF64:
+    """Two-point difference with zero ghost values: ``(..., m) -> (..., m + 1)``."""
+
+    out = np.zeros(a.shape[:-1] + (a.shape[-1] + 1,))
+    out[..., :-1] += a
+    out[..., 1:] -= a
+    return out
+
+
+def _quadrature(a: ArrayF64) -> ArrayF64:
+    """Trapezoidal split of Voronoi quantities onto elements: ``(..., m) -> (..., m + 1)``."""
+
+    out = np.zeros(a.shape[:-1] + (a.shape[-1] + 1,))
+    out[..., :-1] += 0.5 * a
+    out[..., 1:] += 0.5 * a
+    return out
+
+
+@dataclass
+class DiscreteCosseratRod:
+    """State and material arrays of a discrete Cosserat rod.
+
+    Attributes
+    ----------
+    position, velocity:
+        Node positions and velocities, shape ``(3, n + 1)``.
+    directors:
+        Element frames, shape ``(3, 3, n)``; ``directors[k, :, e]`` is ``d_k`` of element ``e``.
+    omega:
+        Element angular velocities in the material frame, shape ``(3, n)``.
+    mass:
+        Lumped nodal masses, shape ``(n + 1,)``.
+    inertia:
+        Diagonal of the element mass second moment of inertia, shape ``(3, n)``.
+    rest_lengths, rest_voronoi_lengths:
+        Rest element and Voronoi lengths, shapes ``(n,)`` and ``(n - 1,)``.
+    shear_stiffness:
+        Diagonal of the shear/stretch matrix ``S``, shape ``(3, n)``.
+    bend_stiffness:
+        Diagonal of the bend/twist matrix ``B`` on Voronoi nodes, shape ``(3, n - 1)``.
+    rest_kappa:
+        Rest curvature in the material frame, shape ``(3, n - 1)``.
+
+    Every array may carry the same leading batch axes (see :meth:`stack`).
+    """
+
+    position: ArrayF64
+    velocity: ArrayF64
+    directors: ArrayF64
+    omega: ArrayF64
+    mass: ArrayF64
+    inertia: ArrayF64
+    rest_lengths: ArrayF64
+    rest_voronoi_lengths: ArrayF64
+    shear_stiffness: ArrayF64
+    bend_stiffness: ArrayF64
+    rest_kappa: ArrayF64
+
+    @property
+    def n_elems(self) -> int:
+        """Number of elements per rod."""
+
+        return int(self.rest_lengths.shape[-1])
+
+    @property
+    def batch_shape(self) -> tuple[int, ...]:
+        """Leading batch axes (``()`` for a single rod)."""
+
+        return self.rest_lengths.shape[:-1]
+
+    @classmethod
+    def stack(cls, rods: Sequence["DiscreteCosseratRod"]) -> "DiscreteCosseratRod":
+        """Stack rods with the same number of elements into one batched rod of shape ``(N, ...)``."""
+
+        if len({rod.n_elems for rod in rods}) != 1:
+            raise ValueError("All rods in an ensemble must have the same number of elements.")
+        return cls(**{f.name: np.stack([getattr(rod, f.name) for rod in rods]) for f in fields(cls)})
+
+    @classmethod
+    def straight_rod(
+        cls,
+        n_elements: int,
+        start: ArrayF64,
+        direction: ArrayF64,
+        normal: ArrayF64,
+        base_length: float,
+        base_radius: float,
+        density: float,
+        youngs_modulus: float | ArrayF64,
+        shear_modulus: float | ArrayF64,
+    ) -> "DiscreteCosseratRod":
+        """Straight, uniform-section rod (mirrors ``elastica.CosseratRod.straight_rod``).
+
+        ``youngs_modulus`` and ``shear_modulus`` may be per-element arrays of shape
+        ``(n_elements,)`` for heterogeneous stiffness.
+        """
+
+        if n_elements < 2:
+            raise ValueError("At least two elements are required.")
+        direction = np.asarray(direction, dtype=float)
+        direction = direction / np.linalg.norm(direction)
+        normal = np.asarray(normal, dtype=float)
+        if abs(float(normal @ direction)) > 1e-12:
+            raise ValueError("normal must be perpendicular to direction.")
+        normal = normal / np.linalg.norm(normal)
+
+        n = int(n_elements)
+        position = np.asarray(start, dtype=float)[:, None] + np.outer(direction, np.linspace(0.0, base_length, n + 1))
+        frame = np.array([normal, np.cross(direction, normal), direction])
+        directors = np.repeat(frame[:, :, None], n, axis=2)
+
+        rest_lengths = np.full(n, base_length / n)
+        rest_voronoi_lengths = 0.5 * (rest_lengths[1:] + rest_lengths[:-1])
+        area = np.pi * base_radius**2
+        I1 = np.pi * base_radius**4 / 4.0
+        second_moment = np.array([I1, I1, 2.0 * I1])
+
+        element_mass = density * area * rest_lengths
+        mass = np.zeros(n + 1)
+        mass[:-1] += 0.5 * element_mass
+        mass[1:] += 0.5 * element_mass
+
+        E = np.broadcast_to(np.asarray(youngs_modulus, dtype=float), (n,))
+        G = np.broadcast_to(np.asarray(shear_modulus, dtype=float), (n,))
+        shear_stiffness = np.array([SHEAR_COEFFICIENT * G * area, SHEAR_COEFFICIENT * G * area, E * area])
+        bend_elements = np.array([E * I1, E * I1, G * 2.0 * I1])
+        # Length-weighted average of the two adjacent elements
+        bend_stiffness = (
+            bend_elements[:, 1:] * rest_lengths[1:] + bend_elements[:, :-1] * rest_lengths[:-1]
+        ) / (rest_lengths[1:] + rest_lengths[:-1])
+
+        return cls(
+            position=position,
+            velocity=np.zeros_like(position),
+            directors=directors,
+            omega=np.zeros((3, n)),
+            mass=mass,
+            inertia=density * rest_lengths * second_moment[:, None],
+            rest_lengths=rest_lengths,
+            rest_voronoi_lengths=rest_voronoi_lengths,
+            shear_stiffness=shear_stiffness,
+            bend_stiffness=bend_stiffness,
+            rest_kappa=np.zeros((3, n - 1)),
+        )
+
+    def copy(self) -> "DiscreteCosseratRod":
+        """Deep copy of state and material arrays."""
+
+        return type(self)(**{f.name: getattr(self, f.name).copy() for f in fields(self)})
+
+    def kinetic_energy(self) -> ArrayF64:
+        """Translational plus rotational kinetic energy per rod, shape ``batch_shape``."""
+
+        translational = 0.5 * np.sum(self.mass * np.sum(self.velocity**2, axis=-2), axis=-1)
+        rotational = 0.5 * np.sum(self.inertia * self.omega**2, axis=(-2, -1))
+        return translational + rotational
+
+    @property
+    def kappa(self) -> ArrayF64:
+        """Curvature/twist on Voronoi nodes in the material frame, shape ``(3, n - 1)``."""
+
+        return -_inv_rotate(self.directors) / self.rest_voronoi_lengths[..., None, :]
+
+    def internal_loads(self) -> tuple[ArrayF64, ArrayF64]:
+        """Return nodal forces ``(3, n + 1)`` (lab frame) and element torques ``(3, n)`` (material frame)."""
+
+        Q = self.directors
+        tangents = np.diff(self.position, axis=-1)
+        local_tangents = np.einsum("...ijn,...jn->...in", Q, tangents)
+
+        sigma = local_tangents / self.rest_lengths[..., None, :]
+        sigma[..., 2, :] -= 1.0
+        stress = self.shear_stiffness * sigma
+        forces = _difference(np.einsum("...jin,...jn->...in", Q, stress))
+
+        kappa = self.kappa
+        couple = self.bend_stiffness * (kappa - self.rest_kappa)
+        torques = (
+            _difference(couple)
+            + _quadrature(_cross(kappa, couple) * self.rest_voronoi_lengths[..., None, :])
+            + _cross(local_tangents, stress)
+        )
+        return forces, torques
+
+    def stable_time_step(self, safety: float = 0.5) -> float:
+        """Conservative explicit time-step estimate from axial, shear, bending and rotary modes."""
+
+        l0 = self.rest_lengths
+        element_mass = 0.5 * (self.mass[..., :-1] + self.mass[..., 1:])
+        axial = l0 * np.sqrt(element_mass / (self.shear_stiffness.max(axis=-2) * l0))
+        line_density = element_mass / l0
+        bending = l0[..., 1:] ** 2 * np.sqrt(line_density[..., 1:] / self.bend_stiffness[..., :2, :].max(axis=-2))
+        rotational = l0[..., None, 1:] * np.sqrt((self.inertia / l0[..., None, :])[..., 1:] / self.bend_stiffness)
+        shear_rotation = np.sqrt(
+            self.inertia[..., :2, :] / (self.shear_stiffness[..., :2, :] * l0[..., None, :])
+        )
+        return float(safety * min(axial.min(), bending.min(), rotational.min(), shear_rotation.min()))
+
+
+def position_verlet_step(
+    rod: DiscreteCosseratRod,
+    dt: float,
+    *,
+    gravity: ArrayF64,
+    damping_constant: float | ArrayF64 = 0.0,
+) -> None:
+    """Advance ``rod`` in place by one position-Verlet step with a clamped base (node 0, element 0).
+
+    ``gravity`` has shape ``(..., 3)`` and ``damping_constant`` shape ``(...)`` matching the
+    batch axes of ``rod`` (or broadcastable to them).
+    """
+
+    base_position = rod.position[..., 0].copy()
+    base_directors = rod.directors[..., 0].copy()
+
+    rod.position += 0.5 * dt * rod.velocity
+    rod.directors = _rotate(rod.directors, 0.5 * dt * rod.omega)
+
+    forces, torques = rod.internal_loads()
+    forces += rod.mass[..., None, :] * np.asarray(gravity, dtype=float)[..., :, None]
+    J_omega = rod.inertia * rod.omega
+    rod.velocity += dt * forces / rod.mass[..., None, :]
+    rod.omega += dt * (torques + _cross(J_omega, rod.omega)) / rod.inertia
+
+    damping_constant = np.asarray(damping_constant, dtype=float)
+    if np.any(damping_constant):
+        decay = np.exp(-damping_constant * dt)[..., None, None]
+        rod.velocity *= decay
+        rod.omega *= decay
+
+    # Clamp: node 0 and the frame of element 0 stay fixed.
+    rod.velocity[..., 0] = 0.0
+    rod.omega[..., 0] = 0.0
+
+    rod.position += 0.5 * dt * rod.velocity
+    rod.directors = _rotate(rod.directors, 0.5 * dt * rod.omega)
+    rod.position[..., 0] = base_position
+    rod.directors[..., 0] = base_directors
+
+
+def _padded_curvature(rod: DiscreteCosseratRod) -> ArrayF64:
+    """Curvature magnitude on all nodes (zero at both ends, as in the PyElastica bridge)."""
+
+    curvature = np.zeros(rod.position.shape[:-2] + (rod.n_elems + 1,))
+    curvature[..., 1:-1] = np.linalg.norm(rod.kappa, axis=-2)
+    return curvature
+
+
+def _integrate(
+    rod: DiscreteCosseratRod,
+    final_time: float,
+    dt: float,
+    *,
+    save_every: int,
+    gravity: ArrayF64,
+    damping_constant: float | ArrayF64,
+    recorders: Mapping[str, Callable[[DiscreteCosseratRod], ArrayF64]],
+    history: Optional[SimulationHistory] = None,
+) -> tuple[ArrayF64, dict[str, ArrayF64]]:
+    """Step ``rod`` to ``final_time``, recording every ``save_every`` steps into preallocated buffers.
+
+    A single (unbatched) rod can also stream centerline and curvature into ``history``.
+    """
+
+    if save_every < 1:
+        raise ValueError("save_every must be a positive integer.")
+    n_steps = int(final_time / dt)
+    n_saved = n_steps // save_every + 1
+    time = np.empty(n_saved)
+    buffers: dict[str, ArrayF64] = {}
+
+    record = 0
+    for step in range(n_steps + 1):
+        if step % save_every == 0:
+            time[record] = step * dt
+            if history is not None:
+                history.record(step * dt, rod.position, rod.kappa)
+            for name, recorder in recorders.items():
+                value = np.asarray(recorder(rod))
+                if name not in buffers:
+                    buffers[name] = np.empty((n_saved,) + value.shape, dtype=value.dtype)
+                buffers[name][record] = value
+            record += 1
+        if step < n_steps:
+            position_verlet_step(rod, dt, gravity=gravity, damping_constant=damping_constant)
+    return time, buffers
+
+
+@dataclass
+class RelaxationReport:
+    """Outcome of :func:`relax_to_equilibrium`.
+
+    Attributes
+    ----------
+    converged:
+        Whether every rod met the tolerances before ``max_time``.
+    n_steps:
+        Time steps taken (rejected windows excluded).
+    time:
+        Simulated time at termination (s).
+    dt:
+        Time step in use at termination (s).
+    residual:
+        Largest node displacement over the last window divided by rod length, per rod.
+    kinetic_energy:
+        Kinetic energy at termination relative to its peak during the run, per rod.
+    """
+
+    converged: bool
+    n_steps: int
+    time: float
+    dt: float
+    residual: ArrayF64
+    kinetic_energy: ArrayF64
+
+
+def relax_to_equilibrium(
+    rod: DiscreteCosseratRod,
+    *,
+    gravity: ArrayF64,
+    damping_constant: float | ArrayF64,
+    dt: Optional[float] = None,
+    tol: float = 1e-6,
+    ke_tol: float = 1e-6,
+    window: int = 200,
+    max_time: float = 10.0,
+    adaptive_dt: bool = False,
+    cfl_safety: float = 0.9,
+    growth: float = 1.25,
+    dt_min: Optional[float] = None,
+) -> RelaxationReport:
+    """Integrate ``rod`` in place until it reaches its damped equilibrium.
+
+    Every ``window`` steps the run stops once, for every rod, the centerline moved by
+    less than ``tol`` rod lengths over the window and the kinetic energy fell below
+    ``ke_tol`` times its peak.
+
+    With ``adaptive_dt`` the step grows by ``growth`` after windows in which the
+    kinetic energy did not increase, up to ``stable_time_step(cfl_safety)``.  A window
+    that goes unstable (non-finite state or a jump of more than half a rod length) is
+    rolled back and retried with half the step; once the step would drop below
+    ``dt_min`` (default ``1e-6 * rod.stable_time_step()``) the run stops and returns a
+    non-converged report with the state of the last accepted window.
+    """
+
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+    dt_max = rod.stable_time_step(cfl_safety)
+    dt = rod.stable_time_step() if dt is None else float(dt)
+    dt_min = 1e-6 * rod.stable_time_step() if dt_min is None else float(dt_min)
+    if adaptive_dt:
+        dt = min(dt, dt_max)
+    length = rod.rest_lengths.sum(axis=-1)
+
+    time = 0.0
+    n_steps = 0
+    kinetic = rod.kinetic_energy()
+    peak = kinetic.copy()
+    residual = np.full(rod.batch_shape, np.inf)
+    converged = False
+
+    while time < max_time * (1.0 - 1e-12):
+        snapshot = rod.copy() if adaptive_dt else None
+        start_position = rod.position.copy()
+        kinetic_start = kinetic
+        n = max(1, min(window, int(np.ceil((max_time - time) / dt))))
+        for _ in range(n):
+            position_verlet_step(rod, dt, gravity=gravity, damping_constant=damping_constant)
+
+        displacement = np.abs(rod.position - start_position).max(axis=(-2, -1)) / length
+        if snapshot is not None and not (np.all(np.isfinite(rod.position)) and np.all(displacement < 0.5)):
+            for f in fields(rod):
+                setattr(rod, f.name, getattr(snapshot, f.name))
+            if 0.5 * dt < dt_min:
+                break
+            dt *= 0.5
+            continue
+
+        time += n * dt
+        n_steps += n
+        kinetic = rod.kinetic_energy()
+        peak = np.maximum(peak, kinetic)
+        residual = displacement
+        if np.all(residual < tol) and np.all(kinetic <= ke_tol * peak):
+            converged = True
+            break
+        if adaptive_dt and np.all(kinetic <= kinetic_start):
+            dt = min(dt * growth, dt_max)
+
+    relative_kinetic = np.divide(kinetic, peak, out=np.zeros_like(kinetic), where=peak > 0)
+    return RelaxationReport(
+        converged=converged,
+        n_steps=n_steps,
+        time=time,
+        dt=dt,
+        residual=residual,
+        kinetic_energy=relative_kinetic,
+    )
+
+
+class NumpyCounterCurvatureRodSystem:
+    """Drop-in replacement for :class:`~.pyelastica_bridge.CounterCurvatureRodSystem`.
+
+    Uses :class:`DiscreteCosseratRod` instead of PyElastica.  Unlike the PyElastica
+    bridge, the information-modulated stiffness ``E_eff(s)`` is applied per element.
+    """
+
+    def __init__(self, rod: DiscreteCosseratRod, info_field: InfoField1D, params: CounterCurvatureParams):
+        self.rod = rod
+        self.info_field = info_field
+        self.params = params
+        self.n_elements = rod.n_elems
+        self.length = float(np.sum(rod.rest_lengths))
+
+    @classmethod
+    def from_iec(
+        cls,
+        info: InfoField1D,
+        params: CounterCurvatureParams,
+        length: float,
+        n_elements: int,
+        *,
+        E0: float = 1e6,
+        nu: float = 0.5,
+        rho: float = 1000.0,
+        radius: float = 0.01,
+        kappa_gen: Optional[ArrayF64] = None,
+        gravity: float = 9.81,
+        base_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
+        base_direction: tuple[float, float, float] = (0.0, 0.0, 1.0),
+        normal: tuple[float, float, float] = (0.0, 1.0, 0.0),
+    ) -> "NumpyCounterCurvatureRodSystem":
+        """Build the rod from an information field (same arguments as the PyElastica bridge)."""
+
+        s_rod = np.linspace(0.0, float(info.s[-1] - info.s[0]), n_elements + 1) + info.s[0]
+        s_elements = 0.5 * (s_rod[:-1] + s_rod[1:])
+        E_eff = np.interp(s_elements, info.s, compute_effective_stiffness(info, params, E0))
+
+        rod = DiscreteCosseratRod.straight_rod(
+            n_elements=n_elements,
+            start=np.array(base_position),
+            direction=np.array(base_direction),
+            normal=np.array(normal),
+            base_length=length,
+            base_radius=radius,
+            density=rho,
+            youngs_modulus=E_eff,
+            shear_modulus=E_eff / (2.0 * (1.0 + nu)),
+        )
+
+        if kappa_gen is None:
+            kappa_gen = np.zeros(info.n_points)
+        kappa_rest = compute_rest_curvature(info, params, kappa_gen)
+        # Curvature about d2 bends the rod towards the normal d1 (sagittal plane), as in the bridge.
+        rod.rest_kappa[1] = np.interp(s_rod[1:-1], info.s, kappa_rest)
+
+        return cls(rod=rod, info_field=info, params=params)
+
+    def run_simulation(
+        self,
+        final_time: float,
+        dt: float,
+        *,
+        save_every: int = 100,
+        gravity: float = 9.81,
+        damping_constant: float = 0.5,
+        history_path: Optional[Path | str] = None,
+        max_frames: Optional[int] = None,
+    ) -> SimulationResult:
+        """Integrate to ``final_time`` and record every ``save_every`` steps (plus the initial state).
+
+        ``history_path`` and ``max_frames`` configure the :class:`SimulationHistory` as in
+        the PyElastica bridge.
+        """
+
+        if save_every < 1:
+            raise ValueError("save_every must be a positive integer.")
+        history = SimulationHistory(
+            SimulationHistory.frames_for(final_time, dt, save_every),
+            self.rod.n_elems + 1,
+            path=history_path,
+            max_frames=max_frames,
+        )
+        _integrate(
+            self.rod,
+            final_time,
+            dt,
+            save_every=save_every,
+            gravity=np.array([0.0, 0.0, -gravity]),
+            damping_constant=damping_constant,
+            recorders={},
+            history=history,
+        )
+        return history.to_result(self.info_field)
+
+    def relax(
+        self,
+        *,
+        gravity: float = 9.81,
+        damping_constant: float = 0.5,
+        **kwargs,
+    ) -> tuple[SimulationResult, RelaxationReport]:
+        """Run to the damped equilibrium instead of a fixed ``final_time``.
+
+        Keyword arguments are passed to :func:`relax_to_equilibrium`.  The returned
+        :class:`SimulationResult` holds the final (equilibrium) frame only.
+        """
+
+        report = relax_to_equilibrium(
+            self.rod,
+            gravity=np.array([0.0, 0.0, -gravity]),
+            damping_constant=damping_constant,
+            **kwargs,
+        )
+        result = SimulationResult(
+            time=np.array([report.time]),
+            centerline=self.rod.position.T[None].copy(),
+            curvature=_padded_curvature(self.rod)[None],
+            info_field=self.info_field,
+        )
+        return result, report
+
+
+@dataclass
+class EnsembleSimulationResult:
+    """Histories of an ensemble run; indexing yields per-rod :class:`SimulationResult` objects.
+
+    Attributes
+    ----------
+    time:
+        Recorded times, shape ``(n_saved,)``.
+    centerline:
+        Node positions, shape ``(N, n_saved, n_nodes, 3)``.
+    curvature:
+        Curvature magnitude on nodes, shape ``(N, n_saved, n_nodes)``.
+    info_fields:
+        Information field of each rod.
+    diagnostics:
+        Outputs of user recorders, each of shape ``(N, n_saved, ...)``.
+    """
+
+    time: ArrayF64
+    centerline: ArrayF64
+    curvature: ArrayF64
+    info_fields: Sequence[InfoField1D]
+    diagnostics: dict[str, ArrayF64] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return int(self.centerline.shape[0])
+
+    def __getitem__(self, index: int) -> SimulationResult:
+        return SimulationResult(
+            time=self.time,
+            centerline=self.centerline[index],
+            curvature=self.curvature[index],
+            info_field=self.info_fields[index],
+        )
+
+
+class CounterCurvatureRodEnsemble:
+    """``N`` NumPy rods with different information fields, couplings or gravity, stepped together.
+
+    All rods share the number of elements; everything else (length, material, rest
+    curvature, loading) may differ.  State is stored as ``(N, 3, n_nodes)`` arrays.
+    """
+
+    def __init__(
+        self,
+        rod: DiscreteCosseratRod,
+        info_fields: Sequence[InfoField1D],
+        params: Sequence[CounterCurvatureParams],
+    ):
+        self.rod = rod
+        self.info_fields = list(info_fields)
+        self.params = list(params)
+        self.n_rods = len(self.info_fields)
+        self.n_elements = rod.n_elems
+
+    @classmethod
+    def from_members(cls, systems: Sequence[NumpyCounterCurvatureRodSystem]) -> "CounterCurvatureRodEnsemble":
+        """Batch already constructed single-rod systems."""
+
+        return cls(
+            rod=DiscreteCosseratRod.stack([system.rod for system in systems]),
+            info_fields=[system.info_field for system in systems],
+            params=[system.params for system in systems],
+        )
+
+    @classmethod
+    def from_iec(
+        cls,
+        info: InfoField1D | Sequence[InfoField1D],
+        params: CounterCurvatureParams | Sequence[CounterCurvatureParams],
+        length: float,
+        n_elements: int,
+        **kwargs,
+    ) -> "CounterCurvatureRodEnsemble":
+        """Build one rod per (information field, coupling) pair.
+
+        A single field or parameter set is broadcast against a sequence of the other;
+        remaining keyword arguments are passed to
+        :meth:`NumpyCounterCurvatureRodSystem.from_iec`.
+        """
+
+        infos = [info] if isinstance(info, InfoField1D) else list(info)
+        params_list = [params] if isinstance(params, CounterCurvatureParams) else list(params)
+        n_rods = max(len(infos), len(params_list))
+        if {len(infos), len(params_list)} - {1, n_rods}:
+            raise ValueError("info and params must have the same length (or length 1).")
+        infos = infos * n_rods if len(infos) == 1 else infos
+        params_list = params_list * n_rods if len(params_list) == 1 else params_list
+
+        return cls.from_members(
+            [
+                NumpyCounterCurvatureRodSystem.from_iec(i, p, length, n_elements, **kwargs)
+                for i, p in zip(infos, params_list)
+            ]
+        )
+
+    def run_simulation(
+        self,
+        final_time: float,
+        dt: float,
+        *,
+        save_every: int = 100,
+        gravity: float | Sequence[float] = 9.81,
+        damping_constant: float | Sequence[float] = 0.5,
+        recorders: Optional[Mapping[str, Callable[[DiscreteCosseratRod], ArrayF64]]] = None,
+    ) -> EnsembleSimulationResult:
+        """Integrate all rods in one time loop.
+
+        Parameters
+        ----------
+        gravity, damping_constant:
+            Scalars or one value per rod.
+        recorders:
+            Extra per-rod diagnostics: ``name -> f(rod)`` evaluated on the batched rod
+            every ``save_every`` steps, returning arrays with leading axis ``N``.
+        """
+
+        g, damping = self._loads(gravity, damping_constant)
+
+        all_recorders = {
+            "centerline": lambda rod: np.swapaxes(rod.position, -1, -2),
+            "curvature": _padded_curvature,
+            **(recorders or {}),
+        }
+        time, history = _integrate(
+            self.rod,
+            final_time,
+            dt,
+            save_every=save_every,
+            gravity=g,
+            damping_constant=damping,
+            recorders=all_recorders,
+        )
+        # (n_saved, N, ...) -> (N, n_saved, ...)
+        history = {name: np.moveaxis(values, 0, 1) for name, values in history.items()}
+        return EnsembleSimulationResult(
+            time=time,
+            centerline=history.pop("centerline"),
+            curvature=history.pop("curvature"),
+            info_fields=self.info_fields,
+            diagnostics=history,
+        )
+
+    def relax(
+        self,
+        *,
+        gravity: float | Sequence[float] = 9.81,
+        damping_constant: float | Sequence[float] = 0.5,
+        **kwargs,
+    ) -> tuple[EnsembleSimulationResult, RelaxationReport]:
+        """Run all rods to their damped equilibria (see :func:`relax_to_equilibrium`).
+
+        The ensemble stops when the slowest rod has converged; the result holds the
+        final frame of every rod.
+        """
+
+        g, damping = self._loads(gravity, damping_constant)
+        report = relax_to_equilibrium(self.rod, gravity=g, damping_constant=damping, **kwargs)
+        result = EnsembleSimulationResult(
+            time=np.array([report.time]),
+            centerline=np.swapaxes(self.rod.position, -1, -2)[:, None].copy(),
+            curvature=_padded_curvature(self.rod)[:, None],
+            info_fields=self.info_fields,
+        )
+        return result, report
+
+    def _loads(
+        self, gravity: float | Sequence[float], damping_constant: float | Sequence[float]
+    ) -> tuple[ArrayF64, ArrayF64]:
+        g = np.zeros((self.n_rods, 3))
+        g[:, 2] = -np.broadcast_to(np.asarray(gravity, dtype=float), (self.n_rods,))
+        damping = np.broadcast_to(np.asarray(damping_constant, dtype=float), (self.n_rods,))
+        return g, damping
+
+
+__all__ = [
+    "CounterCurvatureRodEnsemble",
+    "DiscreteCosseratRod",
+    "EnsembleSimulationResult",
+    "NumpyCounterCurvatureRodSystem",
+    "RelaxationReport",
+    "position_verlet_step",
+    "relax_to_equilibrium",
+]
@@ -9,7 +9,8 @@ bending when fed to a Cosserat rod solver (e.g. PyElastica).
 
 from __future__ import annotations
 
-from typing import NamedTuple
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -142,3 +143,118 @@ def compute_active_moments(info: InfoField1D, params: CounterCurvatureParams) ->
 
     grad = params.nondimensional_gradient(info.dIds)
     return params.chi_M * grad
+
+
+def _scaled(chi: float | ArrayF64, basis: ArrayF64, out: Optional[ArrayF64]) -> ArrayF64:
+    """``chi[..., None] * basis`` written into ``out`` when given."""
+
+    chi = np.asarray(chi, dtype=float)
+    return np.multiply(chi[..., None], basis, out=out)
+
+
+@dataclass(frozen=True)
+class CouplingBasis:
+    """Coupling terms of a fixed information field, precomputed for χ sweeps.
+
+    The IEC couplings are linear in the gains: ``κ_rest = κ_gen + χ_κ · g``,
+    ``E_eff = E0 (1 + χ_E · I)`` and ``M_info = χ_M · g`` with the scaled gradient
+    ``g = scale_length · ∂I/∂s``.  Building the basis once per information field
+    removes the gradient scaling from the inner loop of parameter sweeps.
+
+    Every method accepts a scalar gain, returning an ``(n_points,)`` profile exactly
+    equal to the corresponding ``compute_*`` function, or an array of gains with shape
+    ``(...)``, returning ``(..., n_points)`` profiles.  ``out`` may be a preallocated
+    buffer of that shape to avoid allocation.
+
+    Example
+    -------
+    >>> basis = CouplingBasis.from_info(info, scale_length=1.0)
+    >>> kappa_rest = basis.rest_curvature(np.linspace(0.0, 0.08, 17), kappa_gen)
+    """
+
+    s: ArrayF64
+    I: ArrayF64
+    gradient: ArrayF64
+    scale_length: float = 1.0
+
+    @classmethod
+    def from_info(cls, info: InfoField1D, scale_length: float = 1.0) -> "CouplingBasis":
+        """Precompute the basis for ``info`` (``scale_length`` as in :class:`CounterCurvatureParams`)."""
+
+        gradient = CounterCurvatureParams(scale_length=scale_length).nondimensional_gradient(info.dIds)
+        return cls(
+            s=np.asarray(info.s, dtype=float),
+            I=np.asarray(info.I, dtype=float),
+            gradient=np.asarray(gradient, dtype=float),
+            scale_length=float(scale_length),
+        )
+
+    def rest_curvature(
+        self,
+        chi_kappa: float | ArrayF64,
+        kappa_gen: Optional[ArrayF64] = None,
+        *,
+        out: Optional[ArrayF64] = None,
+    ) -> ArrayF64:
+        """Rest curvature ``κ_gen + χ_κ · g`` (see :func:`compute_rest_curvature`)."""
+
+        result = _scaled(chi_kappa, self.gradient, out)
+        if kappa_gen is not None:
+            kappa_gen = np.asarray(kappa_gen, dtype=float)
+            if kappa_gen.shape != self.s.shape:
+                raise ValueError("All arrays must share the same shape as the information grid.")
+            np.add(kappa_gen, result, out=result)
+        return result
+
+    def effective_stiffness(
+        self,
+        chi_E: float | ArrayF64,
+        E0: float,
+        *,
+        model: str = "linear",
+        out: Optional[ArrayF64] = None,
+    ) -> ArrayF64:
+        """Stiffness ``E_eff`` for one or many ``χ_E`` (see :func:`compute_effective_stiffness`)."""
+
+        if E0 <= 0.0:
+            raise ValueError("Baseline stiffness E0 must be positive.")
+        if model not in ("linear", "exponential"):
+            raise ValueError(f"Unsupported stiffness coupling model: {model}")
+        result = _scaled(chi_E, self.I, out)
+        if model == "linear":
+            np.add(1.0, result, out=result)
+        else:
+            np.exp(result, out=result)
+        return np.multiply(E0, result, out=result)
+
+    def active_moments(
+        self, chi_M: float | ArrayF64, *, out: Optional[ArrayF64] = None
+    ) -> ArrayF64:
+        """Active moment ``χ_M · g`` (see :func:`compute_active_moments`)."""
+
+        return _scaled(chi_M, self.gradient, out)
+
+    def evaluate(
+        self,
+        params: CounterCurvatureParams,
+        E0: float,
+        kappa_gen: Optional[ArrayF64] = None,
+        *,
+        model: str = "linear",
+    ) -> tuple[ArrayF64, ArrayF64, ArrayF64]:
+        """Return ``(κ_rest, E_eff, M_info)`` for one parameter set.
+
+        ``params.scale_length`` is fixed when the basis is built and must match
+        :attr:`scale_length`; build a new basis to change it.
+        """
+
+        if params.scale_length != self.scale_length:
+            raise ValueError(
+                f"params.scale_length={params.scale_length} differs from the basis scale_length="
+                f"{self.scale_length}; rebuild the basis with CouplingBasis.from_info."
+            )
+        return (
+            self.rest_curvature(params.chi_kappa, kappa_gen),
+            self.effective_stiffness(params.chi_E, E0, model=model),
+            self.active_moments(params.chi_M),
+        )
@@ -0,0 +1,238 @@
+"""Quasi-static evolution of countercurvature under time-varying information fields.
+
+Mechanical relaxation of the rod is fast compared with growth, remodelling or neural
+adaptation, so the response to an information programme ``I(s, t)`` is a sequence of
+equilibria: at every time step the information slice is interpolated from an
+:class:`~spinalmodes.countercurvature.info_fields.InfoFieldTimeSeries`, mapped through
+the IEC couplings and passed to a static beam solve.
+
+The default solver is the closed-form cantilever of :func:`spinalmodes.iec.solve_beam_static`,
+which carries no state between steps; only the recorded (decimated) steps are solved, in
+vectorised chunks.  A custom ``solver`` (e.g. an iterative nonlinear solve) is marched
+through every step and warm-started from the previous equilibrium;
+:func:`elastica_solver` provides one for large deflections.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+from spinalmodes.iec import solve_beam_elastica, solve_beam_static_batch
+
+from .coupling import (
+    CounterCurvatureParams,
+    compute_active_moments,
+    compute_effective_stiffness,
+    compute_rest_curvature,
+)
+from .info_fields import InfoField1D, InfoFieldTimeSeries
+
+ArrayF64 = NDArray[np.float64]
+
+# solver(s, kappa_rest, E_eff, M_active, distributed_load, previous) -> (theta, kappa)
+# ``previous`` is the (theta, kappa) equilibrium of the preceding step, or None at t0.
+QuasiStaticSolver = Callable[
+    [ArrayF64, ArrayF64, ArrayF64, ArrayF64, float, Optional[Tuple[ArrayF64, ArrayF64]]],
+    Tuple[ArrayF64, ArrayF64],
+]
+
+
+@dataclass(frozen=True)
+class QuasiStaticTrajectory:
+    """Recorded equilibria of a quasi-static evolution.
+
+    Attributes
+    ----------
+    times:
+        Times of the recorded steps, shape ``(n_out,)``.
+    s:
+        Arc-length grid (metres).
+    theta, kappa:
+        Deflection angle (rad) and realised curvature (1/m), shape ``(n_out, n_points)``.
+    kappa_rest:
+        Information-biased rest curvature driving each recorded step.
+    step_index:
+        Index of each recorded step in the full time vector.
+    """
+
+    times: ArrayF64
+    s: ArrayF64
+    theta: ArrayF64
+    kappa: ArrayF64
+    kappa_rest: ArrayF64
+    step_index: NDArray[np.int64]
+
+    @property
+    def n_records(self) -> int:
+        """Number of recorded time steps."""
+
+        return int(self.times.size)
+
+
+def elastica_solver(*, I_moment: float = 1e-8, P_load: float = 100.0, **kwargs) -> QuasiStaticSolver:
+    """Large-deflection :class:`QuasiStaticSolver` built on :func:`spinalmodes.iec.solve_beam_elastica`.
+
+    Each step's Newton iteration starts from the previous equilibrium angle, so slowly
+    varying programmes converge in a few iterations.  Extra keyword arguments (e.g.
+    ``load_steps``, ``tol``) are forwarded to the solver.
+    """
+
+    def solve(
+        s: ArrayF64,
+        kappa_rest: ArrayF64,
+        E_eff: ArrayF64,
+        M_active: ArrayF64,
+        distributed_load: float,
+        previous: Optional[Tuple[ArrayF64, ArrayF64]],
+    ) -> Tuple[ArrayF64, ArrayF64]:
+        return solve_beam_elastica(
+            s,
+            kappa_rest,
+            E_eff,
+            M_active,
+            I_moment=I_moment,
+            P_load=P_load,
+            distributed_load=distributed_load,
+            theta_init=None if previous is None else previous[0],
+            **kwargs,
+        )
+
+    return solve
+
+
+def _output_steps(n_steps: int, output_stride: int) -> NDArray[np.int64]:
+    if output_stride < 1:
+        raise ValueError("output_stride must be a positive integer.")
+    steps = np.arange(0, n_steps, output_stride)
+    if steps[-1] != n_steps - 1:
+        steps = np.append(steps, n_steps - 1)
+    return steps
+
+
+def evolve_quasi_static(
+    series: InfoFieldTimeSeries,
+    params: CounterCurvatureParams,
+    times: ArrayF64,
+    *,
+    E0: float = 1e9,
+    I_moment: float = 1e-8,
+    gravity: float | Callable[[ArrayF64], ArrayF64] = 9.81,
+    rho_area: float = 0.1,
+    P_load: float = 100.0,
+    kappa_gen: Optional[ArrayF64] = None,
+    stiffness_model: str = "linear",
+    interpolation: str = "linear",
+    output_stride: int = 1,
+    solver: Optional[QuasiStaticSolver] = None,
+    chunk_size: int = 1024,
+) -> QuasiStaticTrajectory:
+    """Drive the beam through a time-varying information programme.
+
+    Parameters
+    ----------
+    series:
+        Information keyframes ``I(s, t_k)``.
+    params:
+        IEC coupling parameters.
+    times:
+        Strictly increasing time steps to simulate (same units as ``series.times``).
+    E0, I_moment:
+        Baseline Young's modulus (Pa) and second moment of area (m^4).
+    gravity:
+        Gravitational acceleration (m/s²), either constant or a vectorised callable
+        ``g(times)`` describing the loading protocol (e.g. a microgravity exposure).
+    rho_area:
+        Mass per unit length (kg/m); the distributed load is ``rho_area * g``.
+    P_load:
+        Tip load (N), as in :func:`spinalmodes.iec.solve_beam_static`.
+    kappa_gen:
+        Baseline geometric curvature; zero if omitted.
+    stiffness_model:
+        Passed to :func:`~spinalmodes.countercurvature.coupling.compute_effective_stiffness`.
+    interpolation:
+        Temporal interpolation of the keyframes: ``"nearest"``, ``"linear"`` or ``"cubic"``.
+    output_stride:
+        Record every ``output_stride``-th step (the final step is always recorded).
+    solver:
+        Optional stateful static solver, called once per step with the previous
+        equilibrium as warm start.  Defaults to the closed-form cantilever solve.
+    chunk_size:
+        Number of steps whose information slices are interpolated per batch.
+
+    Returns
+    -------
+    QuasiStaticTrajectory
+        Recorded equilibria in preallocated ``(n_out, n_points)`` arrays.
+    """
+
+    times = np.asarray(times, dtype=float)
+    if times.ndim != 1 or times.size == 0:
+        raise ValueError("times must be a non-empty one-dimensional array.")
+    if np.any(np.diff(times) <= 0.0):
+        raise ValueError("times must be strictly increasing.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    s = np.asarray(series.s, dtype=float)
+    kappa_gen = np.zeros_like(s) if kappa_gen is None else np.asarray(kappa_gen, dtype=float)
+    loads = rho_area * np.broadcast_to(
+        np.asarray(gravity(times) if callable(gravity) else gravity, dtype=float), times.shape
+    )
+
+    steps = _output_steps(times.size, output_stride)
+    theta_out = np.empty((steps.size, s.size))
+    kappa_out = np.empty_like(theta_out)
+    kappa_rest_out = np.empty_like(theta_out)
+
+    def coupled_fields(step_slice: NDArray[np.int64]) -> tuple[ArrayF64, ArrayF64, ArrayF64]:
+        I, dIds = series.sample(times[step_slice], kind=interpolation)
+        # Stacked (n_chunk, n_points) slices broadcast through the coupling rules.
+        info = InfoField1D(s=s, I=I, dIds=dIds)
+        kappa_rest = compute_rest_curvature(info, params, kappa_gen)
+        E_eff = compute_effective_stiffness(info, params, E0, model=stiffness_model)
+        M_active = np.broadcast_to(compute_active_moments(info, params), I.shape)
+        return kappa_rest, E_eff, M_active
+
+    if solver is None:
+        # No state to carry: solve the recorded steps only.
+        for start in range(0, steps.size, chunk_size):
+            block = slice(start, start + chunk_size)
+            kappa_rest, E_eff, M_active = coupled_fields(steps[block])
+            theta_out[block], kappa_out[block] = solve_beam_static_batch(
+                s,
+                kappa_rest,
+                E_eff,
+                M_active,
+                I_moment=I_moment,
+                P_load=P_load,
+                distributed_load=loads[steps[block]],
+            )
+            kappa_rest_out[block] = kappa_rest
+    else:
+        previous: Optional[Tuple[ArrayF64, ArrayF64]] = None
+        record = 0
+        for start in range(0, times.size, chunk_size):
+            chunk = np.arange(start, min(start + chunk_size, times.size))
+            kappa_rest, E_eff, M_active = coupled_fields(chunk)
+            for k, step in enumerate(chunk):
+                previous = solver(s, kappa_rest[k], E_eff[k], M_active[k], float(loads[step]), previous)
+                if record < steps.size and step == steps[record]:
+                    theta_out[record], kappa_out[record] = previous
+                    kappa_rest_out[record] = kappa_rest[k]
+                    record += 1
+
+    return QuasiStaticTrajectory(
+        times=times[steps],
+        s=s,
+        theta=theta_out,
+        kappa=kappa_out,
+        kappa_rest=kappa_rest_out,
+        step_index=steps,
+    )
+
+
+__all__ = ["QuasiStaticSolver", "QuasiStaticTrajectory", "elastica_solver", "evolve_quasi_static"]
@@ -13,7 +13,7 @@ mechanics.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Callable, NamedTuple, Sequence
 
 import numpy as np
@@ -151,14 +151,18 @@ class InfoFieldTimeSeries:
     """Time-resolved information field sequence.
 
     This container allows experiments to prescribe dynamic countercurvature programmes
-    ``I(s, t)`` where each time slice is represented by an :class:`InfoField1D`.  The class
-    primarily stores metadata and provides lightweight interpolation hooks for future
-    extensions.  For the initial implementation we support simple nearest-neighbour access
-    through :meth:`get_field_at`.
+    ``I(s, t)`` where each time slice is represented by an :class:`InfoField1D`.  Besides
+    nearest-neighbour access through :meth:`get_field_at`, slices can be interpolated in
+    time (:meth:`interpolate`, or :meth:`sample` for many times at once), which is what
+    the quasi-static evolution engine in :mod:`spinalmodes.countercurvature.evolution`
+    uses to drive long protocols from a handful of keyframes.
     """
 
     times: ArrayF64
     fields: Sequence[InfoField1D]
+    _I: ArrayF64 = field(init=False, repr=False, compare=False)
+    _dIds: ArrayF64 = field(init=False, repr=False, compare=False)
+    _spline: object = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "times", np.asarray(self.times, dtype=float))
@@ -169,6 +173,10 @@ class InfoFieldTimeSeries:
         if any(field.n_points != self.fields[0].n_points for field in self.fields):
             raise ValueError("All InfoField1D objects must share the same spatial discretisation.")
 
+        # Stacked (n_times, n_points) views used by the vectorised interpolation below.
+        object.__setattr__(self, "_I", np.stack([np.asarray(f.I, dtype=float) for f in self.fields]))
+        object.__setattr__(self, "_dIds", np.stack([np.asarray(f.dIds, dtype=float) for f in self.fields]))
+
     def get_field_at(self, time: float) -> InfoField1D:
         """Return the information field closest to ``time``.
 
@@ -186,3 +194,63 @@ class InfoFieldTimeSeries:
         """Number of time samples."""
 
         return int(self.times.size)
+
+    @property
+    def s(self) -> ArrayF64:
+        """Shared arc-length grid of all time slices."""
+
+        return self.fields[0].s
+
+    def sample(self, times: ArrayF64, *, kind: str = "linear") -> tuple[ArrayF64, ArrayF64]:
+        """Interpolate ``I`` and ``∂I/∂s`` at many times in one vectorised pass.
+
+        Parameters
+        ----------
+        times:
+            Query times; values outside ``[times[0], times[-1]]`` hold the end slices.
+        kind:
+            ``"nearest"`` (same rule as :meth:`get_field_at`), ``"linear"`` or ``"cubic"``
+            (not-a-knot cubic spline through the slices, via :mod:`scipy.interpolate`).
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            ``(I, dIds)``, each of shape ``(len(times), n_points)``.  Interpolation is
+            linear in the slices, so ``dIds`` is the exact spatial derivative of ``I``.
+        """
+
+        t = np.atleast_1d(np.asarray(times, dtype=float))
+        if t.ndim != 1:
+            raise ValueError("Query times must be a scalar or a one-dimensional array.")
+        if self.n_times > 1 and np.any(np.diff(self.times) <= 0.0):
+            raise ValueError("Time stamps must be strictly increasing for interpolation.")
+        if kind == "nearest" or self.n_times == 1:
+            idx = np.clip(np.searchsorted(self.times, t), 0, self.n_times - 1)
+            return self._I[idx], self._dIds[idx]
+
+        t = np.clip(t, self.times[0], self.times[-1])
+        if kind == "linear":
+            idx = np.clip(np.searchsorted(self.times, t, side="right") - 1, 0, self.n_times - 2)
+            w = ((t - self.times[idx]) / (self.times[idx + 1] - self.times[idx]))[:, None]
+            return (
+                (1.0 - w) * self._I[idx] + w * self._I[idx + 1],
+                (1.0 - w) * self._dIds[idx] + w * self._dIds[idx + 1],
+            )
+        if kind == "cubic":
+            if self._spline is None:
+                from scipy.interpolate import CubicSpline
+
+                stacked = np.stack([self._I, self._dIds], axis=1)
+                object.__setattr__(self, "_spline", CubicSpline(self.times, stacked, axis=0))
+            values = self._spline(t)
+            return values[:, 0], values[:, 1]
+        raise ValueError(f"Unsupported interpolation kind: {kind}")
+
+    def interpolate(self, time: float, *, kind: str = "linear") -> InfoField1D:
+        """Return the information field at ``time`` interpolated between slices.
+
+        See :meth:`sample` for the available ``kind`` options.
+        """
+
+        I, dIds = self.sample(np.array([time], dtype=float), kind=kind)
+        return InfoField1D(s=self.s, I=I[0], dIds=dIds[0])
@@ -9,7 +9,9 @@ modes.
 
 from __future__ import annotations
 
+import importlib.util
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 
 import numpy as np
@@ -25,17 +27,12 @@ from .info_fields import InfoField1D
 
 ArrayF64 = NDArray[np.float64]
 
-# Try to import PyElastica, but make it optional
-try:
+if TYPE_CHECKING:
     import elastica as ea
-    PYELASTICA_AVAILABLE = True
-except ImportError:
-    PYELASTICA_AVAILABLE = False
-    # Dummy classes
-    class ea:
-        class CosseratRod: pass
-        class NoForces: pass
-        class CallBackBaseClass: pass
+
+# PyElastica is optional and slow to import (numba); only probe for it here and
+# import it when a PyElastica-backed system is actually built or run.
+PYELASTICA_AVAILABLE = importlib.util.find_spec("elastica") is not None
 
 @dataclass
 class SimulationResult:
@@ -44,9 +41,90 @@ class SimulationResult:
     curvature: ArrayF64
     info_field: InfoField1D
 
-def _check_pyelastica() -> None:
+class SimulationHistory:
+    """Preallocated snapshot storage that builds a :class:`SimulationResult` without copies.
+
+    Frames are written in place into ``(n_frames, n_nodes, 3)`` centerline and
+    ``(n_frames, n_nodes)`` curvature arrays.  With ``path`` the arrays are ``.npy``
+    memory maps in that directory, so very long runs spill to disk instead of RAM.
+    With ``max_frames`` the buffers act as a ring that keeps only the latest frames.
+
+    Parameters
+    ----------
+    n_frames:
+        Number of frames that will be recorded (see :meth:`frames_for`).
+    n_nodes:
+        Nodes per centerline.
+    path:
+        Optional directory for memory-mapped storage.
+    max_frames:
+        Optional ring-buffer capacity.
+    """
+
+    def __init__(
+        self,
+        n_frames: int,
+        n_nodes: int,
+        *,
+        path: Optional[Path | str] = None,
+        max_frames: Optional[int] = None,
+    ):
+        capacity = int(n_frames if max_frames is None else min(n_frames, max_frames))
+        if capacity < 1:
+            raise ValueError("History must hold at least one frame.")
+        shapes = {"time": (capacity,), "centerline": (capacity, n_nodes, 3), "curvature": (capacity, n_nodes)}
+        if path is None:
+            arrays = {name: np.zeros(shape) for name, shape in shapes.items()}
+        else:
+            directory = Path(path)
+            directory.mkdir(parents=True, exist_ok=True)
+            arrays = {
+                name: np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", dtype=float, shape=shape)
+                for name, shape in shapes.items()
+            }
+        self.time = arrays["time"]
+        self.centerline = arrays["centerline"]
+        self.curvature = arrays["curvature"]
+        self.capacity = capacity
+        self.count = 0
+
+    @staticmethod
+    def frames_for(final_time: float, dt: float, save_every: int) -> int:
+        """Frames recorded by a run of ``int(final_time / dt)`` steps saving every ``save_every``."""
+
+        return int(final_time / dt) // int(save_every) + 1
+
+    def record(self, time: float, position: ArrayF64, kappa: ArrayF64) -> None:
+        """Store one frame.
+
+        ``position`` is ``(3, n_nodes)`` and ``kappa`` the ``(3, n_nodes - 2)`` curvature on
+        interior nodes; its magnitude is stored with zero padding at both ends.
+        """
+
+        i = self.count % self.capacity
+        self.time[i] = time
+        self.centerline[i] = position.T
+        np.sqrt(np.einsum("ij,ij->j", kappa, kappa), out=self.curvature[i, 1:-1])
+        self.count += 1
+
+    def to_result(self, info_field: InfoField1D) -> SimulationResult:
+        """Recorded frames in chronological order (views, unless the ring wrapped)."""
+
+        if self.count <= self.capacity:
+            frames = slice(0, self.count)
+            time, centerline, curvature = self.time[frames], self.centerline[frames], self.curvature[frames]
+        else:
+            order = np.roll(np.arange(self.capacity), -(self.count % self.capacity))
+            time, centerline, curvature = self.time[order], self.centerline[order], self.curvature[order]
+        return SimulationResult(time=time, centerline=centerline, curvature=curvature, info_field=info_field)
+
+
+def _check_pyelastica():
     if not PYELASTICA_AVAILABLE:
         raise ImportError("PyElastica is not installed.")
+    import elastica
+
+    return elastica
 
 class CounterCurvatureRodSystem:
     def __init__(self, rod: ea.CosseratRod, info_field: InfoField1D, params: CounterCurvatureParams):
@@ -73,8 +151,36 @@ class CounterCurvatureRodSystem:
         base_position: tuple[float, float, float] = (0.0, 0.0, 0.0),
         base_direction: tuple[float, float, float] = (0.0, 0.0, 1.0),
         normal: tuple[float, float, float] = (0.0, 1.0, 0.0),
+        backend: str = "auto",
     ) -> "CounterCurvatureRodSystem":
-        _check_pyelastica()
+        """Build a rod system from an information field.
+
+        ``backend`` selects ``"pyelastica"``, the built-in ``"numpy"`` rod
+        (:mod:`spinalmodes.countercurvature.cosserat_numpy`), or ``"auto"`` (PyElastica
+        when installed, NumPy otherwise).  Both backends share this signature and
+        :meth:`run_simulation` returns a :class:`SimulationResult` either way.
+        """
+        if backend not in ("auto", "pyelastica", "numpy"):
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == "numpy" or (backend == "auto" and not PYELASTICA_AVAILABLE):
+            from .cosserat_numpy import NumpyCounterCurvatureRodSystem
+
+            return NumpyCounterCurvatureRodSystem.from_iec(
+                info,
+                params,
+                length,
+                n_elements,
+                E0=E0,
+                nu=nu,
+                rho=rho,
+                radius=radius,
+                kappa_gen=kappa_gen,
+                gravity=gravity,
+                base_position=base_position,
+                base_direction=base_direction,
+                normal=normal,
+            )
+        ea = _check_pyelastica()
 
         # Create rod
         rod = ea.CosseratRod.straight_rod(
@@ -114,8 +220,15 @@ class CounterCurvatureRodSystem:
         save_every: int = 100,
         gravity: float = 9.81,
         damping_constant: float = 0.5,
+        history_path: Optional[Path | str] = None,
+        max_frames: Optional[int] = None,
     ) -> SimulationResult:
-        _check_pyelastica()
+        """Integrate to ``final_time``, saving a frame every ``save_every`` steps.
+
+        Frames go straight into a :class:`SimulationHistory`; ``history_path`` spills it
+        to memory-mapped files and ``max_frames`` keeps only the latest frames.
+        """
+        ea = _check_pyelastica()
 
         class CCSystem(ea.BaseSystemCollection, ea.Constraints, ea.Forcing, ea.Damping, ea.CallBacks):
             pass
@@ -134,33 +247,27 @@ class CounterCurvatureRodSystem:
 
         # Callback
         class CCCallback(ea.CallBackBaseClass):
-            def __init__(self, step_skip, results):
+            def __init__(self, step_skip, history):
                 super().__init__()
                 self.every = step_skip
-                self.results = results
+                self.history = history
             def make_callback(self, system, time, current_step):
                 if current_step % self.every == 0:
-                    self.results["time"].append(time)
-                    self.results["centerline"].append(system.position_collection.copy().T)
-                    self.results["curvature"].append(np.linalg.norm(system.kappa, axis=0))
+                    self.history.record(time, system.position_collection, system.kappa)
 
-        results = {"time": [], "centerline": [], "curvature": []}
-        system.collect_diagnostics(self.rod).using(CCCallback, step_skip=save_every, results=results)
+        # One spare frame in case the integrator also reports the final step.
+        history = SimulationHistory(
+            SimulationHistory.frames_for(final_time, dt, save_every) + 1,
+            self.n_elements + 1,
+            path=history_path,
+            max_frames=max_frames,
+        )
+        system.collect_diagnostics(self.rod).using(CCCallback, step_skip=save_every, history=history)
 
         system.finalize()
         timestepper = ea.PositionVerlet()
         ea.integrate(timestepper, system, final_time, int(final_time/dt))
 
-        # Pad curvature to match n_points
-        curv = np.array(results["curvature"])
-        padded_curv = np.zeros((curv.shape[0], curv.shape[1] + 2))
-        padded_curv[:, 1:-1] = curv
-
-        return SimulationResult(
-            time=np.array(results["time"]),
-            centerline=np.array(results["centerline"]),
-            curvature=padded_curv,
-            info_field=self.info_field
-        )
+        return history.to_result(self.info_field)
 
-__all__ = ["CounterCurvatureRodSystem", "SimulationResult", "PYELASTICA_AVAILABLE"]
+__all__ = ["CounterCurvatureRodSystem", "SimulationHistory", "SimulationResult", "PYELASTICA_AVAILABLE"]
@@ -11,6 +11,8 @@ This module provides:
 
 - A helper to classify "scoliotic regime" in the (χ_κ, g) phase diagram
 
+- Batched (n_cases, n_points) variants of the metrics and the classifier
+
 **Scientific Note**: The scoliosis metrics (S_lat, Cobb-like angle) are defined
 for coronal-plane coordinates (z, y) where z is longitudinal and y is lateral.
 In 2D sagittal beam models, we use a "pseudo-coronal" projection where the
@@ -300,6 +302,129 @@ def compute_scoliosis_metrics(
     )
 
 
+# -------------------------------------------------------------------------
+# 2b) Batched metrics over many configurations
+# -------------------------------------------------------------------------
+
+
+@dataclass
+class ScoliosisMetricsBatch:
+    """
+    Scoliosis-like metrics for many configurations at once.
+
+    Same fields as :class:`ScoliosisMetrics`, each an array of shape (n_cases,).
+    Indexing returns the :class:`ScoliosisMetrics` of a single case.
+    """
+
+    S_lat: np.ndarray
+    y_tip: np.ndarray
+    lat_dev_max: np.ndarray
+    cobb_like_deg: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.S_lat.shape[0])
+
+    def __getitem__(self, i: int) -> ScoliosisMetrics:
+        return ScoliosisMetrics(
+            S_lat=float(self.S_lat[i]),
+            y_tip=float(self.y_tip[i]),
+            lat_dev_max=float(self.lat_dev_max[i]),
+            cobb_like_deg=float(self.cobb_like_deg[i]),
+        )
+
+
+def _as_case_arrays(z: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Broadcast z, y to (n_cases, n_points); 1D inputs are a single case or shared z."""
+    z = np.atleast_2d(np.asarray(z, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    if z.ndim != 2 or y.ndim != 2 or z.shape[1] != y.shape[1]:
+        raise ValueError("z and y must be (n_cases, n_points) arrays with matching n_points.")
+    return np.broadcast_arrays(z, y)
+
+
+def _least_squares_slope(z: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Row-wise slope of the degree-1 least-squares fit y ≈ m z + c (same as np.polyfit)."""
+    dz = z - z.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    return np.einsum("ij,ij->i", dz, dy) / np.einsum("ij,ij->i", dz, dz)
+
+
+def compute_lateral_scoliosis_index_batch(
+    z: np.ndarray,
+    y: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized :func:`compute_lateral_scoliosis_index` over rows of (n_cases, n_points) arrays.
+
+    Returns
+    -------
+    S_lat, y_tip, lat_dev_max : np.ndarray
+        Arrays of shape (n_cases,).
+    """
+    z, y = _as_case_arrays(z, y)
+    lat_dev_max = np.max(np.abs(y), axis=1)
+    L_eff = np.max(z, axis=1) - np.min(z, axis=1)
+    if np.any(L_eff <= 0):
+        raise ValueError("z must span a positive length for S_lat.")
+    return lat_dev_max / L_eff, y[:, -1].copy(), lat_dev_max
+
+
+def cobb_like_angle_batch(
+    z: np.ndarray,
+    y: np.ndarray,
+    frac: float = 0.2,
+) -> np.ndarray:
+    """
+    Vectorized :func:`cobb_like_angle` over rows of (n_cases, n_points) arrays.
+
+    End-segment slopes come from the closed-form least-squares solution instead of
+    two ``np.polyfit`` calls per case.
+
+    Returns
+    -------
+    angle_deg : np.ndarray
+        Cobb-like angles in degrees, shape (n_cases,).
+    """
+    if not (0.0 < frac < 0.5):
+        raise ValueError("frac must be in (0, 0.5).")
+    z, y = _as_case_arrays(z, y)
+    k = max(3, int(frac * z.shape[1]))
+    m_bottom = _least_squares_slope(z[:, :k], y[:, :k])
+    m_top = _least_squares_slope(z[:, -k:], y[:, -k:])
+    return np.degrees(np.abs(np.arctan(m_top) - np.arctan(m_bottom)))
+
+
+def compute_scoliosis_metrics_batch(
+    z: np.ndarray,
+    y: np.ndarray,
+    frac: float = 0.2,
+) -> ScoliosisMetricsBatch:
+    """
+    Vectorized :func:`compute_scoliosis_metrics` for many centerlines.
+
+    Parameters
+    ----------
+    z : np.ndarray
+        Longitudinal coordinates, shape (n_cases, n_points) or (n_points,) if shared.
+    y : np.ndarray
+        Lateral coordinates, shape (n_cases, n_points).
+    frac : float
+        Fraction of points used for Cobb-like angle.
+
+    Returns
+    -------
+    metrics : ScoliosisMetricsBatch
+        Per-case metrics as arrays of shape (n_cases,).
+    """
+    S_lat, y_tip, lat_dev_max = compute_lateral_scoliosis_index_batch(z, y)
+    return ScoliosisMetricsBatch(
+        S_lat=S_lat,
+        y_tip=y_tip,
+        lat_dev_max=lat_dev_max,
+        cobb_like_deg=cobb_like_angle_batch(z, y, frac=frac),
+    )
+
+
 # -------------------------------------------------------------------------
 # 3) Regime classification for phase diagrams
 # -------------------------------------------------------------------------
@@ -384,3 +509,40 @@ def classify_scoliotic_regime(
         "scoliotic_regime": scoliotic_regime,
     }
 
+
+
+def classify_scoliotic_regime_batch(
+    D_geo_norm_sym: np.ndarray,
+    metrics_sym: ScoliosisMetricsBatch,
+    metrics_asym: ScoliosisMetricsBatch,
+    thresholds: RegimeThresholds | None = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized :func:`classify_scoliotic_regime` for whole phase-diagram grids.
+
+    Returns
+    -------
+    flags : dict
+        Boolean arrays for "gravity_dominated", "cooperative" and "scoliotic_regime".
+    """
+    if thresholds is None:
+        thresholds = RegimeThresholds()
+
+    D_geo_norm_sym = np.asarray(D_geo_norm_sym, dtype=float)
+    delta_cobb = metrics_asym.cobb_like_deg - metrics_sym.cobb_like_deg
+
+    gravity_dominated = (
+        (D_geo_norm_sym < thresholds.D_geo_small)
+        & (metrics_asym.S_lat < thresholds.S_lat_scoliotic)
+        & (delta_cobb < thresholds.cobb_scoliotic_deg)
+    )
+    scoliotic_regime = (
+        (D_geo_norm_sym > thresholds.D_geo_large)
+        & (metrics_asym.S_lat >= thresholds.S_lat_scoliotic)
+        & (delta_cobb >= thresholds.cobb_scoliotic_deg)
+    )
+    return {
+        "gravity_dominated": gravity_dominated,
+        "cooperative": ~gravity_dominated & ~scoliotic_regime,
+        "scoliotic_regime": scoliotic_regime,
+    }
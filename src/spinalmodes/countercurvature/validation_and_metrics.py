@@ -13,6 +13,7 @@ The key metrics are:
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from typing import Optional, TYPE_CHECKING
 
 import numpy as np
@@ -63,6 +64,73 @@ def compute_countercurvature_metric(
     return g_eff
 
 
+def trapezoid_weights(s: ArrayF64) -> ArrayF64:
+    """Quadrature weights ``w`` with ``w @ f == np.trapz(f, s)`` for any samples ``f``."""
+    s = np.asarray(s, dtype=float)
+    w = np.zeros_like(s)
+    if s.size > 1:
+        h = 0.5 * np.diff(s)
+        w[:-1] += h
+        w[1:] += h
+    return w
+
+
+@dataclass(frozen=True)
+class GeodesicDeviation:
+    """Geodesic curvature deviation against a fixed passive profile.
+
+    The ``g_eff``-weighted trapezoid weights and the passive base energy are computed
+    once, so evaluating many information-driven profiles reduces to one weighted
+    matrix-vector product.  ``kappa_passive`` may also be a stack ``(m, n)`` of
+    passive profiles, paired row by row with the ``kappa_info`` batches.
+
+    Example
+    -------
+    >>> deviation = GeodesicDeviation(s, g_eff, kappa_passive)
+    >>> D_geo_norm = deviation.evaluate(kappa_info_stack)["D_geo_norm"]
+    """
+
+    s: ArrayF64
+    g_eff: ArrayF64
+    kappa_passive: ArrayF64
+    eps: float = 1e-9
+    weights: ArrayF64 = field(init=False, repr=False, compare=False)
+    base_energy: ArrayF64 = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        s = np.asarray(self.s, dtype=float)
+        g_eff = np.asarray(self.g_eff, dtype=float)
+        kappa_passive = np.asarray(self.kappa_passive, dtype=float)
+        if s.ndim != 1 or g_eff.shape != s.shape or kappa_passive.shape[-1:] != s.shape:
+            raise ValueError("All input arrays must have the same shape.")
+
+        weights = g_eff * trapezoid_weights(s)
+        object.__setattr__(self, "s", s)
+        object.__setattr__(self, "g_eff", g_eff)
+        object.__setattr__(self, "kappa_passive", kappa_passive)
+        object.__setattr__(self, "weights", weights)
+        object.__setattr__(self, "base_energy", kappa_passive**2 @ weights)
+
+    def D_geo_sq(self, kappa_info: ArrayF64) -> ArrayF64:
+        """Squared deviation of ``(..., n)`` profiles, shape ``(...)``."""
+        kappa_info = np.asarray(kappa_info, dtype=float)
+        if kappa_info.shape[-1:] != self.s.shape:
+            raise ValueError("All input arrays must have the same shape.")
+        return (kappa_info - self.kappa_passive) ** 2 @ self.weights
+
+    def evaluate(self, kappa_info: ArrayF64) -> dict[str, ArrayF64]:
+        """``D_geo``, ``D_geo_sq``, ``D_geo_norm`` and ``base_energy`` for each profile."""
+        D_geo_sq = self.D_geo_sq(kappa_info)
+        D_geo = np.sqrt(np.maximum(D_geo_sq, 0.0))
+        base_energy = np.broadcast_to(self.base_energy, D_geo.shape)
+        return {
+            "D_geo": D_geo,
+            "D_geo_sq": D_geo_sq,
+            "D_geo_norm": D_geo / (np.sqrt(base_energy) + self.eps),
+            "base_energy": base_energy,
+        }
+
+
 def geodesic_curvature_deviation(
     s: ArrayF64,
     kappa_passive: ArrayF64,
@@ -70,31 +138,16 @@ def geodesic_curvature_deviation(
     g_eff: ArrayF64,
     eps: float = 1e-9,
 ) -> dict[str, float]:
-    """Geodesic curvature deviation between passive and information-driven profiles."""
+    """Geodesic curvature deviation between passive and information-driven profiles.
+
+    For many profiles against one passive baseline, build a :class:`GeodesicDeviation`
+    once instead.
+    """
     if not (s.shape == kappa_passive.shape == kappa_info.shape == g_eff.shape):
         raise ValueError("All input arrays must have the same shape.")
 
-    # Difference in curvature
-    dkappa = kappa_info - kappa_passive
-
-    # Weighted L2 distance in the countercurvature metric
-    integrand = g_eff * dkappa**2
-    D_geo_sq = float(np.trapz(integrand, s))
-    D_geo = float(np.sqrt(max(D_geo_sq, 0.0)))
-
-    # Baseline: passive curvature "energy" in g_eff
-    base_integrand = g_eff * kappa_passive**2
-    base_energy = float(np.trapz(base_integrand, s))
-
-    # Normalized distance (dimensionless)
-    D_geo_norm = D_geo / (np.sqrt(base_energy) + eps)
-
-    return {
-        "D_geo": D_geo,
-        "D_geo_sq": D_geo_sq,
-        "D_geo_norm": D_geo_norm,
-        "base_energy": base_energy,
-    }
+    result = GeodesicDeviation(s, g_eff, kappa_passive, eps=eps).evaluate(kappa_info)
+    return {k: float(v) for k, v in result.items()}
 
 def compute_comprehensive_metrics(
     result: "SimulationResult",
@@ -206,6 +259,8 @@ def compare_with_beam_solver(
 __all__ = [
     "compute_countercurvature_metric",
     "geodesic_curvature_deviation",
+    "GeodesicDeviation",
+    "trapezoid_weights",
     "compute_countercurvature_energy",
     "compute_effective_metric_deviation",
     "compute_shape_preservation_index",
@@ -0,0 +1,151 @@
+"""Adaptive quadtree sampling of 2D parameter maps near regime boundaries.
+
+Phase diagrams are mostly flat: large areas sit inside a single regime and only
+thin bands around regime boundaries carry information. :func:`quadtree_sample`
+starts from a coarse lattice, evaluates cell corners and recursively splits only
+cells whose corners disagree on a categorical label (regime flags, threshold bins
+of a metric, ...), down to single cells of the target lattice.
+
+Every sample lives on the fine ``(n_x, n_y)`` lattice, so the result can be
+scattered into a regular grid (:func:`fill_grid`) and plotted like a uniform
+sweep. Features smaller than a coarse cell that do not touch any of its corners
+are not detected; choose ``coarse_stride`` accordingly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, Mapping, Sequence
+
+import numpy as np
+
+from spinalmodes.utils.results_store import GridResults
+
+Cell = tuple[int, int, int]  # (i0, j0, stride) on the fine lattice
+Index = tuple[int, int]
+
+
+def _corners(cell: Cell) -> list[Index]:
+    i, j, h = cell
+    return [(i, j), (i + h, j), (i, j + h), (i + h, j + h)]
+
+
+def _children(cell: Cell) -> list[Cell]:
+    i, j, h = cell
+    k = h // 2
+    return [(i, j, k), (i + k, j, k), (i, j + k, k), (i + k, j + k, k)]
+
+
+def quadtree_sample(
+    evaluate: Callable[[Sequence[Index]], Sequence[Mapping[str, Any]]],
+    shape: tuple[int, int],
+    label: Callable[[Mapping[str, Any]], Hashable],
+    coarse_stride: int,
+) -> tuple[dict[Index, Mapping[str, Any]], list[Cell]]:
+    """Refine a 2D lattice only where ``label`` changes between cell corners.
+
+    Parameters
+    ----------
+    evaluate:
+        Called with a batch of lattice indices ``(i, j)``; returns one row
+        (mapping of outputs) per index. Batches are whole refinement levels, so
+        ``evaluate`` can parallelize them.
+    shape:
+        Fine lattice size ``(n_x, n_y)``; ``n - 1`` must be divisible by
+        ``coarse_stride`` along both axes.
+    label:
+        Maps a row to a hashable regime label. Cells with equal corner labels
+        are not refined further.
+    coarse_stride:
+        Power-of-two spacing (in fine lattice steps) of the initial grid.
+
+    Returns
+    -------
+    rows, leaves:
+        Evaluated rows keyed by lattice index, and the final (unsplit) cells.
+    """
+    n_x, n_y = shape
+    if coarse_stride < 1 or coarse_stride & (coarse_stride - 1):
+        raise ValueError("coarse_stride must be a positive power of two.")
+    if (n_x - 1) % coarse_stride or (n_y - 1) % coarse_stride:
+        raise ValueError("Lattice size minus one must be divisible by coarse_stride.")
+
+    rows: dict[Index, Mapping[str, Any]] = {}
+    labels: dict[Index, Hashable] = {}
+    cells = [
+        (i, j, coarse_stride)
+        for i in range(0, n_x - 1, coarse_stride)
+        for j in range(0, n_y - 1, coarse_stride)
+    ]
+    leaves: list[Cell] = []
+
+    while cells:
+        todo = [p for p in dict.fromkeys(c for cell in cells for c in _corners(cell)) if p not in rows]
+        if todo:
+            for p, row in zip(todo, evaluate(todo)):
+                rows[p] = row
+                labels[p] = label(row)
+
+        split = []
+        for cell in cells:
+            if cell[2] > 1 and len({labels[c] for c in _corners(cell)}) > 1:
+                split.append(cell)
+            else:
+                leaves.append(cell)
+        cells = [child for cell in split for child in _children(cell)]
+
+    return rows, leaves
+
+
+def fill_grid(
+    rows: Mapping[Index, Mapping[str, Any]],
+    leaves: Sequence[Cell],
+    axes: Mapping[str, np.ndarray],
+    metrics: Sequence[str],
+) -> GridResults:
+    """Scatter quadtree samples onto the full lattice.
+
+    Floating-point metrics are bilinearly interpolated inside unrefined leaves;
+    other dtypes (flags, counts) take the nearest corner value. Evaluated lattice
+    points always keep their exact values.
+
+    Returns
+    -------
+    GridResults
+        Filled grid over ``axes`` with the requested metrics plus a boolean
+        ``evaluated`` field marking the lattice points that were actually solved.
+    """
+    first = next(iter(rows.values()))
+    dtypes = {m: np.asarray(first[m]).dtype for m in metrics}
+    grid = GridResults(axes, {**dtypes, "evaluated": np.bool_})
+    idx = np.array(list(rows), dtype=int).reshape(-1, 2)
+    grid["evaluated"][idx[:, 0], idx[:, 1]] = True
+    exact = {m: np.array([rows[tuple(p)][m] for p in idx]) for m in metrics}
+
+    # Larger leaves first so finer (more accurate) neighbours overwrite shared edges.
+    for i, j, h in sorted(leaves, key=lambda c: -c[2]):
+        t = np.arange(h + 1) / h
+        tx, ty = t[:, None], t[None, :]
+        c00, c10, c01, c11 = (rows[c] for c in _corners((i, j, h)))
+        for m in metrics:
+            target = grid[m][i : i + h + 1, j : j + h + 1]
+            if np.issubdtype(target.dtype, np.floating):
+                target[...] = (
+                    (1 - tx) * (1 - ty) * c00[m]
+                    + tx * (1 - ty) * c10[m]
+                    + (1 - tx) * ty * c01[m]
+                    + tx * ty * c11[m]
+                )
+            else:
+                near_x, near_y = tx >= 0.5, ty >= 0.5
+                target[...] = np.where(
+                    near_x,
+                    np.where(near_y, c11[m], c10[m]),
+                    np.where(near_y, c01[m], c00[m]),
+                )
+
+    for m in metrics:
+        grid[m][idx[:, 0], idx[:, 1]] = exact[m]
+    return grid
+
+
+__all__ = ["quadtree_sample", "fill_grid"]
@@ -13,11 +13,10 @@ Usage:
 """
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 
 from spinalmodes.countercurvature import (
     CounterCurvatureParams,
@@ -25,14 +24,18 @@ from spinalmodes.countercurvature import (
     make_uniform_grid,
     compute_countercurvature_metric,
     geodesic_curvature_deviation,
-    compute_scoliosis_metrics,
+    compute_scoliosis_metrics_batch,
 )
-from spinalmodes.countercurvature.coupling import (
-    compute_active_moments,
-    compute_effective_stiffness,
-    compute_rest_curvature,
+from spinalmodes.countercurvature.coupling import CouplingBasis
+from spinalmodes.countercurvature.scoliosis_metrics import (
+    RegimeThresholds,
+    ScoliosisMetrics,
+    classify_scoliotic_regime,
 )
+from spinalmodes.experiments.countercurvature.adaptive_sampling import fill_grid, quadtree_sample
+from spinalmodes.experiments.countercurvature.sweep_runner import grid_points, run_sweep
 from spinalmodes.iec import solve_beam_static
+from spinalmodes.utils.results_store import GridResults
 
 
 def create_spinal_info_field(
@@ -88,6 +91,159 @@ def _reconstruct_centerline_2d(theta: np.ndarray, s: np.ndarray) -> np.ndarray:
     return np.column_stack([x, z])
 
 
+@lru_cache(maxsize=8)
+def _phase_setup(length: float, n_nodes: int, epsilon_asym: float):
+    """Grid, coupling bases and metric shared by every point of a sweep (cached per process)."""
+    s = make_uniform_grid(length, n_nodes)
+    info_field_sym = create_spinal_info_field(s, length, epsilon_asym=0.0)
+    info_field_asym = create_spinal_info_field(s, length, epsilon_asym=epsilon_asym)
+    g_eff_sym = compute_countercurvature_metric(info_field_sym, beta1=1.0, beta2=0.5)
+    basis_sym = CouplingBasis.from_info(info_field_sym, scale_length=1.0)
+    basis_asym = CouplingBasis.from_info(info_field_asym, scale_length=1.0)
+    return s, basis_sym, basis_asym, g_eff_sym
+
+
+def compute_phase_point(
+    chi_kappa: float,
+    gravity: float,
+    length: float = 0.4,
+    n_nodes: int = 100,
+    chi_E: float = 0.1,
+    E0: float = 1e9,
+    I_moment: float = 1e-8,
+    epsilon_asym: float = 0.01,
+) -> dict:
+    """Evaluate one (χ_κ, g) point of the phase diagram.
+
+    Module-level so the sweep runner can ship it to worker processes.
+
+    Returns
+    -------
+    dict
+        Geodesic-deviation and scoliosis metrics for the point.
+    """
+    s, basis_sym, basis_asym, g_eff_sym = _phase_setup(length, n_nodes, epsilon_asym)
+    kappa_gen = np.zeros_like(s)
+    gravity_load = 1000.0 * 1e-4 * gravity  # rho*A*g
+
+    # Passive case (no info coupling, symmetric)
+    params_passive = CounterCurvatureParams(chi_kappa=0.0, chi_E=0.0, chi_M=0.0)
+    kappa_rest_passive = basis_sym.rest_curvature(params_passive.chi_kappa, kappa_gen)
+    E_passive = np.full_like(s, E0)
+    M_passive = np.zeros_like(s)
+    _, kappa_passive = solve_beam_static(
+        s, kappa_rest_passive, E_passive, M_passive,
+        I_moment=I_moment, distributed_load=gravity_load
+    )
+
+    # Info-driven case (symmetric)
+    params_info = CounterCurvatureParams(
+        chi_kappa=chi_kappa, chi_E=chi_E, chi_M=0.0, scale_length=1.0
+    )
+    kappa_rest_info_sym, E_info_sym, M_info_sym = basis_sym.evaluate(params_info, E0, kappa_gen)
+    _, kappa_info_sym = solve_beam_static(
+        s, kappa_rest_info_sym, E_info_sym, M_info_sym,
+        I_moment=I_moment, distributed_load=gravity_load
+    )
+
+    # Info-driven case (asymmetric) - for scoliosis regime detection
+    kappa_rest_info_asym, E_info_asym, M_info_asym = basis_asym.evaluate(params_info, E0, kappa_gen)
+    theta_asym, kappa_info_asym = solve_beam_static(
+        s, kappa_rest_info_asym, E_info_asym, M_info_asym,
+        I_moment=I_moment, distributed_load=gravity_load
+    )
+    centerline_asym = _reconstruct_centerline_2d(theta_asym, s)
+
+    # Extract pseudo-coronal coordinates for scoliosis metrics
+    # Note: This is a 2D approximation; full 3D would use actual coronal-plane coordinates
+    z_asym, y_asym = extract_pseudo_coronal_coords(centerline_asym)
+
+    # Also compute symmetric case for comparison
+    theta_sym, _ = solve_beam_static(
+        s, kappa_rest_info_sym, E_info_sym, M_info_sym,
+        I_moment=I_moment, distributed_load=gravity_load
+    )
+    centerline_sym = _reconstruct_centerline_2d(theta_sym, s)
+    z_sym, y_sym = extract_pseudo_coronal_coords(centerline_sym)
+
+    # Both centerlines in one vectorized call (closed-form end-segment fits)
+    scoliosis_metrics_asym, scoliosis_metrics_sym = compute_scoliosis_metrics_batch(
+        np.stack([z_asym, z_sym]), np.stack([y_asym, y_sym]), frac=0.2
+    )
+
+    # Compute geodesic deviation (symmetric case)
+    geo_metrics = geodesic_curvature_deviation(
+        s, kappa_passive, kappa_info_sym, g_eff_sym
+    )
+
+    # Compute passive curvature energy (for reference)
+    passive_energy = np.trapz(kappa_passive**2, x=s)
+
+    return {
+        "D_geo": geo_metrics["D_geo"],
+        "D_geo_norm": geo_metrics["D_geo_norm"],
+        "base_energy": geo_metrics["base_energy"],
+        "passive_energy": passive_energy,
+        # Scoliosis metrics (asymmetric case)
+        "S_lat_asym": scoliosis_metrics_asym.S_lat,
+        "cobb_asym_deg": scoliosis_metrics_asym.cobb_like_deg,
+        "lat_dev_max_asym": scoliosis_metrics_asym.lat_dev_max,
+        # Scoliosis metrics (symmetric case, for comparison)
+        "S_lat_sym": scoliosis_metrics_sym.S_lat,
+        "cobb_sym_deg": scoliosis_metrics_sym.cobb_like_deg,
+        # Scoliosis regime: based on S_lat and Cobb-like angle thresholds
+        "scoliosis_regime": bool(
+            scoliosis_metrics_asym.S_lat >= 0.05 or
+            scoliosis_metrics_asym.cobb_like_deg >= 5.0
+        ),
+    }
+
+
+# D_geo_norm bins separating gravity-dominated / cooperative / information-dominated
+D_GEO_REGIME_LEVELS = (0.05, 0.2)
+
+
+def phase_regime_label(row, thresholds: RegimeThresholds | None = None) -> tuple:
+    """Categorical regime of one phase-diagram row (steers adaptive refinement).
+
+    Combines the flags of :func:`classify_scoliotic_regime`, the threshold-based
+    ``scoliosis_regime`` column and the D_geo_norm regime bin.
+    """
+    metrics_sym = ScoliosisMetrics(
+        S_lat=row["S_lat_sym"], y_tip=np.nan, lat_dev_max=np.nan, cobb_like_deg=row["cobb_sym_deg"]
+    )
+    metrics_asym = ScoliosisMetrics(
+        S_lat=row["S_lat_asym"],
+        y_tip=np.nan,
+        lat_dev_max=row["lat_dev_max_asym"],
+        cobb_like_deg=row["cobb_asym_deg"],
+    )
+    flags = classify_scoliotic_regime(row["D_geo_norm"], metrics_sym, metrics_asym, thresholds)
+    D_bin = int(np.digitize(row["D_geo_norm"], D_GEO_REGIME_LEVELS))
+    return (*flags.values(), bool(row["scoliosis_regime"]), D_bin)
+
+
+def check_adaptive_resolution(resolution: int, coarse_resolution: int) -> None:
+    """Raise ``ValueError`` unless ``resolution / coarse_resolution`` is a power of two.
+
+    The quadtree splits each coarse cell in half until it reaches the target
+    lattice, so both values must be positive and ``coarse_resolution`` must
+    divide ``resolution`` by a power of two (e.g. 512 and 16, or 96 and 12).
+    """
+    if coarse_resolution < 1 or resolution < coarse_resolution:
+        raise ValueError(
+            f"Adaptive mode needs 1 <= coarse_resolution <= resolution, got "
+            f"coarse_resolution={coarse_resolution}, resolution={resolution}."
+        )
+    stride, remainder = divmod(resolution, coarse_resolution)
+    if remainder or stride & (stride - 1):
+        nearest = coarse_resolution * 2 ** round(np.log2(resolution / coarse_resolution))
+        raise ValueError(
+            f"resolution / coarse_resolution must be a power of two, got "
+            f"{resolution} / {coarse_resolution}; try resolution={nearest}."
+        )
+
+
 def run_phase_diagram_experiment(
     length: float = 0.4,
     n_nodes: int = 100,
@@ -98,6 +254,12 @@ def run_phase_diagram_experiment(
     I_moment: float = 1e-8,
     epsilon_asym: float = 0.01,  # Small asymmetry for scoliosis regime detection
     output_dir: str = "outputs/experiments/phase_diagram",
+    n_workers: int | None = 1,
+    resume: bool = False,
+    save_csv: bool = True,
+    adaptive: bool = False,
+    resolution: int = 512,
+    coarse_resolution: int = 16,
 ) -> dict:
     """Generate phase diagram: D_geo_norm(χ_κ, g).
 
@@ -119,12 +281,30 @@ def run_phase_diagram_experiment(
         Second moment of area (m^4).
     output_dir:
         Output directory.
+    n_workers:
+        Worker processes for the sweep (1 = serial, None = all cores).
+    resume:
+        Reuse rows already streamed to ``phase_diagram_rows.jsonl`` by an
+        interrupted run instead of starting over.
+    save_csv:
+        Also export ``phase_diagram_data.csv`` next to the ``.npz`` results.
+    adaptive:
+        Sample a ``resolution × resolution`` lattice spanning the ranges of
+        ``chi_kappa_values`` (linear) and ``gravity_values`` (logarithmic) with
+        quadtree refinement: start from ``coarse_resolution`` cells per axis and
+        only split cells whose corners differ in :func:`phase_regime_label`.
+    resolution, coarse_resolution:
+        Target and initial cells per axis in adaptive mode; their ratio must be
+        a power of two.
 
     Returns
     -------
     dict
         Dictionary with phase diagram data and metadata.
     """
+    if adaptive:
+        check_adaptive_resolution(resolution, coarse_resolution)
+
     # Default parameter ranges
     if chi_kappa_values is None:
         chi_kappa_values = np.linspace(0.0, 0.08, 17)
@@ -133,136 +313,92 @@ def run_phase_diagram_experiment(
 
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # Create spatial grid and info field
-    s = make_uniform_grid(length, n_nodes)
-    # Create both symmetric and asymmetric info fields
-    info_field_sym = create_spinal_info_field(s, length, epsilon_asym=0.0)
-    info_field_asym = create_spinal_info_field(s, length, epsilon_asym=epsilon_asym)
-    kappa_gen = np.zeros_like(s)
-
-    # Compute countercurvature metric (constant across all parameter sets, use symmetric)
-    g_eff_sym = compute_countercurvature_metric(info_field_sym, beta1=1.0, beta2=0.5)
-    gravity_loads = {g: 1000.0 * 1e-4 * g for g in gravity_values}  # rho*A*g
-
-    # Storage for phase diagram
-    phase_data = []
+    rows_path = Path(output_dir) / "phase_diagram_rows.jsonl"
+    fixed = dict(
+        length=length,
+        n_nodes=n_nodes,
+        chi_E=chi_E,
+        E0=E0,
+        I_moment=I_moment,
+        epsilon_asym=epsilon_asym,
+    )
 
-    print(f"Generating phase diagram: {len(chi_kappa_values)} × {len(gravity_values)} = {len(chi_kappa_values) * len(gravity_values)} points")
-    print()
+    if adaptive:
+        chi_kappa_values = np.linspace(np.min(chi_kappa_values), np.max(chi_kappa_values), resolution + 1)
+        gravity_values = np.geomspace(np.min(gravity_values), np.max(gravity_values), resolution + 1)
+        if not resume and rows_path.exists():
+            rows_path.unlink()
+
+        def evaluate(indices):
+            points = [
+                {"chi_kappa": float(chi_kappa_values[i]), "gravity": float(gravity_values[j])}
+                for i, j in indices
+            ]
+            # Each refinement level appends to the same rows file, so it stays resumable.
+            level = run_sweep(compute_phase_point, points, rows_path, fixed=fixed, n_workers=n_workers)
+            return level.drop(columns=["chi_kappa", "gravity"]).to_dict("records")
+
+        print(f"Generating adaptive phase diagram: target {resolution + 1} × {resolution + 1} lattice")
+        rows, leaves = quadtree_sample(
+            evaluate,
+            (resolution + 1, resolution + 1),
+            phase_regime_label,
+            coarse_stride=resolution // coarse_resolution,
+        )
+        grid = fill_grid(
+            rows,
+            leaves,
+            {"chi_kappa": chi_kappa_values, "gravity": gravity_values},
+            list(next(iter(rows.values()))),
+        )
+        df = grid.to_frame()[grid["evaluated"].ravel()].drop(columns="evaluated").reset_index(drop=True)
+        print(f"  Solved {len(rows)} points ({100 * len(rows) / (resolution + 1) ** 2:.1f}% of the uniform grid)")
+    else:
+        print(f"Generating phase diagram: {len(chi_kappa_values)} × {len(gravity_values)} = {len(chi_kappa_values) * len(gravity_values)} points")
+        print()
+
+        # Rows stream to an append-only file so long sweeps can be resumed after a crash.
+        df = run_sweep(
+            compute_phase_point,
+            grid_points(chi_kappa=chi_kappa_values, gravity=gravity_values),
+            rows_path,
+            fixed=fixed,
+            n_workers=n_workers,
+            resume=resume,
+            progress_every=10,
+        )
+
+        # Columnar, lossless grid store (axes = chi_kappa × gravity); CSV is an optional export.
+        grid = GridResults.from_frame(
+            df, {"chi_kappa": np.asarray(chi_kappa_values), "gravity": np.asarray(gravity_values)}
+        )
+    npz_path = grid.save(Path(output_dir) / "phase_diagram_data.npz")
+    print(f"\n✅ Saved phase diagram data to {npz_path}")
+    csv_path = None
+    if save_csv:
+        csv_path = grid.to_csv(Path(output_dir) / "phase_diagram_data.csv")
+        print(f"✅ Saved CSV export to {csv_path}")
+
+    # Create phase diagram visualization (pyplot is imported here so sweep workers skip it)
+    import matplotlib.pyplot as plt
 
-    total = len(chi_kappa_values) * len(gravity_values)
-    count = 0
-
-    for chi_k in chi_kappa_values:
-        for g in gravity_values:
-            count += 1
-            if count % 10 == 0:
-                print(f"  Progress: {count}/{total} ({100*count/total:.1f}%)")
-
-            # Convert gravity to load
-            gravity_load = gravity_loads[g]
-
-            # Passive case (no info coupling, symmetric)
-            params_passive = CounterCurvatureParams(chi_kappa=0.0, chi_E=0.0, chi_M=0.0)
-            kappa_rest_passive = compute_rest_curvature(info_field_sym, params_passive, kappa_gen)
-            E_passive = np.full_like(s, E0)
-            M_passive = np.zeros_like(s)
-            _, kappa_passive = solve_beam_static(
-                s, kappa_rest_passive, E_passive, M_passive,
-                I_moment=I_moment, distributed_load=gravity_load
-            )
-
-            # Info-driven case (symmetric)
-            params_info = CounterCurvatureParams(
-                chi_kappa=chi_k, chi_E=chi_E, chi_M=0.0, scale_length=1.0
-            )
-            kappa_rest_info_sym = compute_rest_curvature(info_field_sym, params_info, kappa_gen)
-            E_info_sym = compute_effective_stiffness(info_field_sym, params_info, E0, model="linear")
-            M_info_sym = compute_active_moments(info_field_sym, params_info)
-            _, kappa_info_sym = solve_beam_static(
-                s, kappa_rest_info_sym, E_info_sym, M_info_sym,
-                I_moment=I_moment, distributed_load=gravity_load
-            )
-
-            # Info-driven case (asymmetric) - for scoliosis regime detection
-            kappa_rest_info_asym = compute_rest_curvature(info_field_asym, params_info, kappa_gen)
-            E_info_asym = compute_effective_stiffness(info_field_asym, params_info, E0, model="linear")
-            M_info_asym = compute_active_moments(info_field_asym, params_info)
-            theta_asym, kappa_info_asym = solve_beam_static(
-                s, kappa_rest_info_asym, E_info_asym, M_info_asym,
-                I_moment=I_moment, distributed_load=gravity_load
-            )
-            centerline_asym = _reconstruct_centerline_2d(theta_asym, s)
-            
-            # Extract pseudo-coronal coordinates for scoliosis metrics
-            # Note: This is a 2D approximation; full 3D would use actual coronal-plane coordinates
-            z_asym, y_asym = extract_pseudo_coronal_coords(centerline_asym)
-            scoliosis_metrics_asym = compute_scoliosis_metrics(z_asym, y_asym, frac=0.2)
-            
-            # Also compute symmetric case for comparison
-            theta_sym, _ = solve_beam_static(
-                s, kappa_rest_info_sym, E_info_sym, M_info_sym,
-                I_moment=I_moment, distributed_load=gravity_load
-            )
-            centerline_sym = _reconstruct_centerline_2d(theta_sym, s)
-            z_sym, y_sym = extract_pseudo_coronal_coords(centerline_sym)
-            scoliosis_metrics_sym = compute_scoliosis_metrics(z_sym, y_sym, frac=0.2)
-
-            # Compute geodesic deviation (symmetric case)
-            geo_metrics = geodesic_curvature_deviation(
-                s, kappa_passive, kappa_info_sym, g_eff_sym
-            )
-
-            # Compute passive curvature energy (for reference)
-            passive_energy = np.trapz(kappa_passive**2, x=s)
-
-            phase_data.append({
-                "chi_kappa": chi_k,
-                "gravity": g,
-                "D_geo": geo_metrics["D_geo"],
-                "D_geo_norm": geo_metrics["D_geo_norm"],
-                "base_energy": geo_metrics["base_energy"],
-                "passive_energy": passive_energy,
-                # Scoliosis metrics (asymmetric case)
-                "S_lat_asym": scoliosis_metrics_asym.S_lat,
-                "cobb_asym_deg": scoliosis_metrics_asym.cobb_like_deg,
-                "lat_dev_max_asym": scoliosis_metrics_asym.lat_dev_max,
-                # Scoliosis metrics (symmetric case, for comparison)
-                "S_lat_sym": scoliosis_metrics_sym.S_lat,
-                "cobb_sym_deg": scoliosis_metrics_sym.cobb_like_deg,
-                # Scoliosis regime: based on S_lat and Cobb-like angle thresholds
-                "scoliosis_regime": (
-                    scoliosis_metrics_asym.S_lat >= 0.05 or
-                    scoliosis_metrics_asym.cobb_like_deg >= 5.0
-                ),
-            })
-
-    df = pd.DataFrame(phase_data)
-    csv_path = Path(output_dir) / "phase_diagram_data.csv"
-    df.to_csv(csv_path, index=False)
-    print(f"\n✅ Saved phase diagram data to {csv_path}")
-
-    # Create phase diagram visualization
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
 
     # Panel A: D_geo_norm phase diagram with scoliosis regime overlay
     ax = axes[0]
-    pivot = df.pivot(index="gravity", columns="chi_kappa", values="D_geo_norm")
-    pivot_scoliosis = df.pivot(index="gravity", columns="chi_kappa", values="scoliosis_regime")
-    # Also pivot S_lat for contour overlay
-    pivot_S_lat = df.pivot(index="gravity", columns="chi_kappa", values="S_lat_asym")
+    # Grid arrays are (chi_kappa, gravity); transpose to (gravity, chi_kappa) for plotting
     X, Y = np.meshgrid(chi_kappa_values, gravity_values)
-    Z = pivot.values
+    Z = grid["D_geo_norm"].T
 
     # Create contour plot
     contour = ax.contourf(X, Y, Z, levels=20, cmap="viridis")
     ax.contour(X, Y, Z, levels=[0.05, 0.1, 0.2, 0.5], colors="white", linewidths=1, alpha=0.5)
     
     # Overlay scoliosis regime (where S_lat >= 0.05 or Cobb >= 5°)
-    scoliosis_mask = pivot_scoliosis.values.astype(bool)
+    scoliosis_mask = grid["scoliosis_regime"].T.astype(bool)
     ax.contour(X, Y, scoliosis_mask.astype(float), levels=[0.5], colors="red", linewidths=2, linestyle="--")
     # Also show S_lat contour at threshold
-    ax.contour(X, Y, pivot_S_lat.values, levels=[0.05], colors="orange", linewidths=1.5, linestyle=":", alpha=0.7)
+    ax.contour(X, Y, grid["S_lat_asym"].T, levels=[0.05], colors="orange", linewidths=1.5, linestyle=":", alpha=0.7)
     
     cbar = plt.colorbar(contour, ax=ax)
     cbar.set_label("D̂_geo (normalized geodesic deviation)", fontsize=11)
@@ -283,8 +419,9 @@ def run_phase_diagram_experiment(
 
     # Panel B: Passive energy vs gravity (reference)
     ax = axes[1]
-    gravity_unique = sorted(df["gravity"].unique())
-    passive_energies = [df[df["gravity"] == g]["passive_energy"].iloc[0] for g in gravity_unique]
+    g_order = np.argsort(grid.coords["gravity"])
+    gravity_unique = grid.coords["gravity"][g_order]
+    passive_energies = grid["passive_energy"][0, g_order]
     ax.plot(gravity_unique, passive_energies, "o-", color="blue", linewidth=2, markersize=8)
     ax.set_xlabel("Gravity g (m/s²)", fontsize=12)
     ax.set_ylabel("Passive curvature energy", fontsize=12)
@@ -304,6 +441,8 @@ def run_phase_diagram_experiment(
 
     return {
         "data": df,
+        "grid": grid,
+        "npz_path": npz_path,
         "chi_kappa_values": chi_kappa_values,
         "gravity_values": gravity_values,
         "csv_path": csv_path,
@@ -321,7 +460,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--g-min", type=float, default=0.01, help="Minimum gravity.")
     parser.add_argument("--g-max", type=float, default=9.81, help="Maximum gravity.")
     parser.add_argument("--output-dir", type=str, default="outputs/experiments/phase_diagram", help="Output directory.")
-    return parser.parse_args()
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (0 = all cores).")
+    parser.add_argument("--resume", action="store_true", help="Skip grid points finished by a previous run.")
+    parser.add_argument("--no-csv", action="store_true", help="Only write the .npz results, skip the CSV export.")
+    parser.add_argument("--adaptive", action="store_true", help="Quadtree-refine only near regime boundaries.")
+    parser.add_argument("--resolution", type=int, default=512, help="Target cells per axis in adaptive mode.")
+    parser.add_argument(
+        "--coarse-resolution",
+        type=int,
+        default=16,
+        help="Initial cells per axis in adaptive mode (resolution / coarse-resolution must be a power of two).",
+    )
+    args = parser.parse_args()
+    if args.adaptive:
+        try:
+            check_adaptive_resolution(args.resolution, args.coarse_resolution)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
 
 
 def main():
@@ -348,11 +504,19 @@ def main():
         chi_kappa_values=chi_values,
         gravity_values=gravity_values,
         output_dir=args.output_dir,
+        n_workers=args.workers or None,
+        resume=args.resume,
+        save_csv=not args.no_csv,
+        adaptive=args.adaptive,
+        resolution=args.resolution,
+        coarse_resolution=args.coarse_resolution,
     )
 
     print()
     print("✅ Phase diagram complete!")
-    print(f"   CSV:  {results['csv_path']}")
+    print(f"   Data: {results['npz_path']}")
+    if results["csv_path"] is not None:
+        print(f"   CSV:  {results['csv_path']}")
     print(f"   Fig:  {results['fig_path']}")
     print(f"   D_geo_norm range: {results['D_geo_norm_min']:.4f} – {results['D_geo_norm_max']:.4f}")
     print()
@@ -3,10 +3,13 @@
 Enhanced version for Nature manuscript with 3D traces and growth spurt simulation.
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
 from pathlib import Path
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pandas as pd
 from spinalmodes.countercurvature import (
     CounterCurvatureParams,
     InfoField1D,
@@ -15,12 +18,19 @@ from spinalmodes.countercurvature import (
     geodesic_curvature_deviation,
     compute_scoliosis_metrics,
 )
+from spinalmodes.countercurvature.continuation import ContinuationBranch, ElasticaFamily
 from spinalmodes.countercurvature.coupling import (
+    CouplingBasis,
     compute_active_moments,
     compute_effective_stiffness,
     compute_rest_curvature,
 )
+from spinalmodes.experiments.countercurvature.sweep_runner import grid_points, run_sweep
 from spinalmodes.iec import solve_beam_static
+from spinalmodes.utils.results_store import GridResults
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def create_spine_kappa_gen(s: np.ndarray, length: float) -> np.ndarray:
@@ -50,6 +60,85 @@ def _reconstruct_centerline_2d(theta: np.ndarray, s: np.ndarray) -> np.ndarray:
     return np.column_stack([x, z])
 
 
+@lru_cache(maxsize=32)
+def _bifurcation_setup(length: float, n_nodes: int, epsilon_asym: float):
+    """Grid, baseline curvature and coupling basis per asymmetry level (cached per process)."""
+    s = make_uniform_grid(length, n_nodes)
+    info_field = create_neural_control_info_field(s, length, epsilon_asym=epsilon_asym)
+    return s, create_spine_kappa_gen(s, length), CouplingBasis.from_info(info_field)
+
+
+def compute_bifurcation_point(
+    chi_kappa: float,
+    epsilon_asym: float,
+    length: float = 0.4,
+    n_nodes: int = 100,
+    chi_E: float = 0.1,
+    E0: float = 1e9,
+    I_moment: float = 1e-8,
+    gravity_load: float = 100.0,
+) -> dict:
+    s, kappa_gen, basis = _bifurcation_setup(length, n_nodes, epsilon_asym)
+    kappa_rest = basis.rest_curvature(chi_kappa, kappa_gen)
+    th, _ = solve_beam_static(s, kappa_rest, np.full_like(s, E0), np.zeros_like(s), I_moment=I_moment, distributed_load=gravity_load)
+    c = _reconstruct_centerline_2d(th, s)
+    m = compute_scoliosis_metrics(c[:, 1], c[:, 0], frac=0.2)
+    return {"S_lat": m.S_lat, "cobb_like_deg": m.cobb_like_deg}
+
+
+def trace_scoliosis_branch(
+    parameter: str = "chi_kappa",
+    start: float = 0.0,
+    stop: float = 0.1,
+    epsilon_asym: float = 0.0,
+    length: float = 0.4,
+    n_nodes: int = 100,
+    chi_kappa: float = 0.05,
+    E0: float = 1e9,
+    I_moment: float = 1e-8,
+    gravity_load: float = 100.0,
+    **continuation_kwargs,
+) -> tuple[pd.DataFrame, ContinuationBranch]:
+    """Trace the large-deflection equilibrium branch in ``chi_kappa`` or gravity.
+
+    ``parameter="gravity"`` varies g (m/s²) with ``gravity_load`` the load at 9.81 m/s²
+    and ``chi_kappa`` fixed.  Each step is warm-started from the previous equilibrium and
+    step sizes adapt to the Newton effort, so a branch costs far fewer solves than a dense
+    grid; folds and branch points are reported on the returned branch.
+    """
+    s, kappa_gen, basis = _bifurcation_setup(length, n_nodes, epsilon_asym)
+    # Same loading as compute_bifurcation_point (default 100 N tip load of solve_beam_static).
+    common = dict(s=s, E_field=np.full_like(s, E0), M_active=np.zeros_like(s), I_moment=I_moment, P_load=100.0)
+    if parameter == "chi_kappa":
+        family = ElasticaFamily(
+            kappa_target=kappa_gen, d_kappa_target=basis.gradient, distributed_load=gravity_load, **common
+        )
+    elif parameter == "gravity":
+        family = ElasticaFamily(
+            kappa_target=basis.rest_curvature(chi_kappa, kappa_gen), d_distributed_load=gravity_load / 9.81, **common
+        )
+    else:
+        raise ValueError("parameter must be 'chi_kappa' or 'gravity'.")
+
+    import pandas as pd
+
+    branch = family.continuation(start, stop, **continuation_kwargs)
+    rows = []
+    for value, theta in zip(branch.parameter, branch.states):
+        c = _reconstruct_centerline_2d(theta, s)
+        m = compute_scoliosis_metrics(c[:, 1], c[:, 0], frac=0.2)
+        rows.append({parameter: value, "S_lat": m.S_lat, "cobb_like_deg": m.cobb_like_deg})
+    return pd.DataFrame(rows), branch
+
+
+def locate_transitions(df: pd.DataFrame, parameter: str, column: str = "cobb_like_deg", level: float = 10.0) -> np.ndarray:
+    """Parameter values where ``column`` crosses ``level`` along a traced branch (linear interpolation)."""
+    x = df[parameter].to_numpy()
+    y = df[column].to_numpy() - level
+    idx = np.flatnonzero(np.sign(y[:-1]) * np.sign(y[1:]) < 0)
+    return x[idx] + (x[idx + 1] - x[idx]) * y[idx] / (y[idx] - y[idx + 1])
+
+
 def run_scoliosis_bifurcation_experiment(
     length: float = 0.4,
     n_nodes: int = 100,
@@ -60,37 +149,64 @@ def run_scoliosis_bifurcation_experiment(
     I_moment: float = 1e-8,
     gravity_load: float = 100.0,
     output_dir: str = "outputs/experiments/scoliosis_bifurcation",
+    n_workers: int | None = 1,
+    resume: bool = False,
+    save_csv: bool = True,
+    continuation: bool = False,
 ) -> dict:
+    # Plotting and table dependencies stay out of the sweep workers' imports.
+    import matplotlib.pyplot as plt
+    import pandas as pd
+
     if chi_kappa_values is None:
         chi_kappa_values = np.linspace(0.0, 0.1, 15)
     if asymmetry_values is None:
         asymmetry_values = np.array([0.0, 0.005, 0.01, 0.02, 0.05])
 
     Path(output_dir).mkdir(parents=True, exist_ok=True)
-    s = make_uniform_grid(length, n_nodes)
-    kappa_gen = create_spine_kappa_gen(s, length)
-    bifurcation_data = []
 
     print(f"Running ENHANCED scoliosis experiment...")
-    for chi_k in chi_kappa_values:
-        for eps_asym in asymmetry_values:
-            info_field = create_neural_control_info_field(s, length, epsilon_asym=eps_asym)
-            params = CounterCurvatureParams(chi_kappa=chi_k, chi_E=chi_E, chi_M=0.0)
-            kappa_rest = compute_rest_curvature(info_field, params, kappa_gen)
-            th, _ = solve_beam_static(s, kappa_rest, np.full_like(s, E0), np.zeros_like(s), I_moment=I_moment, distributed_load=gravity_load)
-            c = _reconstruct_centerline_2d(th, s)
-            m = compute_scoliosis_metrics(c[:, 1], c[:, 0], frac=0.2)
-            
-            bifurcation_data.append({
-                "chi_kappa": chi_k,
-                "epsilon_asym": eps_asym,
-                "S_lat": m.S_lat,
-                "cobb_like_deg": m.cobb_like_deg,
-            })
-
-    df = pd.DataFrame(bifurcation_data)
-    csv_path = Path(output_dir) / "scoliosis_bifurcation_data.csv"
-    df.to_csv(csv_path, index=False)
+    df = run_sweep(
+        compute_bifurcation_point,
+        grid_points(chi_kappa=chi_kappa_values, epsilon_asym=asymmetry_values),
+        Path(output_dir) / "scoliosis_bifurcation_rows.jsonl",
+        fixed=dict(length=length, n_nodes=n_nodes, chi_E=chi_E, E0=E0, I_moment=I_moment, gravity_load=gravity_load),
+        n_workers=n_workers,
+        resume=resume,
+    )
+
+    grid = GridResults.from_frame(
+        df, {"chi_kappa": np.asarray(chi_kappa_values), "epsilon_asym": np.asarray(asymmetry_values)}
+    )
+    grid.save(Path(output_dir) / "scoliosis_bifurcation_data.npz")
+    if save_csv:
+        grid.to_csv(Path(output_dir) / "scoliosis_bifurcation_data.csv")
+
+    branches = {}
+    if continuation:
+        # Large-deflection branches in chi_kappa: one continuation per asymmetry level.
+        for eps in asymmetry_values:
+            branch_df, branch = trace_scoliosis_branch(
+                "chi_kappa",
+                float(np.min(chi_kappa_values)),
+                float(np.max(chi_kappa_values)),
+                epsilon_asym=float(eps),
+                length=length,
+                n_nodes=n_nodes,
+                E0=E0,
+                I_moment=I_moment,
+                gravity_load=gravity_load,
+            )
+            branches[float(eps)] = branch_df.assign(epsilon_asym=float(eps))
+            crossings = locate_transitions(branch_df, "chi_kappa")
+            print(
+                f"  ε={eps:.3f}: {len(branch_df)} branch points, {branch.folds.size} folds, "
+                f"Cobb 10° at χ_κ={np.array2string(crossings, precision=4)}"
+            )
+        if save_csv:
+            pd.concat(branches.values(), ignore_index=True).to_csv(
+                Path(output_dir) / "scoliosis_bifurcation_branches.csv", index=False
+            )
 
     # Create high-quality figure for Nature
     fig = plt.figure(figsize=(16, 12))
@@ -122,9 +238,12 @@ def run_scoliosis_bifurcation_experiment(
 
     # Panel B: Cobb Angle
     ax_b = fig.add_subplot(gs[0, 1])
-    for eps in asymmetry_values[::2]:
-        subset = df[df["epsilon_asym"] == eps]
-        ax_b.plot(subset["chi_kappa"], subset["cobb_like_deg"], "o-", label=f"ε={eps*100:.1f}%")
+    for j in range(0, len(asymmetry_values), 2):
+        eps = asymmetry_values[j]
+        line, = ax_b.plot(grid.coords["chi_kappa"], grid["cobb_like_deg"][:, j], "o-", label=f"ε={eps*100:.1f}%")
+        if float(eps) in branches:
+            b = branches[float(eps)]
+            ax_b.plot(b["chi_kappa"], b["cobb_like_deg"], "-", color=line.get_color(), alpha=0.5)
     ax_b.axhline(10, color="k", linestyle="--", alpha=0.5, label="AIS Clinical Target (10°)")
     ax_b.set_xlabel("Coupling Strength χ_κ")
     ax_b.set_ylabel("Cobb Angle (deg)")
@@ -134,9 +253,8 @@ def run_scoliosis_bifurcation_experiment(
 
     # Panel C: Phase Diagram
     ax_c = fig.add_subplot(gs[0, 2])
-    pivot = df.pivot(index="epsilon_asym", columns="chi_kappa", values="S_lat")
     X, Y = np.meshgrid(chi_kappa_values, asymmetry_values)
-    cp = ax_c.contourf(X, Y*100, pivot.values, cmap="magma", levels=15)
+    cp = ax_c.contourf(X, Y*100, grid["S_lat"].T, cmap="magma", levels=15)
     plt.colorbar(cp, ax=ax_c, label="Lateral Index S_lat")
     ax_c.set_xlabel("χ_κ")
     ax_c.set_ylabel("Asymmetry (%)")
@@ -173,7 +291,7 @@ def run_scoliosis_bifurcation_experiment(
     plt.close()
     print(f"✅ Saved enhanced Figure 5 to {fig_path}")
 
-    return {"fig_path": fig_path}
+    return {"fig_path": fig_path, "branches": branches}
 
 
 if __name__ == "__main__":
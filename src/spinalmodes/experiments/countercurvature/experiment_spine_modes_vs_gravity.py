@@ -39,7 +39,7 @@ from spinalmodes.countercurvature.validation_and_metrics import (
     compute_countercurvature_energy,
     compute_effective_metric_deviation,
     compute_countercurvature_metric,
-    geodesic_curvature_deviation,
+    GeodesicDeviation,
 )
 from spinalmodes.iec import solve_beam_static
 
@@ -315,6 +315,7 @@ def run_spine_experiment(
             # Passive case - use as reference
             centerline_passive = centerline
             kappa_passive = kappa
+            deviation = GeodesicDeviation(s, g_eff, kappa_passive)
             countercurvature_energy = 0.0
             metric_deviation = 0.0
             D_geo = 0.0
@@ -327,11 +328,9 @@ def run_spine_experiment(
                 kappa_passive, kappa, s=s
             )
             # Compute geodesic curvature deviation
-            geo_metrics = geodesic_curvature_deviation(
-                s, kappa_passive, kappa, g_eff
-            )
-            D_geo = geo_metrics["D_geo"]
-            D_geo_norm = geo_metrics["D_geo_norm"]
+            geo_metrics = deviation.evaluate(kappa)
+            D_geo = float(geo_metrics["D_geo"])
+            D_geo_norm = float(geo_metrics["D_geo_norm"])
 
         # Compute spinal angles
         angles = compute_lordosis_kyphosis_angles(centerline, s)
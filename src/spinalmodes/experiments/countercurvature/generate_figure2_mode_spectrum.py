@@ -17,7 +17,6 @@ from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
-from scipy.linalg import eigh_tridiagonal
 
 from spinalmodes.countercurvature import (
     InfoField1D,
@@ -25,6 +24,7 @@ from spinalmodes.countercurvature import (
     CounterCurvatureParams,
 )
 from spinalmodes.countercurvature.coupling import compute_effective_stiffness
+from spinalmodes.model.solvers.eigenmodes import beam_eigenmodes
 
 
 def solve_beam_eigenmodes(
@@ -32,13 +32,16 @@ def solve_beam_eigenmodes(
     B_field: np.ndarray,
     n_modes: int = 5,
     bc: str = "clamped-free",
+    rhoA: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray]:
-    """Solve for beam eigenmodes using finite difference method.
+    """Solve for beam eigenmodes with spatially varying stiffness and mass.
     
-    Solves the eigenvalue problem:
-        d²/ds²[B(s) d²y/ds²] = λ m(s) y
+    Solves the generalized eigenvalue problem:
+        d²/ds²[B(s) d²y/ds²] = λ ρA(s) y
     
-    for a cantilever beam with spatially varying stiffness B(s).
+    with the sparse shift-invert solver in
+    :mod:`spinalmodes.model.solvers.eigenmodes`, so the full B(s) profile
+    (not just its mean) shapes the spectrum.
     
     Parameters
     ----------
@@ -50,83 +53,17 @@ def solve_beam_eigenmodes(
         Number of modes to compute.
     bc:
         Boundary condition ('clamped-free' or 'pinned-pinned').
+    rhoA:
+        Mass per unit length ρA(s) (kg/m); defaults to 1 (normalized).
     
     Returns
     -------
     eigenvalues, eigenmodes:
-        Arrays of shape (n_modes,) and (n_nodes, n_modes).
+        Arrays of shape (n_modes,) and (n_nodes, n_modes). Modes are scaled to
+        unit maximum amplitude for plotting.
     """
-    n = len(s)
-    ds = s[1] - s[0]
-    
-    # Build stiffness matrix K and mass matrix M
-    # For d⁴y/dx⁴ = λ² y discretized by finite differences
-    # Use central differences for 4th derivative
-    
-    # Simplified: use averaged stiffness and assume uniform mass
-    B_avg = np.mean(B_field)
-    rho_A = 1.0  # Normalized mass per length
-    
-    # Construct tri-diagonal approximation for eigenvalue problem
-    # (This is a simplified version; full FEM would be more accurate)
-    
-    # For cantilever: first mode wavelength ~ 2L
-    # Fundamental frequency: ω₁² ∝ (EI/ρA) / L⁴
-    
-    L = s[-1]
-    
-    # Analytical approximation for first few modes (Euler-Bernoulli)
-    # Mode shapes: y_n(x) = sin(βₙx/L) for pinned-pinned
-    #              or more complex for clamped-free
-    
-    # Use finite difference approximation
-    # Build discrete Laplacian
-    diag = -2 * np.ones(n-2)
-    off_diag = np.ones(n-3)
-    
-    # Eigenvalue problem: -d²y/dx² = λ y (for simplification)
-    # Scale by stiffness modulation
-    
-    # Compute eigenvalues using tridiagonal solver
-    eigvals_base = np.zeros(n_modes)
-    eigmodes_base = np.zeros((n, n_modes))
-    
-    # Use analytical Euler-Bernoulli mode shapes for visualization
-    x_norm = s / L
-    
-    if bc == "clamped-free":
-        # Clamped-free mode shape coefficients (βₙL values)
-        beta_L_values = [1.875, 4.694, 7.855, 10.996, 14.137]  # First 5 modes
-        
-        for i in range(min(n_modes, len(beta_L_values))):
-            beta_L = beta_L_values[i]
-            
-            # Analytical mode shape for clamped-free beam
-            # y(x) = cosh(βx) - cos(βx) - σ[sinh(βx) - sin(βx)]
-            # where σ = (sinh(βL) - sin(βL)) / (cosh(βL) + cos(βL))
-            
-            beta = beta_L / L
-            sigma = (np.sinh(beta_L) - np.sin(beta_L)) / (np.cosh(beta_L) + np.cos(beta_L))
-            
-            mode_shape = (np.cosh(beta * s) - np.cos(beta * s) -
-                         sigma * (np.sinh(beta * s) - np.sin(beta * s)))
-            
-            # Normalize
-            mode_shape = mode_shape / np.max(np.abs(mode_shape))
-            
-            eigmodes_base[:, i] = mode_shape
-            
-            # Eigenvalue (frequency squared) proportional to β⁴
-            eigvals_base[i] = (beta_L / L)**4 * (B_avg / rho_A)
-    
-    else:  # pinned-pinned
-        for i in range(n_modes):
-            n_mode = i + 1
-            mode_shape = np.sin(n_mode * np.pi * x_norm)
-            eigmodes_base[:, i] = mode_shape
-            eigvals_base[i] = (n_mode * np.pi / L)**4 * (B_avg / rho_A)
-    
-    return eigvals_base, eigmodes_base
+    eigvals, modes = beam_eigenmodes(s, B_field, rhoA=rhoA, n_modes=n_modes, bc=bc)
+    return eigvals, modes / np.max(np.abs(modes), axis=0)
 
 
 def create_spinal_info_field(s: np.ndarray, length: float) -> InfoField1D:
@@ -4,20 +4,27 @@ This script varies model parameters (stiffness, coupling, gravity) within
 a ±10% range and computes the standard deviation of the output metrics
 (D_geo_norm, Cobb angle).
 
+``--method sobol`` instead computes variance-based first- and total-order Sobol
+indices from a Saltelli design, evaluating the model in vectorised batches
+(:class:`BatchedSensitivityModel`) over a process pool.
+
 Usage:
     python3 -m spinalmodes.experiments.countercurvature.sensitivity_analysis
+    python3 -m spinalmodes.experiments.countercurvature.sensitivity_analysis --method sobol --n-base 16384
 """
 
 import argparse
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Mapping
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-from tqdm import tqdm
 
 from spinalmodes.countercurvature import (
     CounterCurvatureParams,
+    CouplingBasis,
+    GeodesicDeviation,
     InfoField1D,
     make_uniform_grid,
     compute_countercurvature_metric,
@@ -28,7 +35,18 @@ from spinalmodes.countercurvature.coupling import (
     compute_effective_stiffness,
     compute_rest_curvature,
 )
-from spinalmodes.iec import solve_beam_static
+from spinalmodes.countercurvature.sensitivity import sobol_analysis
+from spinalmodes.experiments.countercurvature.sweep_runner import run_sweep
+from spinalmodes.iec import solve_beam_static, solve_beam_static_batch
+
+BASELINE = {
+    "chi_kappa": 0.05,
+    "chi_E": 0.1,
+    "E0": 1e9,
+    "gravity": 9.81,
+    "I_moment": 1e-8,
+    "rho_A": 0.1,  # kg/m
+}
 
 
 def create_spinal_info_field(s: np.ndarray, length: float) -> InfoField1D:
@@ -39,9 +57,17 @@ def create_spinal_info_field(s: np.ndarray, length: float) -> InfoField1D:
     return InfoField1D.from_array(s, I)
 
 
-def run_single_sim(params_dict, length=0.4, n_nodes=100):
+@lru_cache(maxsize=8)
+def _sim_setup(length: float, n_nodes: int):
+    """Grid, info field and g_eff, which do not depend on the sampled parameters."""
     s = make_uniform_grid(length, n_nodes)
     info_field = create_spinal_info_field(s, length)
+    g_eff = compute_countercurvature_metric(info_field, beta1=1.0, beta2=0.5)
+    return s, info_field, g_eff
+
+
+def run_single_sim(params_dict, length=0.4, n_nodes=100):
+    s, info_field, g_eff = _sim_setup(length, n_nodes)
     
     # Extract params
     chi_k = params_dict["chi_kappa"]
@@ -72,33 +98,106 @@ def run_single_sim(params_dict, length=0.4, n_nodes=100):
     )
     
     # Metric
-    g_eff = compute_countercurvature_metric(info_field, beta1=1.0, beta2=0.5)
     metrics = geodesic_curvature_deviation(s, kappa_p, kappa_sim, g_eff)
     
     return metrics["D_geo_norm"]
 
 
-def run_sensitivity_analysis(n_samples=100, perturbation=0.1, output_dir="outputs/experiments/sensitivity"):
-    baseline = {
-        "chi_kappa": 0.05,
-        "chi_E": 0.1,
-        "E0": 1e9,
-        "gravity": 9.81,
-        "I_moment": 1e-8,
-        "rho_A": 0.1, # kg/m
-    }
-    
+@dataclass(frozen=True)
+class BatchedSensitivityModel:
+    """Vectorised :func:`run_single_sim` for whole batches of parameter sets.
+
+    The grid, information field, coupling basis and ``g_eff`` do not depend on the
+    sampled parameters, so they are built once; each call is then a few array
+    operations on ``(batch, n_nodes)`` profiles and one :class:`GeodesicDeviation`
+    product.  Called with ``{name: (batch,)}``
+    columns for every key of :data:`BASELINE`, returns ``{"D_geo_norm": (batch,)}``.
+    """
+
+    length: float = 0.4
+    n_nodes: int = 100
+    _s: np.ndarray = field(init=False, repr=False, compare=False)
+    _basis: CouplingBasis = field(init=False, repr=False, compare=False)
+    _g_eff: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        s, info_field, g_eff = _sim_setup(self.length, self.n_nodes)
+        object.__setattr__(self, "_s", s)
+        object.__setattr__(self, "_basis", CouplingBasis.from_info(info_field))
+        object.__setattr__(self, "_g_eff", g_eff)
+
+    def __call__(self, samples: Mapping[str, np.ndarray]) -> dict[str, np.ndarray]:
+        chi_k, chi_e, e0, g, i_moment, rho_a = (
+            np.asarray(samples[k], dtype=float)
+            for k in ("chi_kappa", "chi_E", "E0", "gravity", "I_moment", "rho_A")
+        )
+        s = self._s
+        load = rho_a * g
+
+        # The solver only sees E * I, so a per-sample I_moment is folded into E.
+        i_ref = float(np.max(i_moment))
+        e_base = np.broadcast_to((e0 * i_moment / i_ref)[:, None], (e0.size, s.size))
+        e_eff = self._basis.effective_stiffness(chi_e, 1.0) * e_base
+        _, kappa_sim = solve_beam_static_batch(
+            s,
+            self._basis.rest_curvature(chi_k),
+            e_eff,
+            np.zeros_like(s),
+            I_moment=i_ref,
+            distributed_load=load,
+        )
+        _, kappa_p = solve_beam_static_batch(
+            s,
+            np.zeros_like(s),
+            e_base,
+            np.zeros_like(s),
+            I_moment=i_ref,
+            distributed_load=load,
+        )
+
+        deviation = GeodesicDeviation(s, self._g_eff, kappa_p)
+        return {"D_geo_norm": deviation.evaluate(kappa_sim)["D_geo_norm"]}
+
+
+def _sensitivity_point(length=0.4, n_nodes=100, **params_dict):
+    return {"D_geo_norm": run_single_sim(params_dict, length=length, n_nodes=n_nodes)}
+
+
+def run_sensitivity_analysis(
+    n_samples=100,
+    perturbation=0.1,
+    output_dir="outputs/experiments/sensitivity",
+    seed=None,
+    n_workers=1,
+    resume=False,
+):
+    """Monte Carlo sensitivity of D_geo_norm to ±``perturbation`` parameter noise.
+
+    Samples are drawn up front from ``np.random.default_rng(seed)`` and evaluated
+    by the shared sweep runner, so ``n_workers`` > 1 spreads them over processes.
+    Resuming an interrupted run (``resume=True``) requires a fixed ``seed`` so the
+    same samples are drawn again.
+    """
+    baseline = BASELINE
+
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
-    results = []
-    
+    rng = np.random.default_rng(seed)
+    samples = [
+        {k: v * (1 + rng.uniform(-perturbation, perturbation)) for k, v in baseline.items()}
+        for _ in range(n_samples)
+    ]
+
     print(f"Running Monte Carlo Sensitivity Analysis ({n_samples} samples)...")
-    for i in tqdm(range(n_samples)):
-        perturbed = {k: v * (1 + np.random.uniform(-perturbation, perturbation)) for k, v in baseline.items()}
-        d_geo_norm = run_single_sim(perturbed)
-        results.append(d_geo_norm)
-        
-    df = pd.DataFrame(results, columns=["D_geo_norm"])
+    df = run_sweep(
+        _sensitivity_point,
+        samples,
+        Path(output_dir) / "sensitivity_rows.jsonl",
+        n_workers=n_workers,
+        resume=resume,
+        progress_every=max(1, n_samples // 10),
+    )[["D_geo_norm"]]
+    results = df["D_geo_norm"].to_numpy()
     stats = df.describe()
     
     mean = stats.loc["mean", "D_geo_norm"]
@@ -111,6 +210,8 @@ def run_sensitivity_analysis(n_samples=100, perturbation=0.1, output_dir="output
     df.to_csv(Path(output_dir) / "sensitivity_results.csv", index=False)
     
     # Plot histogram
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(8, 6))
     plt.hist(results, bins=20, color="skyblue", edgecolor="black", alpha=0.7)
     plt.axvline(mean, color="red", linestyle="dashed", linewidth=2, label=f"Mean: {mean:.4f}")
@@ -127,5 +228,95 @@ def run_sensitivity_analysis(n_samples=100, perturbation=0.1, output_dir="output
     print(f"✅ Saved histogram to {fig_path}")
 
 
+def run_sobol_analysis(
+    n_base=2**12,
+    perturbation=0.1,
+    output_dir="outputs/experiments/sensitivity",
+    seed=None,
+    n_workers=1,
+    batch_size=4096,
+    n_bootstrap=1000,
+    length=0.4,
+    n_nodes=100,
+):
+    """Sobol indices of D_geo_norm over uniform ±``perturbation`` parameter ranges.
+
+    Uses a Saltelli design of ``n_base * (d + 2)`` evaluations (``n_base`` a power of
+    two, ``d = 6`` parameters) and bootstrap confidence intervals.
+    """
+    bounds = {k: (v * (1 - perturbation), v * (1 + perturbation)) for k, v in BASELINE.items()}
+    n_eval = n_base * (len(bounds) + 2)
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    print(f"Running Sobol Sensitivity Analysis ({n_eval} evaluations)...")
+    indices = sobol_analysis(
+        BatchedSensitivityModel(length=length, n_nodes=n_nodes),
+        bounds,
+        n_base,
+        seed=seed,
+        batch_size=batch_size,
+        n_workers=n_workers,
+        n_bootstrap=n_bootstrap,
+    )["D_geo_norm"]
+
+    print(f"\nSobol indices of D_geo_norm (±{perturbation*100}% ranges, {indices.confidence:.0%} CI):")
+    for row in indices.as_rows():
+        print(
+            f"  {row['parameter']:>10}: S1 = {row['S1']:.3f} [{row['S1_lo']:.3f}, {row['S1_hi']:.3f}]"
+            f"  ST = {row['ST']:.3f} [{row['ST_lo']:.3f}, {row['ST_hi']:.3f}]"
+        )
+
+    import pandas as pd
+
+    pd.DataFrame(indices.as_rows()).to_csv(Path(output_dir) / "sobol_indices.csv", index=False)
+
+    import matplotlib.pyplot as plt
+
+    x = np.arange(len(indices.names))
+    fig, ax = plt.subplots(figsize=(8, 5))
+    for offset, values, ci, label in (
+        (-0.2, indices.S1, indices.S1_ci, "First order $S_i$"),
+        (0.2, indices.ST, indices.ST_ci, "Total order $S_{Ti}$"),
+    ):
+        err = np.abs(ci.T - values)
+        ax.bar(x + offset, values, width=0.4, yerr=err, capsize=3, label=label)
+    ax.set_xticks(x)
+    ax.set_xticklabels(indices.names)
+    ax.set_ylabel("Sobol index")
+    ax.set_title(f"Variance-based sensitivity of D̂_geo\n(±{perturbation*100}% parameter ranges)")
+    ax.legend()
+    ax.grid(alpha=0.3, axis="y")
+
+    fig_path = Path(output_dir) / "sobol_indices.png"
+    fig.savefig(fig_path, dpi=300)
+    print(f"✅ Saved Sobol indices to {fig_path}")
+    return indices
+
+
 if __name__ == "__main__":
-    run_sensitivity_analysis()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--method", choices=["mc", "sobol"], default="mc")
+    parser.add_argument("--n-samples", type=int, default=100, help="Monte Carlo samples (--method mc)")
+    parser.add_argument("--n-base", type=int, default=2**12, help="Saltelli base size, a power of two (--method sobol)")
+    parser.add_argument("--perturbation", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (0 = all cores)")
+    parser.add_argument("--output-dir", default="outputs/experiments/sensitivity")
+    args = parser.parse_args()
+
+    if args.method == "sobol":
+        run_sobol_analysis(
+            n_base=args.n_base,
+            perturbation=args.perturbation,
+            output_dir=args.output_dir,
+            seed=args.seed,
+            n_workers=args.workers or None,
+        )
+    else:
+        run_sensitivity_analysis(
+            n_samples=args.n_samples,
+            perturbation=args.perturbation,
+            output_dir=args.output_dir,
+            seed=args.seed,
+            n_workers=args.workers or None,
+        )
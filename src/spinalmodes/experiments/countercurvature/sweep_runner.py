@@ -0,0 +1,185 @@
+"""Parallel, resumable parameter sweeps for countercurvature experiments.
+
+Grid points are sharded across a :class:`~concurrent.futures.ProcessPoolExecutor`
+and every finished row is appended to a JSON-lines file as soon as its shard
+returns, so an interrupted sweep only loses the shards that were in flight.
+Re-running with ``resume=True`` skips points already present in the file.
+
+Each row is keyed by its grid point *and* the fixed keyword arguments of the
+sweep, so changing e.g. ``n_nodes`` never reuses stale rows.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+KEY_FIELD = "_sweep_key"
+
+
+def _to_builtin(value: Any) -> Any:
+    """JSON fallback for NumPy scalars (floats round-trip exactly via repr)."""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def grid_points(**axes: Iterable[Any]) -> list[dict[str, Any]]:
+    """Cartesian product of named parameter axes (last axis varies fastest).
+
+    Example
+    -------
+    >>> grid_points(chi_kappa=[0.0, 0.1], gravity=[9.81])
+    [{'chi_kappa': 0.0, 'gravity': 9.81}, {'chi_kappa': 0.1, 'gravity': 9.81}]
+    """
+    names = list(axes)
+    values = [[_to_builtin(v) if hasattr(v, "item") else v for v in axes[name]] for name in names]
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def point_key(point: Mapping[str, Any], fixed: Optional[Mapping[str, Any]] = None) -> str:
+    """Stable identifier of one sweep point under the given fixed arguments."""
+    return json.dumps({**(fixed or {}), **point}, sort_keys=True, default=_to_builtin)
+
+
+def load_completed(results_path: Path | str) -> dict[str, dict[str, Any]]:
+    """Read finished rows from an append-only results file, keyed by point.
+
+    A truncated trailing line (process killed mid-write) is ignored.
+    """
+    path = Path(results_path)
+    done: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return done
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(row, dict) and KEY_FIELD in row:
+                done[row[KEY_FIELD]] = row
+    return done
+
+
+def _evaluate_shard(
+    func: Callable[..., Mapping[str, Any]],
+    fixed: Mapping[str, Any],
+    shard: Sequence[tuple[str, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    return [{KEY_FIELD: key, **point, **func(**fixed, **point)} for key, point in shard]
+
+
+def run_sweep(
+    func: Callable[..., Mapping[str, Any]],
+    points: Sequence[Mapping[str, Any]],
+    results_path: Path | str,
+    *,
+    fixed: Optional[Mapping[str, Any]] = None,
+    n_workers: Optional[int] = 1,
+    shard_size: Optional[int] = None,
+    resume: bool = True,
+    progress_every: int = 0,
+) -> pd.DataFrame:
+    """Evaluate ``func(**fixed, **point)`` for every point and stream rows to disk.
+
+    Parameters
+    ----------
+    func:
+        Module-level (picklable) function returning a mapping of output columns.
+    points:
+        Grid points, e.g. from :func:`grid_points`.
+    results_path:
+        Append-only JSON-lines file that receives one row per finished point.
+    fixed:
+        Keyword arguments shared by all points; part of each row's key.
+    n_workers:
+        Number of worker processes. ``1`` runs in-process, ``None`` uses all cores.
+    shard_size:
+        Points per task sent to a worker. Defaults to a few shards per worker
+        (capped at 64 points) to balance pickling overhead against how much work
+        a crash can lose.
+    resume:
+        Skip points already present in ``results_path``. If False, the file is
+        truncated first.
+    progress_every:
+        Print a progress line every this many finished points (0 disables).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per point, in the order of ``points``: point columns followed by
+        the outputs of ``func``.
+    """
+    fixed = dict(fixed or {})
+    path = Path(results_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not resume and path.exists():
+        path.unlink()
+
+    keyed = [(point_key(point, fixed), dict(point)) for point in points]
+    done = load_completed(path) if resume else {}
+    todo = list({key: point for key, point in keyed if key not in done}.items())
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if shard_size is None:
+        shard_size = min(64, max(1, math.ceil(len(todo) / (4 * n_workers))))
+    shards = [todo[i : i + shard_size] for i in range(0, len(todo), shard_size)]
+
+    if len(todo) < len(keyed) and done:
+        print(f"  Resuming: {len(keyed) - len(todo)}/{len(keyed)} points already done")
+
+    # Terminate a partially written last line so new rows start on a fresh one.
+    if path.exists() and path.stat().st_size > 0:
+        with path.open("rb") as fh:
+            fh.seek(-1, os.SEEK_END)
+            needs_newline = fh.read(1) != b"\n"
+    else:
+        needs_newline = False
+
+    with path.open("a", encoding="utf-8") as fh:
+        if needs_newline:
+            fh.write("\n")
+        finished = 0
+
+        def record(rows: list[dict[str, Any]]) -> None:
+            nonlocal finished
+            for row in rows:
+                fh.write(json.dumps(row, default=_to_builtin) + "\n")
+                done[row[KEY_FIELD]] = row
+            fh.flush()
+            previous, finished = finished, finished + len(rows)
+            if progress_every and finished // progress_every > previous // progress_every:
+                print(f"  Progress: {finished}/{len(todo)} ({100 * finished / max(len(todo), 1):.1f}%)")
+
+        if n_workers == 1 or len(shards) <= 1:
+            for shard in shards:
+                record(_evaluate_shard(func, fixed, shard))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                futures = [pool.submit(_evaluate_shard, func, fixed, shard) for shard in shards]
+                for future in as_completed(futures):
+                    record(future.result())
+
+    import pandas as pd
+
+    df = pd.DataFrame([done[key] for key, _ in keyed])
+    return df.drop(columns=KEY_FIELD, errors="ignore")
+
+
+__all__ = [
+    "KEY_FIELD",
+    "grid_points",
+    "load_completed",
+    "point_key",
+    "run_sweep",
+]
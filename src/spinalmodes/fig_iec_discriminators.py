@@ -17,10 +17,9 @@ import pandas as pd
 from spinalmodes.iec import (
     IECParameters,
     apply_iec_coupling,
-    compute_amplitude,
     compute_helical_threshold,
-    compute_node_positions,
-    solve_beam_static,
+    compute_profile_metrics_batch,
+    solve_beam_static_batch,
 )
 
 
@@ -42,19 +41,20 @@ def generate_fig_iec_discriminators(
     node_drifts = []
     wavelength_changes = []
 
-    for chi_k in chi_kappa_vals:
-        # Baseline
-        params_base = IECParameters(chi_kappa=0.0, I_mode="step", I_center=0.5)
-        s = params_base.get_s_array()
-        kappa_t, E_f, C_f, M_a = apply_iec_coupling(s, params_base)
-        theta_base, _ = solve_beam_static(s, kappa_t, E_f, M_a)
-        nodes_base = compute_node_positions(s, theta_base)
-
-        # With coupling
-        params_iec = IECParameters(chi_kappa=chi_k, I_mode="step", I_center=0.5)
-        kappa_t, E_f, C_f, M_a = apply_iec_coupling(s, params_iec)
-        theta_iec, _ = solve_beam_static(s, kappa_t, E_f, M_a)
-        nodes_iec = compute_node_positions(s, theta_iec)
+    # Baseline (no coupling) followed by every coupled case, solved in one batch
+    params_base = IECParameters(chi_kappa=0.0, I_mode="step", I_center=0.5)
+    s = params_base.get_s_array()
+    fields = [apply_iec_coupling(s, params_base)] + [
+        apply_iec_coupling(s, IECParameters(chi_kappa=chi_k, I_mode="step", I_center=0.5))
+        for chi_k in chi_kappa_vals
+    ]
+    kappa_t, E_f, C_f, M_a = (np.stack(f) for f in zip(*fields))
+    thetas, _ = solve_beam_static_batch(s, kappa_t, E_f, M_a)
+    profile_metrics = compute_profile_metrics_batch(s, thetas)
+    nodes_base = profile_metrics.nodes_of(0)
+
+    for i in range(1, len(fields)):
+        nodes_iec = profile_metrics.nodes_of(i)
 
         # Compute drift
         if len(nodes_base) > 0 and len(nodes_iec) > 0:
@@ -74,15 +74,15 @@ def generate_fig_iec_discriminators(
     ax_b = plt.subplot(1, 3, 2)
 
     chi_E_vals = np.linspace(-0.3, 0.3, 20)
-    amplitudes = []
-
-    for chi_E in chi_E_vals:
-        params = IECParameters(chi_E=chi_E, I_mode="linear", I_gradient=0.5)
-        s = params.get_s_array()
-        kappa_t, E_f, C_f, M_a = apply_iec_coupling(s, params)
-        theta, _ = solve_beam_static(s, kappa_t, E_f, M_a, P_load=100.0)
-        amp = compute_amplitude(theta)
-        amplitudes.append(amp)
+    params = IECParameters(I_mode="linear", I_gradient=0.5)
+    s = params.get_s_array()
+    fields = [
+        apply_iec_coupling(s, IECParameters(chi_E=chi_E, I_mode="linear", I_gradient=0.5))
+        for chi_E in chi_E_vals
+    ]
+    kappa_t, E_f, C_f, M_a = (np.stack(f) for f in zip(*fields))
+    thetas, _ = solve_beam_static_batch(s, kappa_t, E_f, M_a, P_load=100.0)
+    amplitudes = compute_profile_metrics_batch(s, thetas).amplitude_deg
 
     ax_b.plot(chi_E_vals, amplitudes, "s-", color="#A23B72", linewidth=2, markersize=5)
     ax_b.axvline(0, color="gray", linestyle="--", alpha=0.5)
@@ -8,7 +8,7 @@ Implements three coupling mechanisms:
 """
 
 from dataclasses import dataclass
-from typing import Callable, Optional, Tuple
+from typing import Callable, NamedTuple, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -188,13 +188,10 @@ def compute_node_positions(
     theta_abs = np.abs(theta_centered)
 
     # Find local minima below threshold
-    local_min_idx = []
-    for i in range(1, len(theta_abs) - 1):
-        if theta_abs[i] < theta_abs[i - 1] and theta_abs[i] < theta_abs[i + 1]:
-            if theta_abs[i] < threshold * np.max(theta_abs):
-                local_min_idx.append(i)
+    inner = theta_abs[1:-1]
+    is_node = (inner < theta_abs[:-2]) & (inner < theta_abs[2:]) & (inner < threshold * np.max(theta_abs, initial=0.0))
 
-    return s[local_min_idx]
+    return s[1:-1][is_node]
 
 
 def compute_amplitude(theta: NDArray[np.float64]) -> float:
@@ -211,6 +208,82 @@ def compute_amplitude(theta: NDArray[np.float64]) -> float:
     return np.rad2deg(amplitude_rad)
 
 
+class ProfileMetricsBatch(NamedTuple):
+    """Wavelength, amplitude and node positions of stacked angle profiles.
+
+    Nodes are ragged: the nodes of case ``i`` are
+    ``nodes[node_offsets[i]:node_offsets[i + 1]]``.
+    """
+
+    wavelength_mm: NDArray[np.float64]
+    amplitude_deg: NDArray[np.float64]
+    nodes: NDArray[np.float64]
+    node_offsets: NDArray[np.int64]
+
+    @property
+    def num_nodes(self) -> NDArray[np.int64]:
+        """Number of nodes per case."""
+        return np.diff(self.node_offsets)
+
+    def nodes_of(self, case: int) -> NDArray[np.float64]:
+        """Node positions (m) of one case."""
+        return self.nodes[self.node_offsets[case] : self.node_offsets[case + 1]]
+
+
+def compute_profile_metrics_batch(
+    s: NDArray[np.float64], theta: NDArray[np.float64], threshold: float = 0.01
+) -> ProfileMetricsBatch:
+    """
+    Batched :func:`compute_wavelength`, :func:`compute_amplitude` and
+    :func:`compute_node_positions` for ``(n_cases, n_nodes)`` profiles.
+
+    Args:
+        s: Spatial coordinates (m), shape ``(n_nodes,)``
+        theta: Angle profiles, shape ``(n_cases, n_nodes)`` (1-D is one case)
+        threshold: Threshold for node detection
+
+    Returns:
+        ProfileMetricsBatch with per-case wavelength (mm, NaN where it cannot be
+        determined), amplitude (degrees) and ragged node positions (m).
+    """
+    s = np.asarray(s, dtype=float)
+    theta = np.atleast_2d(np.asarray(theta, dtype=float))
+    if theta.shape[-1] != s.size:
+        raise ValueError("theta must have shape (n_cases, n_nodes) matching s")
+    n_cases = theta.shape[0]
+    theta_centered = theta - np.mean(theta, axis=1, keepdims=True)
+
+    # Wavelength: mean spacing of zero crossings telescopes to (last - first) / (count - 1).
+    crossings = np.diff(np.sign(theta_centered), axis=1) != 0
+    count = crossings.sum(axis=1)
+    first = np.argmax(crossings, axis=1)
+    last = crossings.shape[1] - 1 - np.argmax(crossings[:, ::-1], axis=1)
+    wavelength_mm = np.full(n_cases, np.nan)
+    ok = count >= 2
+    wavelength_mm[ok] = 2.0 * (s[last[ok]] - s[first[ok]]) / (count[ok] - 1) * 1000.0
+
+    amplitude_deg = np.rad2deg(np.max(theta, axis=1) - np.min(theta, axis=1))
+
+    # Nodes: interior local minima of |theta| below threshold * max per case.
+    theta_abs = np.abs(theta_centered)
+    inner = theta_abs[:, 1:-1]
+    is_node = (
+        (inner < theta_abs[:, :-2])
+        & (inner < theta_abs[:, 2:])
+        & (inner < threshold * np.max(theta_abs, axis=1, keepdims=True, initial=0.0))
+    )
+    rows, cols = np.nonzero(is_node)
+    node_offsets = np.zeros(n_cases + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_cases), out=node_offsets[1:])
+
+    return ProfileMetricsBatch(
+        wavelength_mm=wavelength_mm,
+        amplitude_deg=amplitude_deg,
+        nodes=s[1:-1][cols],
+        node_offsets=node_offsets,
+    )
+
+
 def compute_torsion_stats(
     tau: NDArray[np.float64],
 ) -> dict:
@@ -325,6 +398,319 @@ def solve_beam_static(
     return theta, kappa
 
 
+def solve_beam_static_batch(
+    s: NDArray[np.float64],
+    kappa_target: NDArray[np.float64],
+    E_field: NDArray[np.float64],
+    M_active: NDArray[np.float64],
+    I_moment: float = 1e-8,
+    P_load: float | NDArray[np.float64] = 100.0,
+    distributed_load: float | NDArray[np.float64] = 0.0,
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Solve many cantilever equilibria on a shared grid in one vectorized pass.
+
+    Batched counterpart of :func:`solve_beam_static`. Field arguments are
+    ``(n_cases, n_nodes)`` arrays; a 1-D ``(n_nodes,)`` field is shared by all
+    cases. ``P_load`` and ``distributed_load`` may be scalars or ``(n_cases,)``
+    arrays. Row ``i`` of the result equals ``solve_beam_static`` called with
+    row ``i`` of every input.
+
+    Args:
+        s: Spatial coordinates (m) spanning [0, L], shape ``(n_nodes,)``.
+        kappa_target: Target curvature profiles (1/m).
+        E_field: Young's modulus profiles (Pa).
+        M_active: Active moment profiles (N·m).
+        I_moment: Second moment of area (m^4).
+        P_load: Tip load(s) applied at s = L (N).
+        distributed_load: Uniform distributed load(s) along the beam (N/m).
+
+    Returns:
+        Tuple ``(theta, kappa)`` of shape ``(n_cases, n_nodes)``.
+    """
+
+    s = np.asarray(s, dtype=float)
+    if s.ndim != 1:
+        raise ValueError("Spatial coordinates must be one-dimensional")
+
+    kappa_target = np.asarray(kappa_target, dtype=float)
+    E_field = np.asarray(E_field, dtype=float)
+    M_active = np.asarray(M_active, dtype=float)
+    P_load = np.asarray(P_load, dtype=float)
+    distributed_load = np.asarray(distributed_load, dtype=float)
+
+    for name, field in (
+        ("kappa_target", kappa_target),
+        ("E_field", E_field),
+        ("M_active", M_active),
+    ):
+        if field.ndim not in (1, 2) or field.shape[-1] != s.size:
+            raise ValueError(f"{name} must have shape (n_nodes,) or (n_cases, n_nodes)")
+    for name, load in (("P_load", P_load), ("distributed_load", distributed_load)):
+        if load.ndim > 1:
+            raise ValueError(f"{name} must be a scalar or a (n_cases,) array")
+
+    n_cases = np.broadcast_shapes(
+        kappa_target.shape[:-1],
+        E_field.shape[:-1],
+        M_active.shape[:-1],
+        P_load.shape,
+        distributed_load.shape,
+        (1,),
+    )[0]
+    shape = (n_cases, s.size)
+
+    if s.size < 2:
+        return np.zeros(shape), np.zeros(shape)
+
+    length = float(s[-1] - s[0])
+    if length <= 0:
+        raise ValueError("Spatial coordinates must span a positive length")
+    ds = np.diff(s)
+    if np.any(ds <= 0):
+        raise ValueError("Spatial coordinates must be strictly increasing")
+
+    EI = np.clip(E_field * I_moment, 1e-9, None)
+
+    # Same loading as the scalar solver, with loads broadcast down the case axis.
+    span_from_tip = length - (s - s[0])
+    external_moment = (
+        np.reshape(P_load, (-1, 1)) * span_from_tip
+        + 0.5 * np.reshape(distributed_load, (-1, 1)) * span_from_tip**2
+    )
+
+    kappa = np.broadcast_to(kappa_target + (external_moment - M_active) / EI, shape).copy()
+
+    theta = np.zeros(shape)
+    np.cumsum(0.5 * (kappa[:, 1:] + kappa[:, :-1]) * ds, axis=1, out=theta[:, 1:])
+
+    return theta, kappa
+
+
+def cumulative_trapezoid_from_base(f: NDArray[np.float64], s: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Trapezoidal integrals of ``f`` over ``[s_0, s_i]`` at every node, along the last axis."""
+
+    out = np.zeros(np.shape(f))
+    np.cumsum(0.5 * np.diff(s) * (f[..., 1:] + f[..., :-1]), axis=-1, out=out[..., 1:])
+    return out
+
+
+def cumulative_trapezoid_to_tip(f: NDArray[np.float64], s: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Trapezoidal integrals of ``f`` over ``[s_i, s_L]`` at every node, along the last axis."""
+
+    from_base = cumulative_trapezoid_from_base(f, s)
+    return from_base[..., -1:] - from_base
+
+
+class ElasticaJacobian:
+    """Banded LU factorization of the elastica Jacobian ``I + A diag(c) B diag(d)``.
+
+    ``A`` and ``B`` are the trapezoidal integrals from the base and to the tip (see
+    :func:`cumulative_trapezoid_from_base`), ``c = 1/EI`` and ``d = V sin θ``.  With
+    ``m = B (d x)`` the system ``J x = r`` is the discrete two-point problem::
+
+        x_{i+1} - x_i + h_i (c_i m_i + c_{i+1} m_{i+1}) = r_{i+1} - r_i,   x_0 = r_0
+        m_i - m_{i+1} - h_i (d_i x_i + d_{i+1} x_{i+1}) = 0,               m_{n-1} = 0
+
+    (``h_i`` half the interval length), which is pentadiagonal in the interleaved
+    unknowns ``(x_0, m_0, x_1, m_1, ...)``.  Factorization and solves cost O(n_nodes)
+    and no ``(n, n)`` matrix is formed.
+
+    Args:
+        s: Spatial coordinates (m), strictly increasing.
+        compliance: ``1/EI`` at the nodes.
+        moment_rate: ``V sin θ`` at the nodes (derivative of the load moment density).
+    """
+
+    def __init__(
+        self,
+        s: NDArray[np.float64],
+        compliance: NDArray[np.float64],
+        moment_rate: NDArray[np.float64],
+    ) -> None:
+        from scipy.linalg.lapack import dgbtrf
+
+        s = np.asarray(s, dtype=float)
+        n = s.size
+        half = 0.5 * np.diff(s)
+        c = np.broadcast_to(np.asarray(compliance, dtype=float), s.shape)
+        d = np.broadcast_to(np.asarray(moment_rate, dtype=float), s.shape)
+
+        # LAPACK band storage with (kl, ku) = (2, 2) plus kl rows of fill-in:
+        # ab[4 + row - col, col] = a[row, col].
+        ab = np.zeros((7, 2 * n))
+        x_col, m_col = 2 * np.arange(n - 1), 2 * np.arange(n - 1) + 1
+        ab[4, 0] = 1.0
+        ab[4, -1] = 1.0
+        # Row 2i + 1 (angle increment over interval i).
+        ab[5, x_col] = -1.0
+        ab[4, m_col] = half * c[:-1]
+        ab[3, x_col + 2] = 1.0
+        ab[2, m_col + 2] = half * c[1:]
+        # Row 2i + 2 (moment increment over interval i).
+        ab[6, x_col] = -half * d[:-1]
+        ab[5, m_col] = 1.0
+        ab[4, x_col + 2] = -half * d[1:]
+        ab[3, m_col + 2] = -1.0
+
+        self.n = n
+        self._lu, self._piv, _ = dgbtrf(ab, 2, 2, overwrite_ab=True)
+
+    def solve(self, rhs: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Solve ``J x = rhs`` for ``rhs`` of shape ``(n,)`` or ``(n, k)``."""
+
+        from scipy.linalg.lapack import dgbtrs
+
+        rhs = np.asarray(rhs, dtype=float)
+        columns = rhs.reshape(self.n, -1)
+        b = np.zeros((2 * self.n, columns.shape[1]))
+        b[0] = columns[0]
+        b[1:-1:2] = np.diff(columns, axis=0)
+        z, _ = dgbtrs(self._lu, 2, 2, b, self._piv, overwrite_b=True)
+        return z[::2].reshape(rhs.shape)
+
+    def det_sign(self) -> float:
+        """Sign of ``det J`` from the LU pivots (0.0 if ``J`` is singular)."""
+
+        swaps = np.count_nonzero(self._piv != np.arange(self._piv.size))
+        # The interleaved two-point system has det (-1)^(n-1) det J.
+        return float(np.prod(np.sign(self._lu[4])) * (-1) ** (swaps + self.n - 1))
+
+
+def solve_beam_elastica(
+    s: NDArray[np.float64],
+    kappa_target: NDArray[np.float64],
+    E_field: NDArray[np.float64],
+    M_active: NDArray[np.float64],
+    I_moment: float = 1e-8,
+    P_load: float | NDArray[np.float64] = 100.0,
+    distributed_load: float | NDArray[np.float64] = 0.0,
+    theta_init: Optional[NDArray[np.float64]] = None,
+    load_steps: int = 1,
+    tol: float = 1e-10,
+    max_iter: int = 30,
+    max_refinements: int = 6,
+) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """
+    Solve the large-deflection (elastica) cantilever with follower lever arms.
+
+    Same loading and sign conventions as :func:`solve_beam_static`, but the tip
+    and distributed loads keep their direction while the beam rotates, so their
+    moment arms are measured along the deformed centerline ``x(s) = ∫ cos θ``::
+
+        EI(s) * (kappa(s) - kappa_target(s)) = M_ext(s) - M_active(s)
+        M_ext(s) = ∫_s^L V(σ) cos θ(σ) dσ,   V(σ) = P + w * (L - σ)
+
+    with ``θ(0) = 0``. The boundary-value problem is discretized with the same
+    trapezoidal rules as the linear solver and solved by Newton's method with
+    the analytic Jacobian, whose linear systems are solved as banded two-point
+    problems in O(n_nodes) per case (see :class:`ElasticaJacobian`). Iterations
+    start from ``theta_init`` or the linear (small-slope) solution; the load is
+    applied in ``load_steps`` increments, and an increment that does not
+    converge is halved up to ``max_refinements`` times. For small loads the
+    result reduces to :func:`solve_beam_static`.
+
+    Field arguments may be ``(n_nodes,)`` or ``(n_cases, n_nodes)`` arrays and
+    loads scalars or ``(n_cases,)`` arrays, as in :func:`solve_beam_static_batch`;
+    all cases are iterated together.
+
+    Args:
+        s: Spatial coordinates (m) spanning [0, L].
+        kappa_target: Target curvature profile (1/m) from IEC-1 coupling.
+        E_field: Spatially varying Young's modulus (Pa) from IEC-2.
+        M_active: Active moment field (N·m) from IEC-3.
+        I_moment: Second moment of area (m^4).
+        P_load: Tip load applied at s = L (N).
+        distributed_load: Uniform distributed load along the beam (N/m).
+        theta_init: Optional warm start for the angle profile (rad), e.g. the
+            solution of a neighbouring parameter point.
+        load_steps: Number of equal load increments (continuation in load).
+        tol: Convergence tolerance on the Newton update (rad).
+        max_iter: Newton iterations per load increment.
+        max_refinements: Maximum number of halvings of a failing increment.
+
+    Returns:
+        Tuple ``(theta, kappa)`` shaped like the broadcast inputs: one profile
+        for 1-D inputs, ``(n_cases, n_nodes)`` otherwise.
+
+    Raises:
+        RuntimeError: If Newton's method fails at the smallest load increment.
+    """
+
+    s = np.asarray(s, dtype=float)
+    if load_steps < 1:
+        raise ValueError("load_steps must be a positive integer")
+    batched = any(np.ndim(a) > 1 for a in (kappa_target, E_field, M_active)) or any(
+        np.ndim(a) > 0 for a in (P_load, distributed_load)
+    )
+
+    # Validates and broadcasts the inputs exactly like the linear solver.
+    theta_lin, _ = solve_beam_static_batch(
+        s, kappa_target, E_field, M_active, I_moment, P_load, distributed_load
+    )
+    shape = theta_lin.shape
+    if s.size < 2:
+        return (theta_lin, theta_lin.copy()) if batched else (theta_lin[0], theta_lin[0].copy())
+
+    kappa_target = np.broadcast_to(np.asarray(kappa_target, dtype=float), shape)
+    M_active = np.broadcast_to(np.asarray(M_active, dtype=float), shape)
+    compliance = 1.0 / np.broadcast_to(np.clip(np.asarray(E_field, dtype=float) * I_moment, 1e-9, None), shape)
+    span_from_tip = (s[-1] - s[0]) - (s - s[0])
+    shear = np.reshape(np.asarray(P_load, dtype=float), (-1, 1)) + np.reshape(
+        np.asarray(distributed_load, dtype=float), (-1, 1)
+    ) * span_from_tip
+    shear = np.broadcast_to(shear, shape)
+
+    def curvature(theta: NDArray[np.float64], scale: float) -> NDArray[np.float64]:
+        external_moment = scale * cumulative_trapezoid_to_tip(np.cos(theta) * shear, s)
+        return kappa_target + (external_moment - M_active) * compliance
+
+    def newton(theta: NDArray[np.float64], scale: float) -> Optional[NDArray[np.float64]]:
+        theta = theta.copy()
+        for _ in range(max_iter):
+            residual = theta - cumulative_trapezoid_from_base(curvature(theta, scale), s)
+            # d(theta - A diag(1/EI) B (V cos theta)) / d theta = I + A diag(1/EI) B diag(V sin theta)
+            moment_rate = scale * shear * np.sin(theta)
+            step = np.stack(
+                [
+                    ElasticaJacobian(s, compliance[k], moment_rate[k]).solve(residual[k])
+                    for k in range(shape[0])
+                ]
+            )
+            theta -= step
+            if not np.all(np.isfinite(theta)):
+                return None
+            if np.max(np.abs(step)) < tol:
+                return theta
+        return None
+
+    increment = 1.0 / load_steps
+    if theta_init is None:
+        # Small-slope solution of the first increment (cos θ = 1).
+        theta = cumulative_trapezoid_from_base(curvature(np.zeros(shape), increment), s)
+    else:
+        theta = np.broadcast_to(np.asarray(theta_init, dtype=float), shape).copy()
+    reached = 0.0
+    refinements = 0
+    while reached < 1.0:
+        target = min(1.0, reached + increment)
+        solved = newton(theta, target)
+        if solved is None:
+            refinements += 1
+            if refinements > max_refinements:
+                raise RuntimeError(
+                    f"Elastica solve did not converge at load fraction {target:.4g}"
+                )
+            increment *= 0.5
+            continue
+        theta, reached = solved, target
+
+    kappa = curvature(theta, 1.0)
+    if batched:
+        return theta, kappa
+    return theta[0], kappa[0]
+
+
 def solve_dynamic_modes(
     s: NDArray[np.float64],
     E_field: NDArray[np.float64],
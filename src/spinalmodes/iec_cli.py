@@ -4,29 +4,37 @@ import json
 from pathlib import Path
 from typing import Optional
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 import typer
 
-matplotlib.use("Agg")  # Non-interactive backend
-
 from spinalmodes.iec import (
     IECParameters,
     apply_iec_coupling,
     compute_amplitude,
     compute_helical_threshold,
     compute_node_positions,
+    compute_profile_metrics_batch,
     compute_torsion_stats,
     compute_wavelength,
     solve_beam_static,
+    solve_beam_static_batch,
     solve_dynamic_modes,
 )
+from spinalmodes.utils.results_store import GridResults
 
 app = typer.Typer(help="IEC model commands")
 
 
+def _pyplot():
+    """Import pyplot on first use; plotting is too slow to import for every command."""
+    import matplotlib
+
+    matplotlib.use("Agg")  # Non-interactive backend
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
 def parse_range_spec(spec: str) -> tuple:
     """Parse range specification 'start:stop:steps' to (start, stop, steps)."""
     parts = spec.split(":")
@@ -42,6 +50,8 @@ def demo(
     I_mode: str = typer.Option("linear", help="Coherence field mode"),
 ):
     """Run IEC demo and print summary statistics."""
+    import pandas as pd
+
     # Create output directory
     out_path = Path(out_prefix)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -122,50 +132,58 @@ def sweep(
     steps: int = typer.Option(..., help="Number of steps"),
     I_mode: str = typer.Option("linear", help="Coherence field mode"),
     out_csv: str = typer.Option("outputs/csv/iec_sweep.csv", help="Output CSV file"),
+    out_npz: Optional[str] = typer.Option(None, help="Also write lossless columnar results (.npz/.parquet)"),
 ):
     """Sweep a single IEC parameter and record outputs."""
     out_path = Path(out_csv)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     param_values = np.linspace(start, stop, steps)
-    results = []
+    results = GridResults(
+        {param: param_values},
+        {
+            "wavelength_mm": np.float64,
+            "amplitude_deg": np.float64,
+            "num_nodes": np.int64,
+            "frequency_hz": np.float64,
+            "damping_ratio": np.float64,
+        },
+    )
 
     typer.echo(f"Sweeping {param} from {start} to {stop} ({steps} steps)...")
 
+    # Apply coupling for every value, then solve all cases in one batched call
+    fields = []
     for val in param_values:
-        # Set up parameters
         params = IECParameters(
             I_mode=I_mode, I_gradient=0.5, length=0.4, n_nodes=100
         )
         setattr(params, param, val)
-
-        # Apply coupling
         s = params.get_s_array()
-        kappa_target, E_field, C_field, M_active = apply_iec_coupling(s, params)
+        fields.append(apply_iec_coupling(s, params))
 
-        # Solve
-        theta, kappa = solve_beam_static(s, kappa_target, E_field, M_active)
-        mode_props = solve_dynamic_modes(s, E_field, C_field)
+    kappa_targets, E_fields, C_fields, M_actives = (np.stack(f) for f in zip(*fields))
+    thetas, _ = solve_beam_static_batch(s, kappa_targets, E_fields, M_actives)
+
+    # Compute metrics for all profiles at once
+    metrics = compute_profile_metrics_batch(s, thetas)
+    results["wavelength_mm"][:] = np.where(metrics.wavelength_mm != 0, metrics.wavelength_mm, np.nan)
+    results["amplitude_deg"][:] = metrics.amplitude_deg
+    results["num_nodes"][:] = metrics.num_nodes
 
-        # Compute metrics
-        wavelength = compute_wavelength(s, theta)
-        amplitude = compute_amplitude(theta)
-        node_pos = compute_node_positions(s, theta)
-
-        results.append(
-            {
-                param: val,
-                "wavelength_mm": wavelength if wavelength else np.nan,
-                "amplitude_deg": amplitude,
-                "num_nodes": len(node_pos),
-                "frequency_hz": mode_props["frequency_hz"],
-                "damping_ratio": mode_props["damping_ratio"],
-            }
+    for i, (E_field, C_field) in enumerate(zip(E_fields, C_fields)):
+        mode_props = solve_dynamic_modes(s, E_field, C_field)
+        results.record(
+            (i,),
+            frequency_hz=mode_props["frequency_hz"],
+            damping_ratio=mode_props["damping_ratio"],
         )
 
-    df = pd.DataFrame(results)
-    df.to_csv(out_csv, index=False)
+    results.to_csv(out_csv)
     typer.echo(f"✅ Saved sweep results to {out_csv}")
+    if out_npz:
+        results.save(out_npz)
+        typer.echo(f"✅ Saved columnar results to {out_npz}")
 
 
 @app.command()
@@ -176,6 +194,10 @@ def phase(
     out_fig: str = typer.Option("outputs/figs/fig_iec_phase.png", help="Output figure"),
 ):
     """Generate phase diagram for IEC parameters."""
+    import pandas as pd
+
+    plt = _pyplot()
+
     # Parse ranges
     db_start, db_stop, db_steps = parse_range_spec(delta_b)
     gi_start, gi_stop, gi_steps = parse_range_spec(gradI)
@@ -265,6 +287,8 @@ def node_drift(
     ),
 ):
     """Demonstrate node drift due to IEC-1 coupling."""
+    plt = _pyplot()
+
     Path(out_fig).parent.mkdir(parents=True, exist_ok=True)
 
     # Baseline (no coupling)
@@ -347,6 +371,8 @@ def helical_threshold(
     ),
 ):
     """Plot helical threshold shift with information gradient."""
+    plt = _pyplot()
+
     Path(out_fig).parent.mkdir(parents=True, exist_ok=True)
 
     # Vary chi_f and compute threshold
@@ -2,6 +2,7 @@
 
 from .euler_bernoulli import integrate_shape_from_curvature, analytic_sinusoid, l2_error
 from .cosserat import available as cosserat_available, simulate_cosserat
+from .eigenmodes import assemble_beam_matrices, beam_eigenmodes
 
 __all__ = [
     "integrate_shape_from_curvature",
@@ -9,5 +10,7 @@ __all__ = [
     "l2_error",
     "cosserat_available",
     "simulate_cosserat",
+    "assemble_beam_matrices",
+    "beam_eigenmodes",
 ]
 
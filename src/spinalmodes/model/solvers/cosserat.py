@@ -2,12 +2,15 @@
 Optional thin bridge to PyElastica for full Cosserat rod simulations.
 
 Import-safe even when PyElastica is absent, enabling CI smoke tests to skip gracefully.
+Without PyElastica, :func:`simulate_cosserat` runs the built-in NumPy rod.
 """
 
 from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 
 def available() -> bool:
     """Return True if PyElastica is importable."""
@@ -21,12 +24,57 @@ def available() -> bool:
 
 def simulate_cosserat(params: dict[str, Any]) -> dict[str, Any]:
     """
-    Placeholder for a minimal rod + gravity + target curvature actuation simulation.
+    Minimal rod + gravity + target curvature actuation simulation.
+
+    Recognised keys (defaults): ``length`` (0.4 m), ``n_elements`` (50), ``E`` (1e6 Pa),
+    ``rho`` (1000 kg/m^3), ``radius`` (0.01 m), ``gravity`` (9.81 m/s^2),
+    ``kappa_target`` (0.0 1/m, scalar or array over the ``n_elements + 1`` nodes),
+    ``final_time`` (1.0 s), ``dt`` (1e-5 s), ``save_every`` (100), ``damping`` (0.5 1/s)
+    and ``backend`` (``"auto"``: PyElastica if installed, else the NumPy rod).
 
     Returns a dict with ok/reason/result keys so callers can handle missing dependencies cleanly.
     """
-    if not available():
-        return {"ok": False, "reason": "PyElastica not installed", "result": None}
-    # TODO: implement minimal rod + gravity + target curvature actuation
-    return {"ok": True, "reason": None, "result": {}}
+    from spinalmodes.countercurvature.coupling import CounterCurvatureParams
+    from spinalmodes.countercurvature.info_fields import InfoField1D
+    from spinalmodes.countercurvature.pyelastica_bridge import CounterCurvatureRodSystem
+
+    length = float(params.get("length", 0.4))
+    n_elements = int(params.get("n_elements", 50))
+    backend = params.get("backend", "auto")
+    s = np.linspace(0.0, length, n_elements + 1)
+    kappa_target = np.broadcast_to(np.asarray(params.get("kappa_target", 0.0), dtype=float), s.shape)
+
+    # Target curvature enters as the baseline rest curvature of an information-free rod.
+    info = InfoField1D(s=s, I=np.zeros_like(s), dIds=np.zeros_like(s))
+    try:
+        system = CounterCurvatureRodSystem.from_iec(
+            info,
+            CounterCurvatureParams(),
+            length,
+            n_elements,
+            E0=float(params.get("E", 1e6)),
+            rho=float(params.get("rho", 1000.0)),
+            radius=float(params.get("radius", 0.01)),
+            kappa_gen=np.array(kappa_target),
+            backend=backend,
+        )
+    except ImportError as exc:
+        return {"ok": False, "reason": str(exc), "result": None}
 
+    result = system.run_simulation(
+        float(params.get("final_time", 1.0)),
+        float(params.get("dt", 1e-5)),
+        save_every=int(params.get("save_every", 100)),
+        gravity=float(params.get("gravity", 9.81)),
+        damping_constant=float(params.get("damping", 0.5)),
+    )
+    return {
+        "ok": True,
+        "reason": None,
+        "result": {
+            "time": result.time,
+            "centerline": result.centerline,
+            "curvature": result.curvature,
+            "backend": "pyelastica" if isinstance(system, CounterCurvatureRodSystem) else "numpy",
+        },
+    }
@@ -0,0 +1,156 @@
+"""Sparse generalized eigensolver for Euler–Bernoulli rods with varying B(s) and ρA(s).
+
+Discretizes ``(B y'')'' = λ ρA y`` in factored form: a square, banded curvature
+operator ``G`` maps free nodal deflections to nodal curvatures, so the stiffness is
+``K = Gᵀ diag(w B) G`` and the (lumped) mass is ``diag(w ρA)`` with trapezoid
+weights ``w``. Shift-invert Lanczos then applies ``K⁻¹ = G⁻¹ diag(w B)⁻¹ G⁻ᵀ`` via
+two banded solves whose condition number grows like n² instead of the n⁴ of the
+assembled fourth-order operator, so 10⁴–10⁵-node rods and per-point spectra along a
+χ_E sweep stay cheap and accurate.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, eigsh, splu
+
+_BOUNDARY_CONDITIONS = ("clamped-free", "pinned-pinned")
+
+
+def _free_nodes(n: int, bc: str) -> np.ndarray:
+    """Indices of nodes whose deflection is unknown under ``bc``."""
+    if bc == "clamped-free":
+        return np.arange(1, n)
+    return np.arange(1, n - 1)
+
+
+def assemble_beam_matrices(
+    s: np.ndarray,
+    B: np.ndarray,
+    rhoA: np.ndarray | None = None,
+    bc: str = "clamped-free",
+) -> tuple[sp.csc_matrix, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Assemble the factored stiffness and lumped mass of the constrained rod.
+
+    Returns
+    -------
+    G, stiffness_weights, mass_diag, free:
+        Square curvature operator ``G`` (free deflections -> curvatures at the nodes
+        that carry bending moment), weights ``w B`` so that ``K = Gᵀ diag(w B) G``,
+        the diagonal of the mass matrix and the indices of the free nodes.
+    """
+    if bc not in _BOUNDARY_CONDITIONS:
+        raise ValueError(f"Unsupported boundary condition: {bc}")
+    s = np.asarray(s, dtype=float)
+    B = np.asarray(B, dtype=float)
+    rhoA = np.ones_like(s) if rhoA is None else np.asarray(rhoA, dtype=float)
+    if not (s.shape == B.shape == rhoA.shape) or s.ndim != 1:
+        raise ValueError("s, B and rhoA must be 1D arrays of the same shape.")
+    if s.size < 4 or np.any(np.diff(s) <= 0.0):
+        raise ValueError("s must be strictly increasing with at least four nodes.")
+    if np.any(B <= 0.0) or np.any(rhoA <= 0.0):
+        raise ValueError("B and rhoA must be positive.")
+
+    n = s.size
+    h = np.diff(s)
+    # Trapezoid (dual-cell) weights of every node.
+    w = np.zeros(n)
+    w[:-1] += 0.5 * h
+    w[1:] += 0.5 * h
+
+    free = _free_nodes(n, bc)
+    col = np.full(n, -1)
+    col[free] = np.arange(free.size)
+
+    # Three-point curvature at interior nodes; moment-free ends drop out.
+    i = np.arange(1, n - 1)
+    hl, hr = h[i - 1], h[i]
+    rows = [i, i, i]
+    cols = [i - 1, i, i + 1]
+    vals = [2.0 / (hl * (hl + hr)), -2.0 / (hl * hr), 2.0 / (hr * (hl + hr))]
+    curv_nodes = i
+    if bc == "clamped-free":
+        # Ghost node y(-h) = y(h) enforces y'(0) = 0, giving y''(0) = 2 y_1 / h_0².
+        rows.append(np.array([0]))
+        cols.append(np.array([1]))
+        vals.append(np.array([2.0 / h[0] ** 2]))
+        curv_nodes = np.arange(0, n - 1)
+
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    vals = np.concatenate(vals)
+    keep = col[cols] >= 0
+    row_of = np.full(n, -1)
+    row_of[curv_nodes] = np.arange(curv_nodes.size)
+    G = sp.csc_matrix(
+        (vals[keep], (row_of[rows[keep]], col[cols[keep]])),
+        shape=(curv_nodes.size, free.size),
+    )
+    return G, w[curv_nodes] * B[curv_nodes], w[free] * rhoA[free], free
+
+
+def beam_eigenmodes(
+    s: np.ndarray,
+    B: np.ndarray,
+    rhoA: np.ndarray | None = None,
+    n_modes: int = 5,
+    bc: str = "clamped-free",
+    sigma: float = 0.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lowest eigenpairs of ``K y = λ M y`` for a rod with stiffness ``B(s)`` and line density ``rhoA(s)``.
+
+    Parameters
+    ----------
+    s:
+        Strictly increasing arc-length nodes (m).
+    B:
+        Bending stiffness at the nodes (N·m²).
+    rhoA:
+        Mass per unit length at the nodes (kg/m); defaults to 1.
+    n_modes:
+        Number of modes to return.
+    bc:
+        ``"clamped-free"`` or ``"pinned-pinned"``.
+    sigma:
+        Shift for shift-invert Lanczos; 0 targets the lowest modes and uses the
+        factored ``K⁻¹``; any other value factorizes ``K - σM`` directly, which
+        loses accuracy on very fine grids.
+
+    Returns
+    -------
+    eigenvalues, modes:
+        ``λ = ω²`` of shape ``(n_modes,)`` in ascending order, and nodal deflection
+        shapes of shape ``(n_nodes, n_modes)``, mass-normalized with the largest
+        entry of each mode positive.
+    """
+    if n_modes < 1:
+        raise ValueError("n_modes must be positive.")
+    G, wB, m, free = assemble_beam_matrices(s, B, rhoA, bc)
+    K = (G.T @ sp.diags(wB) @ G).tocsc()
+    M = sp.diags(m).tocsc()
+
+    if n_modes >= free.size - 1:
+        # eigsh needs k < n; tiny systems are cheaper dense anyway.
+        w, V = scipy.linalg.eigh(K.toarray(), M.toarray())
+    elif sigma == 0.0:
+        lu = splu(G, permc_spec="NATURAL")
+
+        def _apply_k_inverse(x: np.ndarray) -> np.ndarray:
+            return lu.solve(lu.solve(np.ravel(x), trans="T") / wB)
+
+        OPinv = LinearOperator(K.shape, matvec=_apply_k_inverse, dtype=float)
+        w, V = eigsh(K, k=n_modes, M=M, sigma=0.0, which="LM", OPinv=OPinv)
+    else:
+        w, V = eigsh(K, k=n_modes, M=M, sigma=sigma, which="LM")
+    order = np.argsort(w)[:n_modes]
+    w = w[order]
+
+    modes = np.zeros((len(s), w.size))
+    modes[free] = V[:, order]
+    signs = np.sign(modes[np.argmax(np.abs(modes), axis=0), np.arange(w.size)])
+    signs[signs == 0.0] = 1.0
+    return w, modes * signs
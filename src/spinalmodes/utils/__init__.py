@@ -3,6 +3,7 @@
 from .seeds import set_seed
 from .metrics import wavelength_via_fft, phase_shift_via_xcorr, amplitude
 from .provenance import write_provenance
+from .results_store import GridResults
 
 __all__ = [
     "set_seed",
@@ -10,5 +11,6 @@ __all__ = [
     "phase_shift_via_xcorr",
     "amplitude",
     "write_provenance",
+    "GridResults",
 ]
 
@@ -5,17 +5,24 @@ from __future__ import annotations
 import numpy as np
 
 
-def wavelength_via_fft(y: np.ndarray, s: np.ndarray) -> float:
-    """Estimate dominant wavelength via FFT magnitude peak."""
-    dy = y - np.mean(y)
+def wavelength_via_fft(y: np.ndarray, s: np.ndarray) -> float | np.ndarray:
+    """Estimate dominant wavelength via FFT magnitude peak.
+
+    ``y`` may stack profiles along leading axes (``(n_cases, n_nodes)``); the
+    result then has one wavelength per profile.
+    """
+    y = np.asarray(y)
+    dy = y - np.mean(y, axis=-1, keepdims=True)
     freqs = np.fft.rfftfreq(len(s), d=(s[1] - s[0]))
-    amp = np.abs(np.fft.rfft(dy))
     if len(freqs) < 2:
-        return float("inf")
+        return float("inf") if y.ndim == 1 else np.full(y.shape[:-1], np.inf)
+    amp = np.abs(np.fft.rfft(dy, axis=-1))
     # ignore DC
-    idx_peak = np.argmax(amp[1:]) + 1
+    idx_peak = np.argmax(amp[..., 1:], axis=-1) + 1
     k = freqs[idx_peak]
-    return (1.0 / k) if k > 0 else float("inf")
+    with np.errstate(divide="ignore"):
+        wavelength = np.where(k > 0, 1.0 / k, np.inf)
+    return float(wavelength) if y.ndim == 1 else wavelength
 
 
 def phase_shift_via_xcorr(y1: np.ndarray, y2: np.ndarray, s: np.ndarray) -> float:
@@ -0,0 +1,217 @@
+"""Columnar storage for parameter-sweep results.
+
+:class:`GridResults` holds every metric of a sweep in one pre-allocated NumPy
+structured array whose shape is the product of the parameter axes, with the axis
+values kept as coordinates. It persists losslessly (binary float64) as
+
+* ``.npz`` – single uncompressed archive, members are read on access;
+* ``.parquet`` – long-form columnar table (requires ``pyarrow`` or ``fastparquet``);
+* a directory – one ``.npy`` file for the data plus coordinates, which
+  :meth:`GridResults.load` can memory-map.
+
+CSV remains available as an explicit export via :meth:`GridResults.to_csv`.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+_AXES_KEY = "__axes__"
+_DATA_KEY = "__data__"
+_COORD_PREFIX = "coord__"
+
+
+def _fill_value(dtype: np.dtype) -> Any:
+    if np.issubdtype(dtype, np.floating) or np.issubdtype(dtype, np.complexfloating):
+        return np.nan
+    return np.zeros((), dtype=dtype).item()
+
+
+class GridResults:
+    """Per-metric arrays over a Cartesian grid of named parameter axes.
+
+    Parameters
+    ----------
+    axes:
+        Ordered mapping ``name -> 1D coordinate values``. The grid shape is
+        ``tuple(len(v) for v in axes.values())`` and the last axis varies fastest
+        in :meth:`to_frame`, matching nested ``for`` loops over the axes.
+    metrics:
+        Mapping ``name -> dtype`` (or a sequence of names, all float64).
+    data:
+        Optional existing structured array of the grid shape (e.g. a memmap).
+
+    Examples
+    --------
+    >>> res = GridResults({"chi_kappa": [0.0, 0.1], "gravity": [9.81]}, ["D_geo"])
+    >>> res.record((1, 0), D_geo=0.5)
+    >>> res["D_geo"].shape
+    (2, 1)
+    """
+
+    def __init__(
+        self,
+        axes: Mapping[str, ArrayLike],
+        metrics: Union[Mapping[str, DTypeLike], Sequence[str]],
+        data: Optional[np.ndarray] = None,
+    ) -> None:
+        self.coords = {name: np.asarray(values) for name, values in axes.items()}
+        if any(c.ndim != 1 for c in self.coords.values()):
+            raise ValueError("Axis coordinates must be 1D.")
+        if not isinstance(metrics, Mapping):
+            metrics = {name: np.float64 for name in metrics}
+        overlap = set(metrics) & set(self.coords)
+        if overlap:
+            raise ValueError(f"Metric names clash with axis names: {sorted(overlap)}")
+        dtype = np.dtype([(name, np.dtype(dt)) for name, dt in metrics.items()])
+
+        if data is None:
+            data = np.empty(self.shape, dtype=dtype)
+            for name in dtype.names:
+                data[name] = _fill_value(dtype[name])
+        elif data.shape != self.shape or data.dtype != dtype:
+            raise ValueError(
+                f"data has shape {data.shape} / dtype {data.dtype}, expected {self.shape} / {dtype}"
+            )
+        self.data = data
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+    @property
+    def axes(self) -> list[str]:
+        return list(self.coords)
+
+    @property
+    def metrics(self) -> list[str]:
+        return list(self.data.dtype.names)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(c.size for c in self.coords.values())
+
+    def __getitem__(self, metric: str) -> np.ndarray:
+        """Array of one metric over the grid (a view, not a copy)."""
+        return self.data[metric]
+
+    def record(self, index: tuple[int, ...], **values: Any) -> None:
+        """Store metric values for the grid cell at integer ``index``."""
+        for name, value in values.items():
+            self.data[name][index] = value
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        axes: Union[Sequence[str], Mapping[str, ArrayLike]],
+        metrics: Optional[Sequence[str]] = None,
+    ) -> "GridResults":
+        """Scatter a long-form table (one row per grid point) into grid arrays.
+
+        ``axes`` is either a list of column names (coordinates are the sorted
+        unique values) or an explicit ``name -> coordinates`` mapping. Grid points
+        missing from ``df`` keep the fill value (NaN for floats).
+        """
+        if not isinstance(axes, Mapping):
+            axes = {name: np.unique(df[name].to_numpy()) for name in axes}
+        if metrics is None:
+            metrics = [c for c in df.columns if c not in axes]
+        res = cls(axes, {m: df[m].to_numpy().dtype for m in metrics})
+
+        index = []
+        for name, coords in res.coords.items():
+            values = df[name].to_numpy()
+            order = np.argsort(coords, kind="stable")
+            pos = np.searchsorted(coords, values, sorter=order)
+            pos = order[np.clip(pos, 0, coords.size - 1)]
+            if not np.array_equal(coords[pos], values):
+                raise ValueError(f"Column {name!r} has values outside the axis coordinates.")
+            index.append(pos)
+        for m in metrics:
+            res.data[m][tuple(index)] = df[m].to_numpy()
+        return res
+
+    def to_frame(self) -> pd.DataFrame:
+        """Long-form table: one row per grid point, axis columns first."""
+        import pandas as pd
+
+        grids = np.meshgrid(*self.coords.values(), indexing="ij")
+        columns = {name: g.ravel() for name, g in zip(self.axes, grids)}
+        columns.update({m: np.asarray(self.data[m]).ravel() for m in self.metrics})
+        return pd.DataFrame(columns)
+
+    def to_csv(self, path: Union[str, Path]) -> Path:
+        """Optional text export (same layout as :meth:`to_frame`)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.to_frame().to_csv(path, index=False)
+        return path
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write to ``.npz``, ``.parquet`` or (any other path) a directory store."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".npz":
+            arrays = {f"{_COORD_PREFIX}{name}": c for name, c in self.coords.items()}
+            np.savez(path, **arrays, **{_AXES_KEY: np.array(self.axes), _DATA_KEY: self.data})
+        elif path.suffix == ".parquet":
+            df = self.to_frame()
+            df.attrs["axes"] = self.axes
+            df.to_parquet(path, index=False)
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            np.save(path / "data.npy", np.asarray(self.data))
+            for name, c in self.coords.items():
+                np.save(path / f"{_COORD_PREFIX}{name}.npy", c)
+            (path / "axes.json").write_text(json.dumps(self.axes))
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        mmap_mode: Optional[str] = None,
+        axes: Optional[Sequence[str]] = None,
+    ) -> "GridResults":
+        """Read results written by :meth:`save`.
+
+        ``mmap_mode`` (e.g. ``"r"``) memory-maps the data of a directory store;
+        ``axes`` is only needed for Parquet files written by other tools.
+        """
+        path = Path(path)
+        if path.suffix == ".npz":
+            with np.load(path) as npz:
+                names = [str(n) for n in npz[_AXES_KEY]]
+                coords = {n: npz[f"{_COORD_PREFIX}{n}"] for n in names}
+                data = npz[_DATA_KEY]
+        elif path.suffix == ".parquet":
+            import pandas as pd
+
+            df = pd.read_parquet(path)
+            names = list(axes or df.attrs.get("axes", []))
+            if not names:
+                raise ValueError(f"Cannot infer axis columns of {path}; pass axes=...")
+            return cls.from_frame(df, names)
+        else:
+            names = json.loads((path / "axes.json").read_text())
+            coords = {n: np.load(path / f"{_COORD_PREFIX}{n}.npy") for n in names}
+            data = np.load(path / "data.npy", mmap_mode=mmap_mode)
+        metrics = {m: data.dtype[m] for m in data.dtype.names}
+        return cls(coords, metrics, data=data)
+
+
+__all__ = ["GridResults"]
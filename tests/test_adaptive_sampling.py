@@ -0,0 +1,61 @@
+import sys
+
+import numpy as np
+import pytest
+
+from spinalmodes.experiments.countercurvature import experiment_phase_diagram as epd
+from spinalmodes.experiments.countercurvature.adaptive_sampling import fill_grid, quadtree_sample
+
+
+def _circle_rows(n):
+    x = np.linspace(-1.0, 1.0, n)
+    calls = []
+
+    def evaluate(indices):
+        calls.extend(indices)
+        return [{"r": float(np.hypot(x[i], x[j])), "inside": bool(np.hypot(x[i], x[j]) < 0.6)} for i, j in indices]
+
+    return x, calls, evaluate
+
+
+def test_quadtree_resolves_boundary_with_few_evaluations():
+    n = 129
+    x, calls, evaluate = _circle_rows(n)
+    rows, leaves = quadtree_sample(evaluate, (n, n), lambda row: row["inside"], coarse_stride=16)
+
+    assert len(calls) == len(set(calls)) == len(rows)
+    assert len(rows) < 0.25 * n * n
+
+    grid = fill_grid(rows, leaves, {"x": x, "y": x}, ["r", "inside"])
+    X, Y = np.meshgrid(x, x, indexing="ij")
+    np.testing.assert_array_equal(grid["inside"], np.hypot(X, Y) < 0.6)
+    # Evaluated points keep their exact values; interpolation elsewhere stays close.
+    evaluated = grid["evaluated"]
+    np.testing.assert_array_equal(grid["r"][evaluated], np.hypot(X, Y)[evaluated])
+    assert np.max(np.abs(grid["r"] - np.hypot(X, Y))) < 0.1
+
+
+def test_uniform_label_only_evaluates_coarse_grid():
+    n = 33
+    x, calls, evaluate = _circle_rows(n)
+    rows, leaves = quadtree_sample(evaluate, (n, n), lambda row: True, coarse_stride=8)
+    assert len(rows) == 5 * 5
+    assert len(leaves) == 4 * 4
+
+
+def test_phase_diagram_rejects_incompatible_adaptive_resolution(tmp_path, monkeypatch, capsys):
+    epd.check_adaptive_resolution(512, 16)
+    epd.check_adaptive_resolution(96, 12)
+    with pytest.raises(ValueError, match="try resolution=128"):
+        epd.run_phase_diagram_experiment(output_dir=str(tmp_path), adaptive=True, resolution=100)
+    with pytest.raises(ValueError, match="coarse_resolution <= resolution"):
+        epd.check_adaptive_resolution(8, 16)
+    assert not any(tmp_path.iterdir())
+
+    monkeypatch.setattr(sys, "argv", ["experiment_phase_diagram", "--adaptive", "--resolution", "100"])
+    with pytest.raises(SystemExit):
+        epd.parse_args()
+    assert "power of two" in capsys.readouterr().err
+    monkeypatch.setattr(sys, "argv", ["x", "--adaptive", "--resolution", "96", "--coarse-resolution", "12"])
+    args = epd.parse_args()
+    assert (args.resolution, args.coarse_resolution) == (96, 12)
@@ -0,0 +1,212 @@
+"""Tests for the streaming AlphaFold structure analysis in alphafold_analysis/."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("Bio")
+pytest.importorskip("matplotlib")
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "alphafold_analysis"))
+
+import analyze_bcc_structures as abs_  # noqa: E402
+
+RESIDUES = ["MET", "ALA", "GLY", "LEU", "LYS", "GLU", "SER", "VAL", "ILE", "THR", "ASP", "PHE"]
+
+
+def _atom(record, serial, name, resname, resseq, xyz, b, altloc=" ", chain="A"):
+    x, y, z = xyz
+    return (
+        f"{record:<6}{serial:>5} {name:<4}{altloc}{resname:>3} {chain}{resseq:>4}    "
+        f"{x:8.3f}{y:8.3f}{z:8.3f}{1.0:6.2f}{b:6.2f}           {name.strip()[0]}"
+    )
+
+
+def _helix(n, shift=0.0):
+    t = np.arange(n)
+    return np.column_stack([2.3 * np.cos(1.75 * t), 2.3 * np.sin(1.75 * t), 1.5 * t + shift])
+
+
+def _pdb_text(n=12, hetatm=True, altloc=True, second_model=True):
+    coords = _helix(n)
+    lines = ["MODEL        1"]
+    serial = 1
+    for i, (resname, xyz) in enumerate(zip(RESIDUES[:n], coords), start=1):
+        lines.append(_atom("ATOM", serial, " N", resname, i, xyz - 1.0, 80.0 + i))
+        lines.append(_atom("ATOM", serial + 1, " CA", resname, i, xyz, 80.0 + i, altloc="A" if altloc and i == 3 else " "))
+        serial += 2
+        if altloc and i == 3:
+            lines.append(_atom("ATOM", serial, " CA", resname, i, xyz + 5.0, 10.0, altloc="B"))
+            serial += 1
+    if hetatm:
+        # Selenomethionine: a CA that enters the trace but not the sequence.
+        lines.append(_atom("HETATM", serial, " CA", "MSE", n + 1, coords[-1] + 3.8, 55.0))
+    lines.append("ENDMDL")
+    if second_model:
+        lines.append("MODEL        2")
+        for i, xyz in enumerate(_helix(n, shift=50.0), start=1):
+            lines.append(_atom("ATOM", 1000 + i, " CA", RESIDUES[i - 1], i, xyz, 1.0))
+        lines.append("ENDMDL")
+    lines.append("END")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture()
+def pdb_file(tmp_path):
+    path = tmp_path / "AF-P12345-F1-model_v4.pdb"
+    path.write_text(_pdb_text())
+    return path
+
+
+def test_read_ca_trace_fixture(pdb_file, tmp_path):
+    trace, problem = abs_.read_ca_trace(pdb_file)
+    assert problem is None
+    coords = _helix(12)
+
+    # 12 standard residues plus the HETATM CA; altloc B and model 2 are dropped.
+    assert trace.ca_coords.shape == (13, 3)
+    np.testing.assert_allclose(trace.ca_coords[:12], np.round(coords, 3))
+    np.testing.assert_allclose(trace.ca_coords[12], np.round(coords[-1] + 3.8, 3))
+    np.testing.assert_allclose(trace.plddt, list(80.0 + np.arange(1, 13)) + [55.0])
+    assert trace.sequence == "MAGLKESVITDF"
+
+    error_page = tmp_path / "error.pdb"
+    error_page.write_text('<?xml version="1.0" encoding="UTF-8"?><Error><Code>NoSuchKey</Code></Error>')
+    assert abs_.read_ca_trace(error_page) == (None, "is an error response, not a valid PDB")
+
+    no_atoms = tmp_path / "header.pdb"
+    no_atoms.write_text("HEADER    TEST\n" + "REMARK   1\n" * 20)
+    trace, problem = abs_.read_ca_trace(no_atoms)
+    assert trace is None and "ATOM" in problem
+
+
+def test_resume_skips_finished_names_after_truncated_line(tmp_path, monkeypatch):
+    pdb_dir = tmp_path / "predictions"
+    pdb_dir.mkdir()
+    for name in ("alpha", "beta"):
+        (pdb_dir / f"{name}.pdb").write_text(_pdb_text(second_model=False))
+    jsonl = tmp_path / "out.jsonl"
+    # One finished row, then a row cut off mid-write (no trailing newline).
+    jsonl.write_text(json.dumps({"name": "alpha", "length": 12}) + "\n" + '{"name": "beta", "len')
+    assert set(abs_.load_jsonl_results(jsonl)) == {"alpha"}
+
+    analyzed = []
+    real = abs_.analyze_structures
+
+    def recording(pdb_files, **kwargs):
+        analyzed.extend(p.stem for p in pdb_files)
+        return real(pdb_files, **kwargs)
+
+    reported = []
+    monkeypatch.setattr(abs_, "analyze_structures", recording)
+    monkeypatch.setattr(abs_, "generate_comprehensive_report", lambda results, *a, **k: reported.extend(results))
+    monkeypatch.setattr(abs_, "plot_correlations", lambda *a, **k: None)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "analyze_bcc_structures.py",
+            "--pdb-dir", str(pdb_dir),
+            "--output", str(tmp_path / "report.md"),
+            "--json-output", str(tmp_path / "out.json"),
+            "--jsonl-output", str(jsonl),
+            "--resume",
+        ],
+    )
+    abs_.main()
+
+    assert analyzed == ["beta"]
+    lines = jsonl.read_text().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[2])["name"] == "beta"
+    done = abs_.load_jsonl_results(jsonl)
+    assert set(done) == {"alpha", "beta"} and done["beta"]["length"] == 12
+    assert [r["name"] for r in reported] == ["alpha", "beta"]
+
+
+def _curvature_loop(coords, window=7, mask=None):
+    """Per-window reference: 1 / mean distance to the window centroid."""
+    if mask is None:
+        mask = np.ones(len(coords), dtype=bool)
+    curvatures = []
+    for i in range(window, len(coords) - window):
+        if not mask[i - window:i + window + 1].all():
+            continue
+        window_coords = coords[i - window:i + window + 1]
+        mean_dist = np.mean(np.linalg.norm(window_coords - np.mean(window_coords, axis=0), axis=1))
+        curvatures.append(1.0 / mean_dist if mean_dist > 1e-6 else 0.0)
+    curvatures = np.array(curvatures)
+    if len(curvatures) == 0:
+        return curvatures, 0.0, 0.0
+    return curvatures, np.mean(curvatures), np.std(curvatures)
+
+
+def _flexibility_loop(coords):
+    if len(coords) < 3:
+        return {"mean_bend": 0.0, "max_bend": 0.0, "flexibility_index": 0.0}
+    vectors = np.diff(coords, axis=0)
+    norms = np.linalg.norm(vectors, axis=1)
+    norms[norms == 0] = 1e-6
+    unit = vectors / norms[:, np.newaxis]
+    angles = np.array(
+        [np.arccos(np.clip(np.dot(unit[i], unit[i + 1]), -1, 1)) for i in range(len(unit) - 1)]
+    )
+    return {
+        "mean_bend": np.mean(angles),
+        "max_bend": np.max(angles),
+        "flexibility_index": np.std(angles) / (np.mean(angles) + 1e-6),
+    }
+
+
+@pytest.fixture()
+def traces():
+    rng = np.random.default_rng(0)
+    long_a = _helix(40) + 0.2 * rng.normal(size=(40, 3))
+    long_b = _helix(25, shift=7.0) + 0.2 * rng.normal(size=(25, 3))
+    repeated = np.repeat(_helix(9), 2, axis=0)  # zero-length segments
+    # Lengths 0, 2 and 10 are shorter than one 15-residue window; 15 is exactly one.
+    return [long_a, np.empty((0, 3)), _helix(2), long_b, _helix(10), _helix(15), repeated]
+
+
+def test_curvature_batch_matches_single_calls_and_reference_loop(traces):
+    rng = np.random.default_rng(1)
+    masks = [rng.random(len(c)) > 0.05 for c in traces]
+    masks[0][:] = True
+    masks[3][12] = False  # knocks out every window covering residue 12
+
+    for window in (2, 7):
+        for batch_masks in (None, masks):
+            batch = abs_.calculate_backbone_curvature_batch(traces, window=window, masks=batch_masks)
+            assert len(batch) == len(traces)
+            for k, coords in enumerate(traces):
+                mask = None if batch_masks is None else batch_masks[k]
+                single = abs_.calculate_backbone_curvature(coords, window=window, mask=mask)
+                expected = _curvature_loop(coords, window=window, mask=mask)
+                for got in (batch[k], single):
+                    np.testing.assert_array_equal(got[0], expected[0])
+                    assert got[1:] == expected[1:]
+
+    # Windows never straddle two proteins: each trace sees only its own windows.
+    curv, _, _ = abs_.calculate_backbone_curvature_batch(traces, window=7)[5]
+    assert len(curv) == 1
+
+    with pytest.raises(ValueError):
+        abs_.calculate_backbone_curvature_batch(traces, masks=masks[:2])
+    with pytest.raises(ValueError):
+        abs_.calculate_backbone_curvature(traces[0], mask=np.ones(3, dtype=bool))
+
+
+def test_flexibility_batch_matches_single_calls_and_reference_loop(traces):
+    batch = abs_.calculate_flexibility_batch(traces)
+    for k, coords in enumerate(traces):
+        expected = _flexibility_loop(coords)
+        assert batch[k] == expected
+        assert abs_.calculate_flexibility(coords) == expected
+
+    # Only short traces: no bend angles anywhere.
+    assert abs_.calculate_flexibility_batch([np.empty((0, 3)), _helix(2)]) == [
+        {"mean_bend": 0.0, "max_bend": 0.0, "flexibility_index": 0.0}
+    ] * 2
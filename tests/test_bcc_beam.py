@@ -0,0 +1,130 @@
+"""Tests for the countercurvature/scripts beam surrogate (banded solver and its cache)."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "countercurvature"))
+
+from scripts._iec_beam import DEFAULT_BEAM_SOLVER, BeamSolver, solve_equilibrium_beam  # noqa: E402
+
+
+def _problem(n):
+    s = np.linspace(0.0, 1.0, n)
+    B = 1.0 + 0.5 * np.sin(3.0 * s)
+    q = 0.7 + 0.3 * s
+    kappa0 = 0.2 * np.cos(2.0 * s)
+    return s, q, B, kappa0
+
+
+@pytest.mark.parametrize("n,rtol", [(21, 1e-10), (101, 1e-8), (401, 1e-6)])
+def test_banded_matches_dense_on_nonuniform_stiffness(n, rtol):
+    s, q, B, kappa0 = _problem(n)
+    banded = solve_equilibrium_beam(s, q, B, kappa0, method="banded", solver=BeamSolver())
+    dense = solve_equilibrium_beam(s, q, B, kappa0, method="dense")
+
+    for key in ("y", "kappa"):
+        scale = np.abs(dense[key]).max()
+        np.testing.assert_allclose(banded[key], dense[key], rtol=0, atol=rtol * scale)
+    # Clamped end and the free-end curvature condition hold on the banded path too.
+    assert banded["y"][0] == pytest.approx(0.0, abs=1e-14)
+    assert banded["kappa"][-1] == kappa0[-1]
+
+
+def test_banded_handles_very_fine_grids():
+    # 20k nodes: out of reach for the dense O(n^3) path, ~10 ms banded.
+    n = 20001
+    s = np.linspace(0.0, 1.0, n)
+    B, q = 2.0, 1.0
+    res = solve_equilibrium_beam(s, np.full(n, q), np.full(n, B), np.zeros(n), solver=BeamSolver())
+    assert np.all(np.isfinite(res["y"]))
+    # Uniform cantilever under distributed load: tip deflection -q L^4 / (8 B).
+    assert res["y"][-1] == pytest.approx(-q / (8.0 * B), rel=1e-3)
+
+
+def test_unknown_method_raises():
+    s, q, B, kappa0 = _problem(21)
+    with pytest.raises(ValueError):
+        solve_equilibrium_beam(s, q, B, kappa0, method="sparse")
+
+
+def test_repeated_stiffness_reuses_factorization():
+    s, q, B, kappa0 = _problem(51)
+    solver = BeamSolver()
+    first = solver.factor(s, B)
+    solver.solve(s, q, B, kappa0)
+    solver.solve(s, 2.0 * q, B.copy(), np.zeros_like(s))
+    assert solver.factor(s, B) is first
+    assert (solver.hits, solver.misses) == (3, 1)
+    assert len(solver) == 1
+
+
+def test_different_stiffness_or_grid_misses():
+    s, q, B, kappa0 = _problem(51)
+    solver = BeamSolver()
+    solver.factor(s, B)
+    solver.factor(s, 1.01 * B)
+    assert (solver.hits, solver.misses) == (0, 2)
+    assert BeamSolver.key(s, B) != BeamSolver.key(np.linspace(0.0, 2.0, s.size), B)
+
+
+def test_cached_factorization_is_isolated_from_caller_mutation():
+    s, q, B, kappa0 = _problem(51)
+    solver = BeamSolver()
+    expected = solver.solve(s, q, B, kappa0)["y"]
+    fac = solver.factor(s, B)
+    assert not fac.B.flags.writeable and not fac.s.flags.writeable
+
+    B_original = B.copy()
+    B *= 3.0  # in-place edit after caching
+    np.testing.assert_array_equal(fac.B, B_original)
+    again = solver.solve(s, q, B_original, kappa0)["y"]
+    np.testing.assert_array_equal(again, expected)
+    stiffer = solver.solve(s, q, B, kappa0)["y"]
+    dense = solve_equilibrium_beam(s, q, B, kappa0, method="dense")["y"]
+    np.testing.assert_allclose(stiffer, dense, rtol=0, atol=1e-8 * np.abs(dense).max())
+
+
+def test_cache_evicts_least_recently_used():
+    s, _, B, _ = _problem(31)
+    solver = BeamSolver(maxsize=2)
+    f1 = solver.factor(s, B)
+    solver.factor(s, 2.0 * B)
+    solver.factor(s, B)  # refresh B, so 2B is now the oldest
+    solver.factor(s, 3.0 * B)
+    assert len(solver) == 2
+    assert solver.factor(s, B) is f1
+    misses = solver.misses
+    solver.factor(s, 2.0 * B)
+    assert solver.misses == misses + 1
+
+    with pytest.raises(ValueError):
+        BeamSolver(maxsize=0)
+
+
+def test_solve_many_matches_separate_solves():
+    s, q, B, kappa0 = _problem(61)
+    fac = BeamSolver().factor(s, B)
+    qs = np.outer(np.linspace(0.5, 2.0, 5), q)
+    k0s = np.outer(np.linspace(-1.0, 1.0, 5), kappa0)
+    many = fac.solve_many(qs, k0s)
+    for k in range(5):
+        one = solve_equilibrium_beam(s, qs[k], B, k0s[k], solver=BeamSolver())
+        np.testing.assert_allclose(many["y"][k], one["y"], rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(many["kappa"][k], one["kappa"], rtol=1e-12, atol=1e-15)
+    # A shared (n,) rest curvature broadcasts against stacked loads.
+    shared = fac.solve_many(qs, kappa0)
+    np.testing.assert_allclose(shared["y"][2], fac.solve(qs[2], kappa0)["y"], rtol=1e-12)
+
+
+def test_default_solver_is_shared_by_plain_calls():
+    s, q, B, kappa0 = _problem(41)
+    DEFAULT_BEAM_SOLVER.clear()
+    try:
+        solve_equilibrium_beam(s, q, B, kappa0)
+        solve_equilibrium_beam(s, q, B, np.zeros_like(s))
+        assert (DEFAULT_BEAM_SOLVER.hits, DEFAULT_BEAM_SOLVER.misses) == (1, 1)
+    finally:
+        DEFAULT_BEAM_SOLVER.clear()
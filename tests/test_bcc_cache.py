@@ -0,0 +1,111 @@
+"""Tests for the on-disk run_single cache of countercurvature/scripts."""
+
+import os
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("yaml")
+
+ROOT = Path(__file__).resolve().parents[1] / "countercurvature"
+sys.path.insert(0, str(ROOT))
+
+from scripts import _cache  # noqa: E402
+from scripts._cache import ResultCache, cached_run_single, config_key  # noqa: E402
+from scripts._config import load_bcc_config  # noqa: E402
+
+
+@pytest.fixture()
+def cfg(tmp_path):
+    cfg = load_bcc_config(ROOT / "config" / "default.yaml")
+    return replace(cfg, io=replace(cfg.io, results_dir=tmp_path / "results"))
+
+
+def _entry(n_bytes, seed=0):
+    # Incompressible payload so the file size tracks n_bytes.
+    data = np.random.default_rng(seed).integers(0, 256, n_bytes, dtype=np.uint8)
+    return {"row": {"seed": seed}, "fields": {"data": data}}
+
+
+def test_config_key_tracks_overrides_and_solver(cfg, monkeypatch, tmp_path):
+    base = config_key(cfg)
+    assert config_key(cfg, gravity=cfg.simulation.gravity, chi_kappa=cfg.iec.chi_kappa) == base
+    assert config_key(cfg, gravity=cfg.simulation.gravity + 0.5) != base
+    assert config_key(cfg, chi_kappa=cfg.iec.chi_kappa + 0.01) != base
+    # Output-only sections do not enter the key.
+    assert config_key(replace(cfg, figures=replace(cfg.figures, dpi=cfg.figures.dpi + 1))) == base
+
+    monkeypatch.setattr(_cache, "SOLVER_VERSION", _cache.SOLVER_VERSION + 1)
+    assert config_key(cfg) != base
+    monkeypatch.undo()
+
+    edited = tmp_path / "_iec_beam.py"
+    edited.write_bytes(Path(_cache._iec_beam.__file__).read_bytes() + b"\n# edited\n")
+    monkeypatch.setattr(_cache._iec_beam, "__file__", str(edited))
+    assert config_key(cfg) != base
+
+
+def test_get_put_round_trips_fields_and_metrics(cfg, tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    key = config_key(cfg)
+    assert cache.get(key) is None
+
+    fresh = cached_run_single(cfg, cache=cache)
+    hit = cache.get(key)
+    assert hit["row"] == fresh["row"]
+    assert set(hit["fields"]) == set(fresh["fields"])
+    for name, values in fresh["fields"].items():
+        np.testing.assert_array_equal(hit["fields"][name], values)
+    assert cached_run_single(cfg, cache=cache)["row"] == fresh["row"]
+
+    # A corrupt entry is a miss, not an error.
+    cache._path(key).write_bytes(b"not a zip")
+    assert cache.get(key) is None
+
+
+def test_lru_eviction_under_max_bytes(tmp_path):
+    probe = ResultCache(tmp_path / "probe")
+    entry_size = probe.put("aa0", _entry(4000)).stat().st_size
+
+    cache = ResultCache(tmp_path / "cache", max_bytes=int(3.2 * entry_size))
+    for k in range(3):
+        cache.put(f"k{k}", _entry(4000, seed=k))
+        os.utime(cache._path(f"k{k}"), (k, k))
+    assert cache.get("k0") is not None  # now the most recently used
+
+    cache.put("k3", _entry(4000, seed=3))
+    remaining = {p.stem for p, _ in cache.entries()}
+    # Trimmed to the low-water mark: the two least recently used entries go.
+    assert remaining == {"k0", "k3"}
+    assert cache.size() <= cache.max_bytes
+
+
+def test_put_does_not_rescan_below_the_cap(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path / "cache", max_bytes=10**9)
+    scans = []
+    entries = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: scans.append(1) or entries())
+    for k in range(20):
+        cache.put(f"k{k:02d}", _entry(200, seed=k))
+    assert len(scans) == 1
+    assert cache._size == sum(st.st_size for _, st in entries())
+
+
+def test_no_cache_flag_skips_the_cache(cfg, monkeypatch):
+    pytest.importorskip("pandas")
+    from scripts import sim_single
+
+    monkeypatch.setattr(sim_single, "load_bcc_config", lambda path: cfg)
+    cache_dir = cfg.io.results_dir / ".cache"
+
+    monkeypatch.setattr(sys, "argv", ["sim_single", "--no-cache", "--tag", "nocache"])
+    sim_single.main()
+    assert (cfg.io.results_dir / "sim_single_nocache.json").exists()
+    assert not cache_dir.exists()
+
+    monkeypatch.setattr(sys, "argv", ["sim_single", "--tag", "cached"])
+    sim_single.main()
+    assert len(list(cache_dir.glob("*/*.npz"))) == 1
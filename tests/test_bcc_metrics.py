@@ -0,0 +1,78 @@
+"""Tests for the vectorized countercurvature/scripts shape metrics."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "countercurvature"))
+
+from scripts.metrics import compute_curvature, compute_mode_shape_discriminator  # noqa: E402
+
+
+def _curvature_loop(centerline):
+    """Per-node reference implementation the vectorized version replaced."""
+    diffs = np.diff(centerline, axis=0)
+    segment_lengths = np.linalg.norm(diffs, axis=1)
+    arc_length = np.concatenate([[0.0], np.cumsum(segment_lengths)])
+    tangent = diffs / (segment_lengths[:, np.newaxis] + 1e-12)
+    tangent = np.vstack([tangent[0:1], tangent, tangent[-1:]])
+    curvature = np.zeros(len(arc_length))
+    for i in range(1, len(arc_length) - 1):
+        dT = tangent[i + 1] - tangent[i - 1]
+        ds = arc_length[i + 1] - arc_length[i - 1]
+        curvature[i] = np.linalg.norm(dT) / (ds + 1e-12)
+    return curvature, arc_length
+
+
+def _discriminator_loop(curvature):
+    sign_changes = np.sum(np.abs(np.diff(np.sign(curvature))) > 0)
+    if sign_changes >= 2:
+        return 0.0, 1.0
+    elif sign_changes == 1:
+        return 0.5, 0.5
+    return 1.0, 0.0
+
+
+def _centerlines(n_cases=4, n_points=50):
+    rng = np.random.default_rng(0)
+    s = np.linspace(0.0, 1.0, n_points)
+    out = np.empty((n_cases, n_points, 3))
+    for k in range(n_cases):
+        out[k] = np.column_stack([0.1 * k * np.sin(np.pi * s), s, 0.05 * np.cos(2.0 * s)])
+    return out + 1e-3 * rng.normal(size=out.shape)
+
+
+@pytest.mark.parametrize("n_points", [2, 3, 50])
+def test_curvature_matches_per_node_loop(n_points):
+    centerlines = _centerlines(n_points=n_points)
+    curvature, arc_length = compute_curvature(centerlines)
+    assert curvature.shape == arc_length.shape == (4, n_points)
+    for k, centerline in enumerate(centerlines):
+        expected_curvature, expected_arc = _curvature_loop(centerline)
+        single_curvature, single_arc = compute_curvature(centerline)
+        np.testing.assert_array_equal(single_arc, expected_arc)
+        np.testing.assert_allclose(single_curvature, expected_curvature, rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(curvature[k], single_curvature)
+        np.testing.assert_array_equal(arc_length[k], single_arc)
+
+
+def test_mode_shape_discriminator_matches_per_case_loop():
+    s = np.linspace(0.0, 1.0, 40)
+    # Signed profiles with zero, one and three sign changes.
+    profiles = np.stack([1.0 + s, np.cos(np.pi * s), np.cos(3.0 * np.pi * s)])
+    centerlines = _centerlines(n_cases=3, n_points=40)
+
+    c_score, s_score = compute_mode_shape_discriminator(centerlines, profiles)
+    assert c_score.shape == s_score.shape == (3,)
+    for k in range(3):
+        single = compute_mode_shape_discriminator(centerlines[k], profiles[k])
+        assert isinstance(single[0], float)
+        assert single == _discriminator_loop(profiles[k]) == (c_score[k], s_score[k])
+
+    # Without a precomputed profile the curvature comes from the centerline.
+    batched = compute_mode_shape_discriminator(centerlines)
+    for k, centerline in enumerate(centerlines):
+        expected = _discriminator_loop(_curvature_loop(centerline)[0])
+        assert (batched[0][k], batched[1][k]) == expected
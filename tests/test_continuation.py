@@ -0,0 +1,83 @@
+import numpy as np
+
+from spinalmodes.countercurvature import ElasticaFamily, continue_equilibria
+
+
+def test_folds_of_cubic_are_located_and_passed():
+    def residual(u, lam):
+        return u**3 - u - lam, np.diag(3 * u**2 - 1), -np.ones(1)
+
+    branch = continue_equilibria(residual, np.array([-1.3]), -1.0, 1.0)
+    fold = 2.0 / (3.0 * np.sqrt(3.0))
+    assert branch.completed
+    np.testing.assert_allclose(branch.folds, [fold, -fold], atol=1e-8)
+    assert branch.branch_points.size == 0
+    # The branch ends on the outer sheet, beyond both folds.
+    assert branch.parameter[-1] == 1.0
+    assert branch.states[-1, 0] > 1.0
+
+
+def test_pitchfork_branch_point_on_trivial_branch():
+    def residual(u, lam):
+        return u**3 - lam * u, np.diag(3 * u**2 - lam), -u
+
+    branch = continue_equilibria(residual, np.array([0.0]), -1.0, 1.0)
+    np.testing.assert_allclose(branch.branch_points, [0.0], atol=1e-8)
+    assert branch.folds.size == 0
+
+
+def test_elastica_branch_matches_direct_solves():
+    s = np.linspace(0.0, 1.0, 81)
+    family = ElasticaFamily(
+        s=s,
+        E_field=np.full_like(s, 1e8),
+        kappa_target=np.zeros_like(s),
+        M_active=np.zeros_like(s),
+        d_P_load=1.0,
+    )
+    branch = family.continuation(0.0, 10.0)
+    assert branch.completed and not branch.events
+    for lam, theta in zip(branch.parameter[::3], branch.states[::3]):
+        np.testing.assert_allclose(theta, family.solve(lam)[0], atol=1e-9)
+    # Far fewer Newton solves than a dense grid of direct solves.
+    assert branch.n_newton < 60
+
+
+def test_banded_jacobian_traces_the_same_branch_as_dense():
+    s = np.linspace(0.0, 1.0, 41)
+    family = ElasticaFamily(
+        s=s,
+        E_field=np.full_like(s, 1e8),
+        kappa_target=0.3 * np.sin(np.pi * s),
+        M_active=np.zeros_like(s),
+        distributed_load=2.0,
+        d_P_load=1.0,
+    )
+    eye = np.eye(s.size)
+
+    def dense_residual(theta, lam):
+        F, F_u, F_lam = family.residual(theta, lam)
+        # Dense dF/dtheta recovered from the factorization: J = (J^{-1})^{-1}.
+        return F, np.linalg.inv(F_u.solve(eye)), F_lam
+
+    theta0, _ = family.solve(-2.0)
+    banded = continue_equilibria(family.residual, theta0, -2.0, 8.0)
+    dense = continue_equilibria(dense_residual, theta0, -2.0, 8.0)
+    assert banded.completed and dense.completed
+    np.testing.assert_allclose(banded.parameter, dense.parameter, atol=1e-9)
+    np.testing.assert_allclose(banded.states, dense.states, atol=1e-9)
+
+
+def test_elastica_continuation_on_a_fine_grid():
+    # 5k nodes: dense (n, n) Jacobians would need ~200 MB per Newton step.
+    s = np.linspace(0.0, 1.0, 5001)
+    family = ElasticaFamily(
+        s=s,
+        E_field=np.full_like(s, 1e8),
+        kappa_target=np.zeros_like(s),
+        M_active=np.zeros_like(s),
+        d_P_load=1.0,
+    )
+    branch = family.continuation(0.0, 10.0)
+    assert branch.completed
+    np.testing.assert_allclose(branch.states[-1], family.solve(10.0)[0], atol=1e-8)
@@ -0,0 +1,177 @@
+"""Tests for the pure-NumPy discrete Cosserat rod."""
+
+import numpy as np
+
+from spinalmodes.countercurvature.coupling import CounterCurvatureParams
+from spinalmodes.countercurvature.cosserat_numpy import (
+    CounterCurvatureRodEnsemble,
+    DiscreteCosseratRod,
+    NumpyCounterCurvatureRodSystem,
+    position_verlet_step,
+    relax_to_equilibrium,
+)
+from spinalmodes.countercurvature.info_fields import InfoField1D
+from spinalmodes.countercurvature.pyelastica_bridge import CounterCurvatureRodSystem, SimulationHistory
+from spinalmodes.model.solvers import simulate_cosserat
+
+
+def test_horizontal_cantilever_matches_euler_bernoulli_sag():
+    E, rho, radius, length, n = 1e8, 1000.0, 0.05, 1.0, 10
+    rod = DiscreteCosseratRod.straight_rod(
+        n, np.zeros(3), [1.0, 0.0, 0.0], [0.0, 0.0, 1.0], length, radius, rho, E, E / 3.0
+    )
+    dt = rod.stable_time_step()
+    g = np.array([0.0, 0.0, -9.81])
+    for _ in range(int(0.6 / dt)):
+        position_verlet_step(rod, dt, gravity=g, damping_constant=60.0)
+
+    w = rho * np.pi * radius**2 * 9.81
+    EI = E * np.pi * radius**4 / 4.0
+    sag = w * length**4 / (8.0 * EI)
+    # The clamp drops the root half-element of curvature: O(2/n) stiffening.
+    np.testing.assert_allclose(-rod.position[2, -1], sag * (1.0 - 2.0 / n), rtol=0.03)
+    np.testing.assert_array_equal(rod.position[:, 0], 0.0)
+
+
+def test_rest_curvature_relaxes_to_discrete_arc_without_gravity():
+    length, n, kappa0 = 1.0, 10, 1.0
+    s = np.linspace(0.0, length, n + 1)
+    info = InfoField1D(s=s, I=np.zeros_like(s), dIds=np.zeros_like(s))
+    system = CounterCurvatureRodSystem.from_iec(
+        info,
+        CounterCurvatureParams(),
+        length,
+        n,
+        E0=1e8,
+        radius=0.05,
+        kappa_gen=np.full_like(s, kappa0),
+        backend="numpy",
+    )
+    assert isinstance(system, NumpyCounterCurvatureRodSystem)
+    dt = system.rod.stable_time_step()
+    result = system.run_simulation(0.5, dt, save_every=200, gravity=0.0, damping_constant=60.0)
+
+    assert result.centerline.shape == (result.time.size, n + 1, 3)
+    np.testing.assert_allclose(result.curvature[-1, 1:-1], kappa0, rtol=1e-3)
+    # Straight elements turning by kappa0 * l0 at each interior node, bending towards the normal (+y).
+    angles = kappa0 * length / n * np.arange(n)
+    tip = length / n * np.array([0.0, np.sin(angles).sum(), np.cos(angles).sum()])
+    np.testing.assert_allclose(result.centerline[-1, -1], tip, atol=1e-4)
+
+
+def test_simulate_cosserat_runs_without_pyelastica():
+    out = simulate_cosserat(
+        {"n_elements": 8, "E": 1e7, "radius": 0.02, "final_time": 0.01, "dt": 1e-5, "backend": "numpy"}
+    )
+    assert out["ok"] and out["result"]["backend"] == "numpy"
+    assert out["result"]["centerline"].shape[1:] == (9, 3)
+
+
+def test_history_memmap_and_ring_buffer_match_in_memory_run(tmp_path):
+    length, n = 0.4, 8
+    s = np.linspace(0.0, length, n + 1)
+    info = InfoField1D.from_array(s, 0.5 + s / length)
+    params = CounterCurvatureParams(chi_kappa=0.5)
+
+    def run(**kwargs):
+        system = NumpyCounterCurvatureRodSystem.from_iec(info, params, length, n, E0=1e7, radius=0.02)
+        return system.run_simulation(0.01, 1e-5, save_every=50, **kwargs)
+
+    full = run()
+    assert full.centerline.shape == (full.time.size, n + 1, 3) and full.time.size > 6
+    assert np.all(full.curvature[:, [0, -1]] == 0.0)
+
+    spilled = run(history_path=tmp_path / "history")
+    np.testing.assert_array_equal(spilled.centerline, full.centerline)
+    np.testing.assert_array_equal(np.load(tmp_path / "history" / "curvature.npy"), full.curvature)
+
+    tail = run(max_frames=6)
+    np.testing.assert_array_equal(tail.time, full.time[-6:])
+    np.testing.assert_array_equal(tail.centerline, full.centerline[-6:])
+
+    history = SimulationHistory(3, n + 1)
+    history.record(0.0, np.zeros((3, n + 1)), np.ones((3, n - 1)))
+    result = history.to_result(info)
+    assert result.time.shape == (1,) and np.shares_memory(result.centerline, history.centerline)
+    np.testing.assert_allclose(result.curvature[0, 1:-1], np.sqrt(3.0))
+
+
+def test_ensemble_matches_independent_rods():
+    length, n = 0.4, 8
+    s = np.linspace(0.0, length, n + 1)
+    info = InfoField1D.from_array(s, 0.5 + s / length)
+    params = [CounterCurvatureParams(chi_kappa=c, chi_E=0.1) for c in (0.0, 0.5, 1.0)]
+    gravity = [9.81, 0.981, 0.0]
+    kwargs = dict(E0=1e7, radius=0.02)
+
+    ensemble = CounterCurvatureRodEnsemble.from_iec(info, params, length, n, **kwargs)
+    dt = ensemble.rod.stable_time_step()
+    result = ensemble.run_simulation(
+        0.02, dt, save_every=50, gravity=gravity, recorders={"tip": lambda rod: rod.position[..., -1]}
+    )
+    assert len(result) == 3
+    assert result.diagnostics["tip"].shape == (3, result.time.size, 3)
+
+    for k, (p, g) in enumerate(zip(params, gravity)):
+        single = NumpyCounterCurvatureRodSystem.from_iec(info, p, length, n, **kwargs)
+        expected = single.run_simulation(0.02, dt, save_every=50, gravity=g)
+        np.testing.assert_allclose(result[k].centerline, expected.centerline, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(result[k].curvature, expected.curvature, rtol=0, atol=1e-9)
+        np.testing.assert_allclose(result.diagnostics["tip"][k], expected.centerline[:, -1], atol=1e-12)
+
+
+def test_relaxation_stops_at_equilibrium_and_adaptive_dt_takes_fewer_steps():
+    def cantilever():
+        return DiscreteCosseratRod.straight_rod(
+            10, np.zeros(3), [1.0, 0.0, 0.0], [0.0, 0.0, 1.0], 1.0, 0.05, 1000.0, 1e8, 1e8 / 3.0
+        )
+
+    g = np.array([0.0, 0.0, -9.81])
+    fixed, adaptive = cantilever(), cantilever()
+    report = relax_to_equilibrium(fixed, gravity=g, damping_constant=60.0, tol=1e-7, ke_tol=1e-8, max_time=5.0)
+    report_adaptive = relax_to_equilibrium(
+        adaptive, gravity=g, damping_constant=60.0, tol=1e-7, ke_tol=1e-8, max_time=5.0, adaptive_dt=True
+    )
+
+    assert report.converged and report.time < 1.0
+    assert report.residual < 1e-7 and report.kinetic_energy < 1e-8
+    assert report_adaptive.converged and report_adaptive.n_steps < report.n_steps
+    assert report_adaptive.dt <= adaptive.stable_time_step(0.9)
+    np.testing.assert_allclose(adaptive.position, fixed.position, atol=1e-6)
+
+    unconverged = relax_to_equilibrium(cantilever(), gravity=g, damping_constant=60.0, max_time=0.01)
+    assert not unconverged.converged and np.isclose(unconverged.time, 0.01, rtol=0.05)
+
+    # A window that cannot be stabilised by halving dt gives up at dt_min.
+    runaway = cantilever()
+    runaway.velocity[...] = 1e9
+    runaway.velocity[..., 0] = 0.0
+    start = runaway.position.copy()
+    dt0 = runaway.stable_time_step(0.9)
+    with np.errstate(all="ignore"):
+        stalled = relax_to_equilibrium(
+            runaway, gravity=g, damping_constant=60.0, adaptive_dt=True, dt_min=0.1 * dt0
+        )
+    assert not stalled.converged and stalled.n_steps == 0 and stalled.time == 0.0
+    assert 0.1 * dt0 <= stalled.dt < 0.2 * dt0
+    np.testing.assert_array_equal(runaway.position, start)
+
+
+def test_ensemble_relax_reports_per_rod_residuals():
+    s = np.linspace(0.0, 1.0, 9)
+    info = InfoField1D(s=s, I=np.zeros_like(s), dIds=np.zeros_like(s))
+    ensemble = CounterCurvatureRodEnsemble.from_iec(
+        info,
+        [CounterCurvatureParams()] * 2,
+        1.0,
+        8,
+        E0=1e8,
+        radius=0.05,
+        base_direction=(1.0, 0.0, 0.0),
+        normal=(0.0, 0.0, 1.0),
+    )
+    result, report = ensemble.relax(gravity=[9.81, 0.0], damping_constant=60.0, tol=1e-6, adaptive_dt=True)
+    assert report.converged and report.residual.shape == (2,)
+    assert result.centerline.shape == (2, 1, 9, 3)
+    assert result.centerline[0, -1, -1, 2] < 0.0
+    np.testing.assert_allclose(result.centerline[1, -1, :, 2], 0.0, atol=1e-12)
@@ -10,8 +10,10 @@ from numpy.typing import NDArray
 from spinalmodes.countercurvature.info_fields import InfoField1D
 from spinalmodes.countercurvature.validation_and_metrics import (
     compute_countercurvature_metric,
+    GeodesicDeviation,
     geodesic_curvature_deviation,
     compute_shape_preservation_index,
+    trapezoid_weights,
 )
 
 
@@ -168,6 +170,55 @@ def test_d_geo_scaled_curvature():
     )
 
 
+def _geodesic_reference(s, g_eff, kappa_passive, kappa_info, eps=1e-9):
+    """Independent per-profile evaluation straight from the definition."""
+    D_geo_sq = np.trapz(g_eff * (kappa_info - kappa_passive) ** 2, s)
+    base_energy = np.trapz(g_eff * kappa_passive**2, s)
+    D_geo = np.sqrt(D_geo_sq)
+    return {
+        "D_geo": D_geo,
+        "D_geo_sq": D_geo_sq,
+        "D_geo_norm": D_geo / (np.sqrt(base_energy) + eps),
+        "base_energy": base_energy,
+    }
+
+
+def test_geodesic_deviation_batch_matches_trapezoid_reference():
+    """The precomputed evaluator matches np.trapz of g_eff * dkappa**2, profile by profile."""
+    s = np.sort(np.random.default_rng(0).uniform(0.0, 1.0, 57))
+    np.testing.assert_allclose(trapezoid_weights(s) @ np.cos(s), np.trapz(np.cos(s), s), rtol=1e-12)
+
+    g_eff = np.exp(0.3 * np.sin(3 * s))
+    kappa_passive = 0.1 * np.sin(2 * np.pi * s)
+    kappa_info = kappa_passive + np.outer(np.linspace(0.0, 0.05, 6), np.cos(np.pi * s))
+
+    batch = GeodesicDeviation(s, g_eff, kappa_passive).evaluate(kappa_info)
+    for key in ("D_geo", "D_geo_sq", "D_geo_norm", "base_energy"):
+        expected = [_geodesic_reference(s, g_eff, kappa_passive, k)[key] for k in kappa_info]
+        np.testing.assert_allclose(batch[key], expected, rtol=1e-12, atol=1e-15)
+        single = geodesic_curvature_deviation(s, kappa_passive, kappa_info[3], g_eff)[key]
+        assert single == pytest.approx(expected[3], rel=1e-12, abs=1e-15)
+    assert batch["D_geo"][0] == 0.0
+
+
+def test_geodesic_deviation_pairs_stacked_passive_profiles_by_row():
+    s = np.linspace(0.0, 0.5, 41)
+    g_eff = 1.0 + 0.5 * s
+    kappa_passive = np.outer([0.05, 0.1, 0.2], np.sin(2 * np.pi * s / 0.5))
+    kappa_info = kappa_passive + np.outer([0.01, 0.02, 0.03], np.cos(np.pi * s))
+
+    deviation = GeodesicDeviation(s, g_eff, kappa_passive)
+    paired = deviation.evaluate(kappa_info)
+    # A leading batch axis broadcasts against the stack of passive rows.
+    repeated = deviation.evaluate(np.stack([kappa_info, kappa_passive]))
+    assert paired["D_geo"].shape == (3,) and repeated["D_geo"].shape == (2, 3)
+    for key in ("D_geo", "D_geo_sq", "D_geo_norm", "base_energy"):
+        expected = [_geodesic_reference(s, g_eff, kp, ki)[key] for kp, ki in zip(kappa_passive, kappa_info)]
+        np.testing.assert_allclose(paired[key], expected, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(repeated[key][0], expected, rtol=1e-12, atol=1e-15)
+    np.testing.assert_array_equal(repeated["D_geo"][1], 0.0)
+
+
 def test_d_geo_norm_behavior():
     """Test that D_geo_norm behaves sensibly."""
     length = 1.0
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from spinalmodes.countercurvature import CounterCurvatureParams, CouplingBasis, InfoField1D, make_uniform_grid
+from spinalmodes.countercurvature.coupling import (
+    compute_active_moments,
+    compute_effective_stiffness,
+    compute_rest_curvature,
+)
+
+
+@pytest.fixture()
+def info():
+    s = make_uniform_grid(0.4, 80)
+    return InfoField1D.from_callable(s, lambda x: 0.3 + np.exp(-((x - 0.1) ** 2) / 0.004))
+
+
+@pytest.mark.parametrize("model", ["linear", "exponential"])
+def test_basis_matches_coupling_functions_exactly(info, model):
+    basis = CouplingBasis.from_info(info, scale_length=0.5)
+    kappa_gen = np.sin(info.s)
+    params = CounterCurvatureParams(chi_kappa=0.04, chi_E=0.1, chi_M=0.02, scale_length=0.5)
+    kappa_rest, E_eff, M_info = basis.evaluate(params, 1e9, kappa_gen, model=model)
+    np.testing.assert_array_equal(kappa_rest, compute_rest_curvature(info, params, kappa_gen))
+    np.testing.assert_array_equal(E_eff, compute_effective_stiffness(info, params, 1e9, model=model))
+    np.testing.assert_array_equal(M_info, compute_active_moments(info, params))
+
+
+def test_vector_of_gains_broadcasts_into_buffers(info):
+    basis = CouplingBasis.from_info(info)
+    chi = np.linspace(0.0, 0.08, 17)
+    out = np.empty((chi.size, info.n_points))
+    result = basis.rest_curvature(chi, np.zeros_like(info.s), out=out)
+    assert result is out
+    for k, c in enumerate(chi):
+        params = CounterCurvatureParams(chi_kappa=c)
+        np.testing.assert_array_equal(out[k], compute_rest_curvature(info, params, np.zeros_like(info.s)))
+
+    E = basis.effective_stiffness(chi.reshape(-1, 1), 1e9)
+    assert E.shape == (chi.size, 1, info.n_points)
+    with pytest.raises(ValueError):
+        basis.rest_curvature(0.1, np.zeros(3))
+
+
+def test_evaluate_rejects_mismatched_scale_length(info):
+    basis = CouplingBasis.from_info(info, scale_length=0.5)
+    assert basis.scale_length == 0.5
+    with pytest.raises(ValueError, match="scale_length"):
+        basis.evaluate(CounterCurvatureParams(chi_kappa=0.04, scale_length=1.0), 1e9)
@@ -0,0 +1,221 @@
+"""Tests for the AlphaFold fetcher in alphafold_analysis/ (local mirror and resumable downloads)."""
+
+import gzip
+import hashlib
+import json
+import sys
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "alphafold_analysis"))
+
+import fetch_bcc_structures as fb  # noqa: E402
+
+
+def _pdb_bytes(tag: str, n: int = 30) -> bytes:
+    lines = [f"REMARK   1 {tag}"]
+    for i in range(1, n + 1):
+        lines.append(
+            f"ATOM  {i:>5}  CA  ALA A{i:>4}    {1.5 * i:8.3f}{0.0:8.3f}{0.0:8.3f}  1.00 90.00           C"
+        )
+    lines.append("END")
+    return ("\n".join(lines) + "\n").encode()
+
+
+V3, V4, OTHER = _pdb_bytes("P11111 v3"), _pdb_bytes("P11111 v4"), _pdb_bytes("Q22222 v4")
+
+
+def _write_release(root: Path) -> None:
+    (root / "P1").mkdir(parents=True)
+    (root / "P1" / "AF-P11111-F1-model_v3.pdb").write_bytes(V3)
+    (root / "P1" / "AF-P11111-F1-model_v4.pdb.gz").write_bytes(gzip.compress(V4))
+    (root / "AF-Q22222-F1-model_v4.pdb").write_bytes(OTHER)
+    (root / "README.txt").write_text("not a model")
+
+
+@pytest.fixture(params=["directory", "tarball"])
+def mirror(request, tmp_path):
+    release = tmp_path / "release"
+    _write_release(release)
+    if request.param == "directory":
+        return fb.AlphaFoldMirror(release)
+    archive = tmp_path / "release.tar"
+    with tarfile.open(archive, "w") as tar:
+        tar.add(release, arcname="UP000005640")
+    return fb.AlphaFoldMirror(archive)
+
+
+@pytest.fixture()
+def output_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(fb, "OUTPUT_DIR", tmp_path / "predictions")
+    monkeypatch.setattr(fb, "METADATA_DIR", tmp_path / "metadata")
+    return fb.OUTPUT_DIR, fb.METADATA_DIR
+
+
+def test_mirror_picks_highest_version_and_caches(mirror, output_dirs):
+    output_dir, metadata_dir = output_dirs
+    assert len(mirror) == 2
+    version, name = mirror.lookup("p11111")
+    assert version == 4 and name.endswith("AF-P11111-F1-model_v4.pdb.gz")
+
+    lookups = []
+    lookup = mirror.lookup
+    mirror.lookup = lambda uniprot_id: lookups.append(uniprot_id) or lookup(uniprot_id)
+    protein = {"name": "TEST1", "uniprot": "P11111", "category": "HOX"}
+    result = fb.fetch_protein_structure(protein, mirror=mirror)
+    assert result["status"] == "mirrored" and lookups == ["P11111"]
+
+    output_path = output_dir / "TEST1.pdb"
+    metadata_path = metadata_dir / "TEST1_metadata.json"
+    assert output_path.read_bytes() == V4
+    metadata = json.loads(metadata_path.read_text())
+    assert metadata["model_version"] == 4
+    assert metadata["pdb_sha256"] == hashlib.sha256(V4).hexdigest() and metadata["pdb_size"] == len(V4)
+    assert not list(output_dir.glob("*.part"))
+
+    assert fb.fetch_protein_structure(protein, mirror=mirror)["status"] == "cached"
+
+    # A file that no longer matches its recorded checksum is fetched again.
+    output_path.write_bytes(V4.replace(b"90.00", b"10.00", 1))
+    assert not fb._verified_cache(output_path, metadata_path)
+    assert fb.fetch_protein_structure(protein, mirror=mirror)["status"] == "mirrored"
+    assert output_path.read_bytes() == V4
+
+    missing = {"name": "TEST2", "uniprot": "O99999", "category": "HOX"}
+    assert fb.fetch_protein_structure(missing, mirror=mirror)["status"] == "not_found"
+
+
+def test_non_archive_mirror_is_rejected(tmp_path):
+    path = tmp_path / "release.txt"
+    path.write_text("plain file")
+    with pytest.raises(ValueError):
+        fb.AlphaFoldMirror(path)
+
+
+class _PartialThenRangeHandler(BaseHTTPRequestHandler):
+    """Cuts the first response off half-way, then serves Range requests with 206."""
+
+    protocol_version = "HTTP/1.1"
+    body = V4
+    ranges: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        rng = self.headers.get("Range")
+        type(self).ranges.append((rng, self.headers.get("If-Range")))
+        start = int(rng.split("=")[1].rstrip("-")) if rng else 0
+        chunk = self.body[start:]
+        self.send_response(206 if rng else 200)
+        self.send_header("ETag", '"v4"')
+        self.send_header("Content-Length", str(len(chunk)))
+        if rng:
+            self.send_header("Content-Range", f"bytes {start}-{len(self.body) - 1}/{len(self.body)}")
+        self.end_headers()
+        if rng is None:
+            self.wfile.write(chunk[: len(chunk) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(chunk)
+
+
+@pytest.fixture()
+def server():
+    _PartialThenRangeHandler.ranges = []
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _PartialThenRangeHandler)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}"
+    srv.shutdown()
+    srv.server_close()
+
+
+def test_download_resumes_after_partial_body(server, tmp_path):
+    fetcher = fb.HTTPFetcher(rate=0, retries=3, backoff=0.01, timeout=5.0)
+    output_path = tmp_path / "AF-P11111-F1-model_v4.pdb"
+    digest, size = fetcher.download(f"{server}/files/AF-P11111-F1-model_v4.pdb", output_path)
+
+    half = len(V4) // 2
+    assert _PartialThenRangeHandler.ranges == [(None, None), (f"bytes={half}-", '"v4"')]
+    assert output_path.read_bytes() == V4
+    assert (digest, size) == (hashlib.sha256(V4).hexdigest(), len(V4))
+    assert not output_path.with_name(output_path.name + ".part").exists()
+    assert not output_path.with_name(output_path.name + ".part.json").exists()
+
+
+def test_corrupt_mirror_entry_is_a_failed_download(tmp_path, output_dirs):
+    release = tmp_path / "release"
+    _write_release(release)
+    good = gzip.compress(V4)
+    (release / "P1" / "AF-P11111-F1-model_v4.pdb.gz").write_bytes(good[: len(good) // 2])
+    (release / "AF-R33333-F1-model_v4.pdb.gz").write_bytes(b"not gzip at all" * 10)
+    mirror = fb.AlphaFoldMirror(release)
+
+    for uniprot in ("P11111", "R33333"):
+        protein = {"name": uniprot, "uniprot": uniprot, "category": "HOX"}
+        assert fb.fetch_protein_structure(protein, mirror=mirror)["status"] == "download_failed"
+    assert not list(output_dirs[0].glob("*"))
+    # Intact entries in the same mirror are unaffected.
+    other = {"name": "OTHER", "uniprot": "Q22222", "category": "HOX"}
+    assert fb.fetch_protein_structure(other, mirror=mirror)["status"] == "mirrored"
+
+
+def _redirect_server(routes):
+    """Server answering ``routes[path] = (status, location)`` and serving V4 elsewhere."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        requests = []
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            type(self).requests.append((self.path, self.client_address))
+            if self.path in routes:
+                status, location = routes[self.path]
+                self.send_response(status)
+                self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(V4)))
+            self.end_headers()
+            self.wfile.write(V4)
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, Handler, f"http://127.0.0.1:{srv.server_address[1]}"
+
+
+def test_download_follows_redirects_across_hosts(tmp_path):
+    target, target_handler, target_url = _redirect_server({})
+    source, source_handler, source_url = _redirect_server(
+        {
+            "/old": (301, "/moved"),
+            "/moved": (307, f"{target_url}/files/model.pdb"),
+            "/loop": (302, "/loop"),
+        }
+    )
+    try:
+        fetcher = fb.HTTPFetcher(rate=0, retries=0, timeout=5.0)
+        output_path = tmp_path / "model.pdb"
+        digest, size = fetcher.download(f"{source_url}/old", output_path)
+        assert output_path.read_bytes() == V4 and size == len(V4)
+        assert [p for p, _ in source_handler.requests] == ["/old", "/moved"]
+        assert [p for p, _ in target_handler.requests] == ["/files/model.pdb"]
+
+        with pytest.raises(fb.FetchError, match="redirects"):
+            fetcher.download(f"{source_url}/loop", tmp_path / "loop.pdb")
+        assert [p for p, _ in source_handler.requests].count("/loop") == fb.MAX_REDIRECTS + 1
+    finally:
+        for srv in (source, target):
+            srv.shutdown()
+            srv.server_close()
@@ -11,15 +11,21 @@ import numpy as np
 import pytest
 
 from spinalmodes.iec import (
+    ElasticaJacobian,
     IECParameters,
     apply_iec_coupling,
     compute_amplitude,
     compute_helical_threshold,
     compute_node_positions,
+    compute_profile_metrics_batch,
     compute_torsion_stats,
     compute_wavelength,
+    cumulative_trapezoid_from_base,
+    cumulative_trapezoid_to_tip,
     generate_coherence_field,
+    solve_beam_elastica,
     solve_beam_static,
+    solve_beam_static_batch,
     solve_dynamic_modes,
 )
 
@@ -191,6 +197,144 @@ class TestAmplitudeModulation:
         ), f"Amplitude changed by {amp_change_pct:.1f}% (expected ≥10%)"
 
 
+class TestBatchedSolve:
+    """Test the vectorized beam solver against the scalar one."""
+
+    def test_batch_matches_scalar_solves(self):
+        """Each batch row should equal the corresponding scalar solve."""
+        s = np.linspace(0, 0.4, 80)
+        chi_values = np.linspace(0.0, 0.05, 4)
+        loads = np.array([0.0, 1.0, 5.0, 10.0])
+
+        fields = [
+            apply_iec_coupling(
+                s, IECParameters(chi_kappa=chi, chi_E=0.1, chi_f=0.01, I_mode="gaussian")
+            )
+            for chi in chi_values
+        ]
+        kappa_t, E_f, _, M_a = (np.stack(f) for f in zip(*fields))
+
+        theta_b, kappa_b = solve_beam_static_batch(
+            s, kappa_t, E_f, M_a, P_load=50.0, distributed_load=loads
+        )
+        assert theta_b.shape == (4, 80)
+
+        for i in range(4):
+            theta, kappa = solve_beam_static(
+                s, kappa_t[i], E_f[i], M_a[i], P_load=50.0, distributed_load=loads[i]
+            )
+            assert np.allclose(theta_b[i], theta)
+            assert np.allclose(kappa_b[i], kappa)
+
+    def test_shared_fields_broadcast_over_loads(self):
+        """1-D fields are shared by every case when loads vary."""
+        s = np.linspace(0, 0.4, 50)
+        E_f = np.full_like(s, 1e9)
+        zeros = np.zeros_like(s)
+
+        theta_b, _ = solve_beam_static_batch(s, zeros, E_f, zeros, P_load=[10.0, 20.0])
+        theta_10, _ = solve_beam_static(s, zeros, E_f, zeros, P_load=10.0)
+
+        assert theta_b.shape == (2, 50)
+        assert np.allclose(theta_b[0], theta_10)
+        assert np.allclose(theta_b[1], 2.0 * theta_10)
+
+    def test_mismatched_field_length(self):
+        """Fields must match the grid length."""
+        s = np.linspace(0, 0.4, 50)
+        with pytest.raises(ValueError):
+            solve_beam_static_batch(s, np.zeros((3, 49)), np.ones(50), np.zeros(50))
+
+
+class TestProfileMetricsBatch:
+    """Test batched wavelength/amplitude/node extraction against the scalar helpers."""
+
+    def test_batch_matches_scalar_metrics(self):
+        s = np.linspace(0, 0.4, 120)
+        freqs = np.linspace(5.0, 60.0, 12)
+        thetas = 0.1 * np.sin(freqs[:, None] * s) + 0.01 * s
+        thetas[0] = 0.05  # flat profile: no wavelength, no nodes
+
+        metrics = compute_profile_metrics_batch(s, thetas)
+        assert metrics.node_offsets.shape == (13,)
+        assert np.isnan(metrics.wavelength_mm[0]) and metrics.num_nodes[0] == 0
+        for i, theta in enumerate(thetas):
+            wavelength = compute_wavelength(s, theta)
+            if wavelength is not None:
+                assert metrics.wavelength_mm[i] == pytest.approx(wavelength, rel=1e-12)
+            assert metrics.amplitude_deg[i] == compute_amplitude(theta)
+            np.testing.assert_array_equal(metrics.nodes_of(i), compute_node_positions(s, theta))
+
+
+class TestElasticaSolve:
+    """Test the large-deflection cantilever solver."""
+
+    def test_small_load_matches_linear_solver(self):
+        s = np.linspace(0, 0.4, 60)
+        kappa_t = 0.5 * np.sin(np.pi * s / 0.4)
+        E_f = np.full_like(s, 1e9)
+        M_a = 1e-3 * s
+        theta_lin, kappa_lin = solve_beam_static(s, kappa_t, E_f, M_a, P_load=1e-4)
+        theta, kappa = solve_beam_elastica(s, kappa_t, E_f, M_a, P_load=1e-4)
+        # Moment arms differ from the linear ones only at O(P θ²).
+        np.testing.assert_allclose(theta, theta_lin, atol=1e-7)
+        np.testing.assert_allclose(kappa, kappa_lin, atol=1e-7)
+
+    @pytest.mark.parametrize("alpha, deflection", [(1.0, 0.30172), (10.0, 0.81061)])
+    def test_tip_load_matches_elastica_tables(self, alpha, deflection):
+        """Vertical tip deflection δ/L for P L²/EI = alpha (Bisshopp & Drucker)."""
+        s = np.linspace(0, 1.0, 401)
+        zeros = np.zeros_like(s)
+        theta, _ = solve_beam_elastica(
+            s, zeros, np.full_like(s, 1e8), zeros, I_moment=1e-8, P_load=alpha, load_steps=2
+        )
+        y_tip = np.sum(0.5 * np.diff(s) * (np.sin(theta[1:]) + np.sin(theta[:-1])))
+        assert y_tip == pytest.approx(deflection, abs=1e-4)
+        theta_lin, _ = solve_beam_static(s, zeros, np.full_like(s, 1e8), zeros, I_moment=1e-8, P_load=alpha)
+        assert theta[-1] < theta_lin[-1]
+
+    def test_batch_and_warm_start_agree_with_single_solves(self):
+        s = np.linspace(0, 0.4, 50)
+        zeros = np.zeros_like(s)
+        E_f = np.full_like(s, 1e6)
+        theta_b, _ = solve_beam_elastica(s, zeros, E_f, zeros, P_load=[0.05, 0.1], distributed_load=[0.0, 0.2])
+        theta_1, _ = solve_beam_elastica(s, zeros, E_f, zeros, P_load=0.1, distributed_load=0.2)
+        assert theta_b.shape == (2, 50)
+        np.testing.assert_allclose(theta_b[1], theta_1, atol=1e-10)
+
+        warm, _ = solve_beam_elastica(s, zeros, E_f, zeros, P_load=0.1, distributed_load=0.2, theta_init=theta_b[0])
+        np.testing.assert_allclose(warm, theta_1, atol=1e-10)
+
+    @pytest.mark.parametrize("n", [2, 3, 8, 41])
+    def test_banded_jacobian_matches_dense_operator(self, n):
+        rng = np.random.default_rng(n)
+        s = np.concatenate([[0.0], np.sort(rng.uniform(0.0, 0.4, n - 1))])
+        eye = np.eye(n)
+        for _ in range(4):
+            c, d = rng.uniform(0.5, 2.0, n), 20.0 * rng.normal(size=n)
+            # Row j of J^T is J e_j = e_j + A (c * B (d * e_j)), built from the O(n) integrals.
+            dense = (eye + cumulative_trapezoid_from_base(c * cumulative_trapezoid_to_tip(d * eye, s), s)).T
+            jacobian = ElasticaJacobian(s, c, d)
+            rhs = rng.normal(size=(n, 2))
+            np.testing.assert_allclose(jacobian.solve(rhs), np.linalg.solve(dense, rhs), rtol=1e-10, atol=1e-12)
+            np.testing.assert_allclose(jacobian.solve(rhs[:, 0]), np.linalg.solve(dense, rhs[:, 0]), rtol=1e-10, atol=1e-12)
+            assert jacobian.det_sign() == np.sign(np.linalg.det(dense))
+
+    def test_cumulative_trapezoid_integrals(self):
+        s = np.linspace(0.0, 2.0, 201)
+        from_base = cumulative_trapezoid_from_base(np.cos(s), s)
+        np.testing.assert_allclose(from_base, np.sin(s), atol=1e-4)
+        np.testing.assert_allclose(cumulative_trapezoid_to_tip(np.cos(s), s), from_base[-1] - from_base, atol=1e-14)
+
+    def test_fine_grid_elastica(self):
+        """20k nodes: no (n, n) Jacobian is formed, so memory and time stay linear in n."""
+        s = np.linspace(0, 1.0, 20001)
+        zeros = np.zeros_like(s)
+        theta, _ = solve_beam_elastica(s, zeros, np.full_like(s, 1e8), zeros, I_moment=1e-8, P_load=1.0)
+        y_tip = np.sum(0.5 * np.diff(s) * (np.sin(theta[1:]) + np.sin(theta[:-1])))
+        assert y_tip == pytest.approx(0.30172, abs=1e-4)
+
+
 class TestHelicalThreshold:
     """Test IEC-3 helical threshold reduction (acceptance criterion 3)."""
 
@@ -0,0 +1,46 @@
+"""Cold-import guards: the CLI and sweep workers must not load plotting/dataframe stacks."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("matplotlib", "pandas", "scipy", "elastica")
+
+# Startup budget for spinalmodes' own modules, excluding numpy and typer (seconds).
+OWN_IMPORT_BUDGET = 0.5
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "spinalmodes.cli",
+        "spinalmodes.countercurvature",
+        "spinalmodes.experiments.countercurvature.experiment_phase_diagram",
+        "spinalmodes.experiments.countercurvature.experiment_scoliosis_bifurcation",
+        "spinalmodes.experiments.countercurvature.sensitivity_analysis",
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(module):
+    out = _run(f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))")
+    assert out.stdout.strip() == ""
+
+
+def test_cli_cold_import_time():
+    # -X importtime reports cumulative microseconds per module on stderr.
+    out = _run("import spinalmodes.cli", "-X", "importtime")
+    cumulative = {}
+    for line in out.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            cumulative.setdefault(parts[2].strip(), int(parts[1]))
+    own = cumulative["spinalmodes.cli"] - cumulative.get("numpy", 0) - cumulative.get("typer", 0)
+    assert own / 1e6 < OWN_IMPORT_BUDGET
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from spinalmodes.countercurvature import (
+    CounterCurvatureParams,
+    InfoField1D,
+    InfoFieldTimeSeries,
+    elastica_solver,
+    evolve_quasi_static,
+    make_uniform_grid,
+)
+from spinalmodes.countercurvature.coupling import (
+    compute_active_moments,
+    compute_effective_stiffness,
+    compute_rest_curvature,
+)
+from spinalmodes.iec import solve_beam_static
+
+
+def _series(n_keys=5):
+    s = make_uniform_grid(0.4, 60)
+    times = np.linspace(0.0, 10.0, n_keys)
+    fields = [
+        InfoField1D.from_callable(s, lambda x, t=t: np.exp(-((x - 0.1 - 0.02 * t) ** 2) / 0.005))
+        for t in times
+    ]
+    return InfoFieldTimeSeries(times, fields)
+
+
+def test_linear_interpolation_and_end_hold():
+    series = _series()
+    field = series.interpolate(1.25)
+    np.testing.assert_allclose(field.I, 0.5 * (series.fields[0].I + series.fields[1].I))
+    np.testing.assert_allclose(field.dIds, 0.5 * (series.fields[0].dIds + series.fields[1].dIds))
+    np.testing.assert_array_equal(series.interpolate(-3.0).I, series.fields[0].I)
+    # Cubic splines pass through the keyframes.
+    I, _ = series.sample(series.times, kind="cubic")
+    np.testing.assert_allclose(I, np.stack([f.I for f in series.fields]), atol=1e-12)
+    with pytest.raises(ValueError):
+        series.sample([0.0], kind="quadratic")
+
+
+def test_evolution_matches_per_step_static_solves():
+    series = _series()
+    params = CounterCurvatureParams(chi_kappa=0.04, chi_E=0.1, chi_M=0.01)
+    times = np.linspace(0.0, 10.0, 101)
+    gravity = lambda t: 9.81 * np.exp(-t)
+
+    traj = evolve_quasi_static(series, params, times, gravity=gravity, output_stride=7, chunk_size=4)
+    assert traj.step_index[-1] == 100 and np.all(np.diff(traj.step_index[:-1]) == 7)
+
+    for k, step in enumerate(traj.step_index):
+        info = series.interpolate(times[step])
+        theta, kappa = solve_beam_static(
+            series.s,
+            compute_rest_curvature(info, params, np.zeros_like(series.s)),
+            compute_effective_stiffness(info, params, 1e9),
+            compute_active_moments(info, params),
+            distributed_load=0.1 * gravity(times[step]),
+        )
+        np.testing.assert_allclose(traj.theta[k], theta, rtol=1e-12, atol=1e-15)
+        np.testing.assert_allclose(traj.kappa[k], kappa, rtol=1e-12, atol=1e-15)
+
+
+def test_custom_solver_is_warm_started_every_step():
+    series = _series()
+    params = CounterCurvatureParams(chi_kappa=0.04)
+    times = np.linspace(0.0, 10.0, 25)
+    seen = []
+
+    def solver(s, kappa_rest, E_eff, M_active, load, previous):
+        seen.append(previous is None)
+        return solve_beam_static(s, kappa_rest, E_eff, M_active, distributed_load=load)
+
+    traj = evolve_quasi_static(series, params, times, solver=solver, output_stride=5, chunk_size=10)
+    reference = evolve_quasi_static(series, params, times, output_stride=5)
+    assert seen == [True] + [False] * 24
+    np.testing.assert_allclose(traj.theta, reference.theta, rtol=1e-12, atol=1e-15)
+
+
+def test_elastica_solver_is_warm_started_through_the_programme():
+    series = _series()
+    params = CounterCurvatureParams(chi_kappa=0.05, chi_E=0.1)
+    times = np.linspace(0.0, 10.0, 11)
+    kwargs = dict(E0=1e6, I_moment=1e-8, P_load=0.02, output_stride=5)
+
+    linear = evolve_quasi_static(series, params, times, **kwargs)
+    large = evolve_quasi_static(series, params, times, solver=elastica_solver(I_moment=1e-8, P_load=0.02), **kwargs)
+    assert large.theta.shape == linear.theta.shape
+    # Follower lever arms shorten as the beam sags, so the nonlinear tip angle is smaller.
+    assert np.all(large.theta[:, -1] < linear.theta[:, -1])
+    assert np.all(large.theta[:, -1] > 0.5 * linear.theta[:, -1])
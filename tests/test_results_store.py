@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from spinalmodes.utils import GridResults
+
+
+def _long_frame():
+    chi = np.linspace(0.0, 0.08, 5)
+    g = np.array([9.81, 1.0, 0.01])
+    rows = [
+        {"chi_kappa": c, "gravity": gv, "D_geo": c / 3.0 + gv, "regime": bool(c > 0.04), "n": i}
+        for i, (c, gv) in enumerate((c, gv) for c in chi for gv in g)
+    ]
+    return pd.DataFrame(rows), chi, g
+
+
+def test_from_frame_round_trip_preserves_order_and_dtypes():
+    df, chi, g = _long_frame()
+    res = GridResults.from_frame(df, {"chi_kappa": chi, "gravity": g})
+    assert res.shape == (5, 3)
+    assert res.data.dtype["regime"] == np.bool_
+    assert res["D_geo"][2, 1] == df["D_geo"].iloc[2 * 3 + 1]
+    pd.testing.assert_frame_equal(res.to_frame(), df)
+
+
+def test_missing_points_are_nan_and_unknown_values_rejected():
+    df, chi, g = _long_frame()
+    res = GridResults.from_frame(df.iloc[1:], {"chi_kappa": chi, "gravity": g})
+    assert np.isnan(res["D_geo"][0, 0])
+    with pytest.raises(ValueError):
+        GridResults.from_frame(df, {"chi_kappa": chi[:-1], "gravity": g})
+
+
+@pytest.mark.parametrize("name", ["grid.npz", "grid_store"])
+def test_save_load_is_lossless(tmp_path, name):
+    df, chi, g = _long_frame()
+    res = GridResults.from_frame(df, {"chi_kappa": chi, "gravity": g})
+    res.record((0, 0), D_geo=1.0 / 3.0)
+    path = res.save(tmp_path / name)
+    loaded = GridResults.load(path, mmap_mode="r")
+    assert loaded.axes == ["chi_kappa", "gravity"]
+    np.testing.assert_array_equal(loaded.coords["gravity"], g)
+    assert loaded["D_geo"][0, 0] == 1.0 / 3.0
+    pd.testing.assert_frame_equal(loaded.to_frame(), res.to_frame())
+    if path.is_dir():
+        assert isinstance(loaded.data, np.memmap)
+
+
+def test_csv_export(tmp_path):
+    res = GridResults({"chi_E": [0.0, 0.1]}, ["amplitude"])
+    res.record((1,), amplitude=2.5)
+    out = res.to_csv(tmp_path / "out.csv")
+    df = pd.read_csv(out)
+    assert list(df.columns) == ["chi_E", "amplitude"]
+    assert df["amplitude"].iloc[1] == 2.5
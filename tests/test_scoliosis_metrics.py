@@ -74,3 +74,36 @@ def test_classification_flags_change_with_asymmetry():
     # Both conditions must be true independently
     assert flags_high["scoliotic_regime"] is True, "High D_geo_norm with asymmetry should classify as scoliotic"
     assert flags_high["gravity_dominated"] is False, "High D_geo_norm should not be gravity-dominated"
+
+
+def test_batch_metrics_match_scalar_versions():
+    """Batched metrics and classification agree with the per-case functions."""
+    from spinalmodes.countercurvature.scoliosis_metrics import (
+        classify_scoliotic_regime_batch,
+        compute_scoliosis_metrics_batch,
+    )
+
+    z = np.linspace(0.0, 1.0, 120)
+    offsets = np.linspace(0.0, 0.1, 7)
+    Y = offsets[:, None] * np.sin(2 * np.pi * z) + 0.02 * z**2
+    batch = compute_scoliosis_metrics_batch(z, Y, frac=0.2)
+    assert len(batch) == offsets.size
+
+    for i in range(offsets.size):
+        ref = compute_scoliosis_metrics(z, Y[i], frac=0.2)
+        np.testing.assert_allclose(
+            [batch.S_lat[i], batch.y_tip[i], batch.lat_dev_max[i], batch.cobb_like_deg[i]],
+            [ref.S_lat, ref.y_tip, ref.lat_dev_max, ref.cobb_like_deg],
+            rtol=1e-10,
+            atol=1e-12,
+        )
+
+    thresholds = RegimeThresholds(
+        D_geo_small=0.05, D_geo_large=0.2, S_lat_scoliotic=0.02, cobb_scoliotic_deg=0.5
+    )
+    D = np.linspace(0.0, 0.4, offsets.size)
+    sym = compute_scoliosis_metrics_batch(z, np.zeros_like(Y))
+    flags = classify_scoliotic_regime_batch(D, sym, batch, thresholds)
+    for i in range(offsets.size):
+        ref = classify_scoliotic_regime(D[i], sym[i], batch[i], thresholds)
+        assert {k: bool(v[i]) for k, v in flags.items()} == ref
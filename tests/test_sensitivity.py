@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from spinalmodes.countercurvature import evaluate_design, saltelli_sample, sobol_analysis
+from spinalmodes.experiments.countercurvature.sensitivity_analysis import (
+    BASELINE,
+    BatchedSensitivityModel,
+    run_single_sim,
+)
+
+
+def _ishigami(columns):
+    x1, x2, x3 = columns["x1"], columns["x2"], columns["x3"]
+    return {"y": np.sin(x1) + 7.0 * np.sin(x2) ** 2 + 0.1 * x3**4 * np.sin(x1)}
+
+
+def test_saltelli_design_layout():
+    design = saltelli_sample({"a": (0.0, 1.0), "b": (10.0, 20.0)}, 8, seed=0)
+    A, B, AB = design.blocks(design.samples[:, 0])
+    assert design.n_evaluations == 8 * 4
+    assert np.all((design.samples[:, 1] >= 10.0) & (design.samples[:, 1] <= 20.0))
+    # AB_0 takes column a from B, AB_1 keeps it from A.
+    np.testing.assert_array_equal(AB[0], B)
+    np.testing.assert_array_equal(AB[1], A)
+
+    with pytest.raises(ValueError):
+        saltelli_sample({"a": (0.0, 1.0)}, 10)
+
+
+def test_ishigami_indices_match_analytic_values():
+    bounds = {k: (-np.pi, np.pi) for k in ("x1", "x2", "x3")}
+    indices = sobol_analysis(_ishigami, bounds, 2**13, seed=1, n_bootstrap=200)["y"]
+
+    np.testing.assert_allclose(indices.S1, [0.3139, 0.4424, 0.0], atol=0.03)
+    np.testing.assert_allclose(indices.ST, [0.5576, 0.4424, 0.2437], atol=0.03)
+    assert np.all(indices.S1_ci[:, 0] <= indices.S1) and np.all(indices.S1 <= indices.S1_ci[:, 1])
+
+
+def test_batched_model_matches_single_simulation():
+    bounds = {k: (0.9 * v, 1.1 * v) for k, v in BASELINE.items()}
+    design = saltelli_sample(bounds, 4, seed=0)
+    model = BatchedSensitivityModel(n_nodes=60)
+
+    batched = evaluate_design(model, design, batch_size=7)["D_geo_norm"]
+    expected = [run_single_sim(dict(zip(design.names, row)), n_nodes=60) for row in design.samples]
+    np.testing.assert_allclose(batched, expected, rtol=1e-10)
+
+    parallel = evaluate_design(model, design, batch_size=7, n_workers=2)["D_geo_norm"]
+    np.testing.assert_array_equal(parallel, batched)
@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spinalmodes.experiments.countercurvature.sweep_runner import (
+    KEY_FIELD,
+    grid_points,
+    load_completed,
+    run_sweep,
+)
+
+CALLS = []
+
+
+def _quadratic(a, b, scale=1.0):
+    CALLS.append((a, b))
+    return {"value": scale * (a**2 + b), "positive": bool(a > 0)}
+
+
+def test_grid_points_order_and_builtin_types():
+    points = grid_points(a=np.array([0.0, 1.0]), b=[10, 20])
+    assert points == [
+        {"a": 0.0, "b": 10},
+        {"a": 0.0, "b": 20},
+        {"a": 1.0, "b": 10},
+        {"a": 1.0, "b": 20},
+    ]
+    assert type(points[0]["a"]) is float
+
+
+def test_parallel_matches_serial(tmp_path):
+    points = grid_points(a=np.linspace(-1.0, 1.0, 7), b=[0.5, 2.0])
+    serial = run_sweep(_quadratic, points, tmp_path / "serial.jsonl", fixed={"scale": 3.0})
+    parallel = run_sweep(
+        _quadratic, points, tmp_path / "parallel.jsonl", fixed={"scale": 3.0}, n_workers=2, shard_size=3
+    )
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert list(serial.columns) == ["a", "b", "value", "positive"]
+    np.testing.assert_allclose(serial["value"], 3.0 * (serial["a"] ** 2 + serial["b"]))
+
+
+def test_resume_skips_finished_points_and_truncated_lines(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    points = grid_points(a=[1.0, 2.0, 3.0], b=[0.0])
+    run_sweep(_quadratic, points[:2], path)
+    # Simulate a crash in the middle of writing a row.
+    with path.open("a") as fh:
+        fh.write('{"_sweep_key": "partial')
+
+    CALLS.clear()
+    df = run_sweep(_quadratic, points, path)
+    assert CALLS == [(3.0, 0.0)]
+    assert df["value"].tolist() == [1.0, 4.0, 9.0]
+    assert len(load_completed(path)) == 3
+
+    # Changing a fixed argument invalidates the cached rows.
+    CALLS.clear()
+    run_sweep(_quadratic, points, path, fixed={"scale": 2.0})
+    assert len(CALLS) == 3
+
+
+def test_no_resume_truncates(tmp_path):
+    path = tmp_path / "rows.jsonl"
+    points = grid_points(a=[1.0], b=[0.0, 1.0])
+    run_sweep(_quadratic, points, path)
+    run_sweep(_quadratic, points, path, resume=False)
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(rows) == 2
+    assert all(KEY_FIELD in row for row in rows)
+
+
+def test_script_sweep_resumes_after_truncated_line_without_reading_file(tmp_path, monkeypatch):
+    # countercurvature/ is a standalone project with its own copy of the runner.
+    monkeypatch.syspath_prepend(str(Path(__file__).resolve().parents[1] / "countercurvature"))
+    from scripts._sweep import load_completed as load_script_rows
+    from scripts._sweep import run_sweep as run_script_sweep
+
+    path = tmp_path / "rows.jsonl"
+    points = grid_points(a=[1.0, 2.0, 3.0], b=[0.0])
+    run_script_sweep(_quadratic, points[:2], path)
+    with path.open("a") as fh:
+        fh.write('{"_sweep_key": "partial')
+
+    # Only the last byte is inspected; the results file is never slurped.
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("read_bytes called"))
+    CALLS.clear()
+    df = run_script_sweep(_quadratic, points, path)
+    assert CALLS == [(3.0, 0.0)]
+    assert df["value"].tolist() == [1.0, 4.0, 9.0]
+    assert len(load_script_rows(path)) == 3